@@ -13,10 +13,21 @@ import signal
 import sys
 from typing import Any, Callable, TypeVar
 
-from flip7.types.errors import BotTimeout
+from flip7.types.errors import BotTimeout, SandboxUnsupportedPlatformError
 
 T = TypeVar("T")
 
+# Ways to run the sandbox from Windows, most recommended first
+_WINDOWS_SUGGESTIONS: tuple[str, ...] = (
+    (
+        "Use WSL (Windows Subsystem for Linux) - Recommended\n"
+        "     - Install WSL: https://docs.microsoft.com/en-us/windows/wsl/install\n"
+        "     - Run the tournament from within WSL"
+    ),
+    "Use a Linux virtual machine or Docker container",
+    "Run on a Linux or macOS system",
+)
+
 
 def _timeout_handler(signum: int, frame: Any) -> None:
     """
@@ -51,9 +62,13 @@ def execute_with_sandbox(
     - Cannot be used in multi-threaded programs
     - Uses SIGALRM signal
 
+    A timeout of 0 disables the limit (as it does for setitimer), so the
+    function is called directly without installing the signal handler.
+
     Args:
         bot_name: The name of the bot (for error reporting)
-        timeout_seconds: Maximum time allowed in seconds (supports subsecond precision)
+        timeout_seconds: Maximum time allowed in seconds (supports subsecond precision),
+                         or 0 for no limit
         func: The function to execute
         *args: Arguments to pass to the function
 
@@ -62,22 +77,27 @@ def execute_with_sandbox(
 
     Raises:
         BotTimeout: If the function exceeds the time limit
-        RuntimeError: If running on an unsupported platform (Windows)
+        SandboxUnsupportedPlatformError: If running on an unsupported platform (Windows)
         Any other exception raised by the function
     """
     # Check platform compatibility
     if sys.platform.startswith('win'):
-        raise RuntimeError(
+        solutions = "\n\n".join(
+            f"  {number}. {suggestion}"
+            for number, suggestion in enumerate(_WINDOWS_SUGGESTIONS, start=1)
+        )
+        raise SandboxUnsupportedPlatformError(
             "Bot sandbox execution is not supported on Windows.\n\n"
             "The timeout system uses Unix signal handling (signal.SIGALRM) which is not available on Windows.\n\n"
-            "Solutions:\n"
-            "  1. Use WSL (Windows Subsystem for Linux) - Recommended\n"
-            "     - Install WSL: https://docs.microsoft.com/en-us/windows/wsl/install\n"
-            "     - Run the tournament from within WSL\n\n"
-            "  2. Use a Linux virtual machine or Docker container\n\n"
-            "  3. Run on a Linux or macOS system"
+            f"Solutions:\n{solutions}",
+            platform=sys.platform,
+            suggestions=_WINDOWS_SUGGESTIONS,
         )
 
+    # No limit: skip the handler swap and timer syscalls entirely
+    if timeout_seconds == 0:
+        return func(*args)
+
     # Store the old signal handler to restore it later
     old_handler = signal.signal(signal.SIGALRM, _timeout_handler)
 
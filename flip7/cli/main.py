@@ -14,6 +14,10 @@ console = Console()
 logger = logging.getLogger(__name__)
 
 
+# Loaded config modules keyed by resolved path: (st_mtime_ns, st_size, module)
+_CONFIG_CACHE: dict[Path, tuple[int, int, object]] = {}
+
+
 def _load_config_from_file(config_file: Path) -> object:
     """Load tournament configuration from Python file."""
     import importlib.util
@@ -31,6 +35,24 @@ def _load_config_from_file(config_file: Path) -> object:
         raise click.ClickException(f"Error loading config file: {e}")
 
 
+def _load_config_cached(config_file: Path) -> object:
+    """Load tournament configuration, reusing the module if the file is unchanged.
+
+    The cache entry is keyed by the resolved path and invalidated whenever the
+    file's modification time or size changes.
+    """
+    path = config_file.resolve()
+    stat = path.stat()
+
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    module = _load_config_from_file(path)
+    _CONFIG_CACHE[path] = (stat.st_mtime_ns, stat.st_size, module)
+    return module
+
+
 @click.command()
 @click.option(
     "--verbose", "-v",
@@ -81,7 +103,7 @@ def cli(verbose: bool) -> None:
         check_platform_compatibility()
 
         # Load configuration module
-        config_module = _load_config_from_file(config_file)
+        config_module = _load_config_cached(config_file)
 
         # Auto-discover all bots
         from flip7.utils.bot_discovery import discover_all_bots, get_bot_names
@@ -104,6 +126,7 @@ def cli(verbose: bool) -> None:
         save_replays = getattr(config_module, "SAVE_REPLAYS", False)
         tournament_seed = getattr(config_module, "TOURNAMENT_SEED", None)
         tournament_name = getattr(config_module, "TOURNAMENT_NAME", "Tournament")
+        max_workers = getattr(config_module, "MAX_WORKERS", 1)
 
         # Get tournament-specific settings
         games_h2h = getattr(config_module, "GAMES_PER_MATCHUP_HEAD_TO_HEAD", 100_000)
@@ -120,6 +143,7 @@ def cli(verbose: bool) -> None:
                 bot_timeout_seconds=bot_timeout,
                 output_dir_h2h=output_h2h,
                 output_dir_all=output_all,
+                max_workers=max_workers,
             )
         except ConfigurationError as e:
             raise click.ClickException(str(e))
@@ -144,6 +168,7 @@ def cli(verbose: bool) -> None:
             output_dir=output_h2h,
             save_replays=save_replays,
             tournament_seed=tournament_seed,
+            max_workers=max_workers,
         )
 
         print_round_robin_results(results_h2h)
@@ -164,6 +189,7 @@ def cli(verbose: bool) -> None:
             output_dir=output_all,
             save_replays=save_replays,
             tournament_seed=tournament_seed if tournament_seed is None else tournament_seed + 1_000_000,
+            max_workers=max_workers,
         )
 
         print_round_robin_results(results_all)
@@ -43,6 +43,13 @@ MODIFIER_CARD_COUNTS: Final[dict[str, int]] = {
     "X2": 1,
 }
 
+# Total number of cards in a full deck (94), summed once at import time
+TOTAL_CARDS: Final[int] = (
+    sum(DECK_COMPOSITION.values())
+    + sum(ACTION_CARD_COUNTS.values())
+    + sum(MODIFIER_CARD_COUNTS.values())
+)
+
 # Winning score threshold
 WINNING_SCORE: Final[int] = 200
 
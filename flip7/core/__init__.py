@@ -1,6 +1,6 @@
 """Core game logic and mechanics for Flipped Seven."""
 
-from flip7.core.deck import create_deck, shuffle_deck
+from flip7.core.deck import build_seeded_deck, create_deck, shuffle_deck
 from flip7.core.game_engine import GameEngine
 from flip7.core.round_engine import RoundEngine
 from flip7.core.scoring import (
@@ -19,6 +19,7 @@ from flip7.events.event_logger import EventLogger
 __all__ = [
     "create_deck",
     "shuffle_deck",
+    "build_seeded_deck",
     "calculate_score",
     "has_flip_7",
     "calculate_modifier_sum",
@@ -3,10 +3,19 @@ Deck creation and manipulation for Flipped Seven.
 
 This module provides functions to create and shuffle the game deck according
 to the rules defined in the constants module.
+
+Shuffling works on a packed representation of the deck: every card is encoded
+as a single byte (bits 0-3 hold the card kind, bits 4-7 the value or subtype
+index), so the permutation runs over a contiguous numpy array instead of
+swapping Python object pointers. Card objects are looked up again from a small
+table of canonical instances once the shuffle is done.
 """
 
-import random
-from typing import Optional
+from functools import lru_cache
+from typing import Final
+
+import numpy as np
+import numpy.typing as npt
 
 from flip7.constants import (
     ACTION_CARD_COUNTS,
@@ -15,25 +24,43 @@ from flip7.constants import (
 )
 from flip7.types.cards import ActionCard, ActionType, Card, ModifierCard, NumberCard
 
+# Card kinds stored in the low nibble of a packed card code
+_KIND_NUMBER: Final[int] = 0
+_KIND_ACTION: Final[int] = 1
+_KIND_MODIFIER: Final[int] = 2
 
-def create_deck() -> list[Card]:
-    """
-    Create a complete deck of 94 cards according to game rules.
 
-    The deck consists of:
-    - 78 number cards (0-12, with count equal to value except 0 which has 1)
-    - 9 action cards (3 each of FREEZE, FLIP_THREE, SECOND_CHANCE)
-    - 6 modifier cards (1 each of +2, +4, +6, +8, +10, X2)
-    - Total: 94 cards
+def _build_card_table() -> dict[int, Card]:
+    """
+    Build the lookup table from packed card codes to canonical card objects.
 
     Returns:
-        A list containing all 94 cards in the deck, unshuffled.
+        Mapping of packed card code to the card it represents
+    """
+    table: dict[int, Card] = {}
 
-    Example:
-        >>> deck = create_deck()
-        >>> len(deck)
-        94
-        >>> # Deck contains correct number of each card type
+    for value in DECK_COMPOSITION:
+        table[(value << 4) | _KIND_NUMBER] = NumberCard(value=value)
+
+    for index, action_name in enumerate(ACTION_CARD_COUNTS):
+        table[(index << 4) | _KIND_ACTION] = ActionCard(action_type=ActionType[action_name])
+
+    for index, modifier in enumerate(MODIFIER_CARD_COUNTS):
+        table[(index << 4) | _KIND_MODIFIER] = ModifierCard(modifier=modifier)  # type: ignore[arg-type]
+
+    return table
+
+
+_CARD_BY_CODE: Final[dict[int, Card]] = _build_card_table()
+_CODE_BY_CARD: Final[dict[Card, int]] = {card: code for code, card in _CARD_BY_CODE.items()}
+
+
+def _build_full_deck() -> tuple[Card, ...]:
+    """
+    Build the unshuffled 94-card deck once, in rule order.
+
+    Returns:
+        Every card in the game, as an immutable tuple of interned cards
     """
     deck: list[Card] = []
 
@@ -54,10 +81,66 @@ def create_deck() -> list[Card]:
         for _ in range(count):
             deck.append(ModifierCard(modifier=modifier))  # type: ignore[arg-type]
 
-    return deck
+    return tuple(deck)
+
+
+_FULL_DECK: Final[tuple[Card, ...]] = _build_full_deck()
+
+
+def create_deck() -> list[Card]:
+    """
+    Create a complete deck of 94 cards according to game rules.
+
+    The deck consists of:
+    - 78 number cards (0-12, with count equal to value except 0 which has 1)
+    - 9 action cards (3 each of FREEZE, FLIP_THREE, SECOND_CHANCE)
+    - 6 modifier cards (1 each of +2, +4, +6, +8, +10, X2)
+    - Total: 94 cards
+
+    Returns:
+        A list containing all 94 cards in the deck, unshuffled.
+
+    Example:
+        >>> deck = create_deck()
+        >>> len(deck)
+        94
+        >>> # Deck contains correct number of each card type
+    """
+    return list(_FULL_DECK)
+
+
+def pack_deck(deck: list[Card]) -> npt.NDArray[np.uint8]:
+    """
+    Encode a deck as an array of packed one-byte card codes.
+
+    Args:
+        deck: The cards to encode, in order
+
+    Returns:
+        A uint8 array with one packed code per card, in the same order
+
+    Raises:
+        KeyError: If the deck contains a card that is not part of the game
+    """
+    return np.fromiter((_CODE_BY_CARD[card] for card in deck), dtype=np.uint8, count=len(deck))
+
+
+def unpack_deck(codes: npt.NDArray[np.uint8]) -> list[Card]:
+    """
+    Decode an array of packed card codes back into card objects.
+
+    Args:
+        codes: Packed card codes as produced by pack_deck
+
+    Returns:
+        A list of cards in the same order as the codes
+    """
+    return [_CARD_BY_CODE[code] for code in codes.tolist()]
 
 
-def shuffle_deck(deck: list[Card], seed: Optional[int] = None) -> list[Card]:
+def shuffle_deck(
+    deck: list[Card], seed: int | np.random.Generator | None = None
+) -> list[Card]:
     """
     Shuffle a deck of cards with optional deterministic seeding.
 
@@ -68,6 +151,8 @@ def shuffle_deck(deck: list[Card], seed: Optional[int] = None) -> list[Card]:
         deck: The deck to shuffle (will not be modified)
         seed: Optional random seed for deterministic shuffling. If None,
               shuffling will be non-deterministic based on system entropy.
+              A numpy Generator may be passed instead to draw from an existing
+              random stream (it is advanced by the shuffle).
 
     Returns:
         A new list containing the same cards in shuffled order.
@@ -82,13 +167,36 @@ def shuffle_deck(deck: list[Card], seed: Optional[int] = None) -> list[Card]:
         >>> shuffled1 == shuffled3  # Different seed produces different shuffle
         False
     """
-    # Create a copy to avoid modifying the original
-    shuffled = deck.copy()
+    # Packing creates a copy, so the original deck is never modified
+    codes = pack_deck(deck)
+
+    # Shuffle the packed codes in-place with a seeded generator
+    # (default_rng returns a Generator argument unchanged)
+    rng = np.random.default_rng(seed)
+    rng.shuffle(codes)
+
+    return unpack_deck(codes)
+
+
+@lru_cache(maxsize=128)
+def build_seeded_deck(seed: int) -> tuple[Card, ...]:
+    """
+    Build the full deck shuffled with a fixed seed, memoized per seed.
 
-    # Create a Random instance with the given seed
-    rng = random.Random(seed)
+    The result equals shuffle_deck(create_deck(), seed=seed). It is returned as
+    a tuple so the cached deck cannot be mutated; copy it into a list before
+    drawing from it.
+
+    Args:
+        seed: Random seed for the shuffle
 
-    # Shuffle the copy in-place
-    rng.shuffle(shuffled)
+    Returns:
+        A tuple of all 94 cards in shuffled order
 
-    return shuffled
+    Example:
+        >>> build_seeded_deck(42) == tuple(shuffle_deck(create_deck(), seed=42))
+        True
+        >>> build_seeded_deck(42) is build_seeded_deck(42)
+        True
+    """
+    return tuple(shuffle_deck(create_deck(), seed=seed))
@@ -42,7 +42,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 from flip7.constants import WINNING_SCORE
-from flip7.core.deck import create_deck, shuffle_deck
+from flip7.core.deck import build_seeded_deck, create_deck, shuffle_deck
 from flip7.core.round_engine import RoundEngine
 from flip7.events.event_logger import EventLogger, NullEventLogger
 from flip7.types.bot_interface import Bot
@@ -67,7 +67,7 @@ class GameEngine:
         game_id: Unique identifier for this game instance
         player_ids: List of player IDs participating in the game
         bots: Dictionary mapping player IDs to their bot instances
-        event_log_path: Path where game events will be logged
+        event_log_path: Path where game events will be logged (None to skip logging)
         seed: Random seed for deterministic gameplay (None for random)
         bot_timeout: Timeout in seconds for bot decisions
         game_state: Current state of the game (scores, completion status)
@@ -80,7 +80,7 @@ class GameEngine:
         game_id: str,
         player_ids: list[str],
         bots: dict[str, Bot],
-        event_log_path: Path,
+        event_log_path: Path | None = None,
         seed: int | None = None,
         bot_timeout: float = 5.0,
         enable_logging: bool = True
@@ -92,7 +92,7 @@ class GameEngine:
             game_id: Unique identifier for this game
             player_ids: List of player IDs participating
             bots: Dictionary mapping player IDs to bot instances
-            event_log_path: Path to event log file
+            event_log_path: Path to event log file, or None to skip logging
             seed: Optional random seed for deterministic gameplay
             bot_timeout: Timeout in seconds for bot decisions (default: 5.0)
             enable_logging: Whether to log events to file (default: True)
@@ -117,7 +117,9 @@ class GameEngine:
         self.enable_logging = enable_logging
 
         # Initialize persistent deck and discard pile (shared across all rounds)
-        self.deck: list[Card] = shuffle_deck(create_deck(), seed=seed)
+        self.deck: list[Card] = (
+            shuffle_deck(create_deck()) if seed is None else list(build_seeded_deck(seed))
+        )
         self.discard_pile: list[Card] = []
 
         # Initialize game state
@@ -279,8 +281,12 @@ class GameEngine:
         if self.game_state.is_complete:
             raise RuntimeError("Game has already been completed")
 
-        # Use EventLogger or NullEventLogger based on enable_logging flag
-        logger = EventLogger(self.event_log_path) if self.enable_logging else NullEventLogger()
+        # Use EventLogger or NullEventLogger based on enable_logging and the log path
+        logger = (
+            EventLogger(self.event_log_path)
+            if self.enable_logging and self.event_log_path is not None
+            else NullEventLogger()
+        )
 
         with logger as event_logger:
             # Log game started event
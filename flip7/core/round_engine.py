@@ -7,8 +7,11 @@ scoring. This is the core game logic that ties together all game mechanics.
 
 from dataclasses import replace
 from datetime import datetime, timezone
+from itertools import chain
 from typing import Any
 
+import numpy as np
+
 from flip7.bots.sandbox import execute_with_sandbox
 from flip7.constants import FLIP_7_THRESHOLD, WINNING_SCORE
 from flip7.core.deck import create_deck, shuffle_deck
@@ -25,6 +28,33 @@ from flip7.types.game_state import PlayerTableau, RoundState
 DEFAULT_BOT_TIMEOUT = 5.0
 
 
+class _TableauMap(dict[str, PlayerTableau]):
+    """
+    Player tableaus that keep track of which players are still active.
+
+    Every tableau assignment updates `active`, an insertion-ordered set (a dict
+    with None values) of active player IDs in turn order. Players only leave it
+    during a round, so reading it replaces a scan over every tableau. Only
+    item assignment is tracked; use `tableaus[player_id] = ...` to update.
+    """
+
+    def __init__(self, tableaus: dict[str, PlayerTableau]) -> None:
+        super().__init__(tableaus)
+        self.active: dict[str, None] = dict.fromkeys(
+            player_id for player_id, tableau in tableaus.items() if tableau.is_active
+        )
+
+    def __setitem__(self, player_id: str, tableau: PlayerTableau) -> None:
+        super().__setitem__(player_id, tableau)
+        if not tableau.is_active:
+            self.active.pop(player_id, None)
+        elif player_id not in self.active:
+            # A player made active again: rebuild to keep turn order
+            self.active = dict.fromkeys(
+                pid for pid, other in self.items() if other.is_active
+            )
+
+
 class RoundEngine:
     """
     Orchestrates a complete round of Flip 7 with all game mechanics.
@@ -44,9 +74,13 @@ class RoundEngine:
         event_logger: Logger for recording game events
         seed: Random seed for deterministic deck shuffling
         bot_timeout: Timeout in seconds for bot decisions
-        deck: Current draw pile (as list, top card is at index 0)
+        max_turns: Optional cap on the number of turns in the turn cycle
+        deck: Current draw pile (as list, top card is at index 0); drawing
+              advances a cursor and the drawn cards are dropped from the
+              shared list when the round ends or the deck is read
         discard_pile: Discarded cards (as list, most recent on top)
-        tableaus: Current state of each player's tableau
+        tableaus: Current state of each player's tableau, also tracking which
+                  players are still active
         current_player_index: Index into player_ids for current turn
         round_number: The current round number (for logging)
         game_id: Unique identifier for the game (for logging)
@@ -63,6 +97,7 @@ class RoundEngine:
         game_id: str = "game",
         seed: int | None = None,
         bot_timeout: float = DEFAULT_BOT_TIMEOUT,
+        max_turns: int | None = None,
     ) -> None:
         """
         Initialize a new round engine.
@@ -77,6 +112,9 @@ class RoundEngine:
             game_id: Unique identifier for the game (default: "game")
             seed: Optional random seed for deterministic shuffling (used for reshuffling)
             bot_timeout: Timeout in seconds for bot decisions (default: 5.0)
+            max_turns: Optional cap on the number of turns taken in the turn cycle.
+                       Once reached, any player still active passes and the round
+                       ends (default: None, no cap)
 
         Raises:
             ValueError: If player_ids is empty or bots don't match player_ids
@@ -95,13 +133,19 @@ class RoundEngine:
         self.game_id = game_id
         self.seed = seed
         self.bot_timeout = bot_timeout
-
-        # Use provided deck and discard pile (persistent across rounds)
-        self.deck = deck
+        # One random stream per round so repeated reshuffles differ
+        self._rng = np.random.default_rng(seed)
+        self.max_turns = max_turns
+
+        # Use provided deck and discard pile (persistent across rounds).
+        # Cards are drawn by advancing a cursor into the shared deck list instead
+        # of popping from its front, which would shift every remaining card.
+        self._deck = deck
+        self._deck_cursor = 0
         self.discard_pile = discard_pile
 
         # Initialize tableaus for all players
-        self.tableaus: dict[str, PlayerTableau] = {
+        self.tableaus = _TableauMap({
             player_id: PlayerTableau(
                 player_id=player_id,
                 number_cards=(),
@@ -113,10 +157,39 @@ class RoundEngine:
                 is_passed=False,
             )
             for player_id in player_ids
-        }
+        })
 
         self.current_player_index = 0
 
+    @property
+    def deck(self) -> list[Card]:
+        """
+        The remaining draw pile, top card first.
+
+        This is the list passed in by the caller. Reading it first drops the cards
+        drawn so far, so it always holds exactly the undrawn cards.
+
+        Returns:
+            The shared deck list
+        """
+        self._compact_deck()
+        return self._deck
+
+    def _deck_remaining(self) -> int:
+        """
+        Count the undrawn cards without compacting the deck.
+
+        Returns:
+            Number of cards left to draw
+        """
+        return len(self._deck) - self._deck_cursor
+
+    def _compact_deck(self) -> None:
+        """Remove the cards drawn so far from the shared deck list in one slice."""
+        if self._deck_cursor:
+            del self._deck[:self._deck_cursor]
+            self._deck_cursor = 0
+
     def execute_round(self) -> dict[str, int]:
         """
         Execute a complete round and return final scores for each player.
@@ -140,21 +213,25 @@ class RoundEngine:
             "round_started",
             data={
                 "player_ids": self.player_ids,
-                "deck_size": len(self.deck),
+                "deck_size": self._deck_remaining(),
             },
         )
 
-        # Phase 1: Initial deal
-        self._initial_deal()
+        try:
+            # Phase 1: Initial deal
+            self._initial_deal()
 
-        # Phase 2: Turn cycle
-        self._execute_turn_cycle()
+            # Phase 2: Turn cycle
+            self._execute_turn_cycle()
 
-        # Phase 3: Calculate final scores
-        scores = self._calculate_final_scores()
+            # Phase 3: Calculate final scores
+            scores = self._calculate_final_scores()
 
-        # Phase 4: Cleanup - move all tableau cards to discard pile
-        self._cleanup_tableaus()
+            # Phase 4: Cleanup - move all tableau cards to discard pile
+            self._cleanup_tableaus()
+        finally:
+            # Leave the shared deck holding only the undrawn cards
+            self._compact_deck()
 
         # Log round end
         self._log_event(
@@ -173,16 +250,13 @@ class RoundEngine:
         - If a player receives an action card, it's resolved immediately
         - Number and modifier cards are added to the player's tableau normally
         """
-        for player_id in self.player_ids:
-            card = self._draw_card(player_id)
+        # Bind the per-card methods once rather than on every iteration
+        draw_card = self._draw_card
+        handle_drawn_card = self._handle_drawn_card
 
+        for player_id in self.player_ids:
             # Handle action cards immediately during initial deal
-            if isinstance(card, ActionCard):
-                self._handle_action_card(player_id, card)
-            elif isinstance(card, NumberCard):
-                self._handle_number_card(player_id, card)
-            elif isinstance(card, ModifierCard):
-                self._handle_modifier_card(player_id, card)
+            handle_drawn_card(player_id, draw_card(player_id))
 
     def _execute_turn_cycle(self) -> None:
         """
@@ -193,18 +267,38 @@ class RoundEngine:
         - Busted from duplicate cards
         - Been frozen by a Freeze action
         - Achieved Flip 7 (auto-pass)
+
+        If max_turns is set, the cycle also stops once that many turns have been
+        taken, and any player still active passes with their current cards.
         """
+        turns_taken = 0
+
         while not self._is_round_complete():
+            if self.max_turns is not None and turns_taken >= self.max_turns:
+                self._pass_remaining_players()
+                break
+
             player_id = self.player_ids[self.current_player_index]
             tableau = self.tableaus[player_id]
 
             # Only execute turn if player is still active
             if tableau.is_active:
                 self._execute_player_turn(player_id)
+                turns_taken += 1
 
             # Move to next player
             self.current_player_index = (self.current_player_index + 1) % len(self.player_ids)
 
+    def _pass_remaining_players(self) -> None:
+        """
+        Pass every player who is still active.
+
+        Used to end the turn cycle early once max_turns has been reached.
+        """
+        for player_id in self.player_ids:
+            if self.tableaus[player_id].is_active:
+                self._handle_pass(player_id)
+
     def _execute_player_turn(self, player_id: str) -> None:
         """
         Execute a single player's turn with bot decision.
@@ -291,11 +385,24 @@ class RoundEngine:
         card = self._draw_card(player_id)
 
         # Handle the drawn card based on its type
-        if isinstance(card, ActionCard):
-            self._handle_action_card(player_id, card)
-        elif isinstance(card, NumberCard):
+        self._handle_drawn_card(player_id, card)
+
+    def _handle_drawn_card(self, player_id: str, card: Card) -> None:
+        """
+        Dispatch a drawn card to the handler for its type.
+
+        Cards are interned and never subclassed, so an exact type check suffices;
+        number cards, by far the most common, are checked first.
+
+        Args:
+            player_id: The ID of the player who drew the card
+            card: The card that was drawn
+        """
+        if type(card) is NumberCard:
             self._handle_number_card(player_id, card)
-        elif isinstance(card, ModifierCard):
+        elif type(card) is ActionCard:
+            self._handle_action_card(player_id, card)
+        elif type(card) is ModifierCard:
             self._handle_modifier_card(player_id, card)
 
     def _draw_card(self, player_id: str) -> Card:
@@ -315,7 +422,7 @@ class RoundEngine:
             RuntimeError: If both deck and discard pile are empty (should never happen)
         """
         # Check if deck is empty
-        if not self.deck:
+        if self._deck_cursor >= len(self._deck):
             # Reshuffle discard pile into deck
             if not self.discard_pile:
                 raise RuntimeError("No cards available to draw")
@@ -325,21 +432,82 @@ class RoundEngine:
                 data={"reason": "deck_exhausted", "cards_reshuffled": len(self.discard_pile)},
             )
 
-            self.deck = shuffle_deck(self.discard_pile, seed=self.seed)
-            self.discard_pile = []
+            # Refill in place so callers holding these lists (e.g. GameEngine) see the change
+            self._deck[:] = shuffle_deck(self.discard_pile, seed=self._rng)
+            self._deck_cursor = 0
+            self.discard_pile.clear()
 
         # Draw top card
-        card = self.deck.pop(0)
+        card = self._deck[self._deck_cursor]
+        self._deck_cursor += 1
 
         # Log the draw
         self._log_event(
             "card_dealt",
             player_id=player_id,
-            data={"card": card, "deck_remaining": len(self.deck)},
+            data={"card": card, "deck_remaining": self._deck_remaining()},
         )
 
         return card
 
+    def _draw_and_apply_numbers(self, player_id: str, n: int) -> bool:
+        """
+        Draw n number cards for a player in one step, if none can end the draw early.
+
+        Batch form of n calls to _draw_card + _handle_number_card. It applies only
+        when the next n cards in the deck are all number cards that keep the
+        player's values distinct (no bust) and reach Flip 7 on the last card at the
+        earliest. The cards are then sliced off the deck together and added to the
+        tableau with a single update; events are logged in the same order as the
+        card-by-card path. Otherwise nothing is drawn, so the caller can fall back
+        to drawing one card at a time.
+
+        Args:
+            player_id: The ID of the player drawing the cards
+            n: The number of cards to draw
+
+        Returns:
+            True if the n cards were drawn and applied, False if nothing was drawn
+        """
+        start = self._deck_cursor
+        numbers = [
+            card for card in self._deck[start:start + n] if type(card) is NumberCard
+        ]
+        if len(numbers) < n:
+            return False
+
+        tableau = self.tableaus[player_id]
+        new_number_cards = tableau.number_cards + tuple(numbers)
+        if (
+            len(new_number_cards) > FLIP_7_THRESHOLD
+            or len(set(new_number_cards)) != len(new_number_cards)
+        ):
+            return False
+
+        self._deck_cursor += n
+        deck_remaining = self._deck_remaining() + n
+        for card in numbers:
+            deck_remaining -= 1
+            self._log_event(
+                "card_dealt",
+                player_id=player_id,
+                data={"card": card, "deck_remaining": deck_remaining},
+            )
+            self._log_event(
+                "player_hit",
+                player_id=player_id,
+                data={"card": card},
+            )
+
+        updated_tableau = replace(tableau, number_cards=new_number_cards)
+        self.tableaus[player_id] = updated_tableau
+
+        # Flip 7 can only have been reached on the last card
+        if self._check_flip_7(updated_tableau):
+            self._auto_pass_on_flip_7(player_id)
+
+        return True
+
     def _handle_number_card(self, player_id: str, card: NumberCard) -> None:
         """
         Handle a number card: check for duplicate, bust, or Flip 7.
@@ -355,13 +523,11 @@ class RoundEngine:
             card: The number card that was drawn
         """
         tableau = self.tableaus[player_id]
-
-        # Add card to tableau temporarily to check for bust
         new_number_cards = tableau.number_cards + (card,)
-        updated_tableau = replace(tableau, number_cards=new_number_cards)
 
-        # Check for bust (duplicate number cards)
-        if self._check_bust(updated_tableau):
+        # Check for bust (duplicate number cards). The existing cards are already
+        # unique, so only the drawn card can create a duplicate.
+        if card in tableau.number_cards:
             # Player has a duplicate - offer Second Chance if available
             if tableau.second_chance:
                 self._handle_bust(player_id, card)
@@ -373,12 +539,14 @@ class RoundEngine:
                     data={"duplicate": card},
                 )
                 self.tableaus[player_id] = replace(
-                    updated_tableau,
+                    tableau,
+                    number_cards=new_number_cards,
                     is_active=False,
                     is_busted=True,
                 )
         else:
             # No bust - update tableau
+            updated_tableau = replace(tableau, number_cards=new_number_cards)
             self.tableaus[player_id] = updated_tableau
 
             # Log the hit
@@ -555,6 +723,10 @@ class RoundEngine:
             player_id: The ID of the player drawing cards
             queued_action_cards: List to accumulate Flip Three/Freeze cards for later
         """
+        # Common case: three plain number cards that cannot bust or stop early
+        if self._is_player_active(player_id) and self._draw_and_apply_numbers(player_id, 3):
+            return
+
         for i in range(3):
             # Check if player is still active (might have busted or achieved Flip 7)
             if not self._is_player_active(player_id):
@@ -585,11 +757,11 @@ class RoundEngine:
             card: The card that was drawn
             queued_action_cards: List to accumulate queued action cards
         """
-        if isinstance(card, ActionCard):
-            self._handle_flip_three_action_card(player_id, card, queued_action_cards)
-        elif isinstance(card, NumberCard):
+        if type(card) is NumberCard:
             self._handle_number_card(player_id, card)
-        elif isinstance(card, ModifierCard):
+        elif type(card) is ActionCard:
+            self._handle_flip_three_action_card(player_id, card, queued_action_cards)
+        elif type(card) is ModifierCard:
             self._handle_modifier_card(player_id, card)
 
     def _handle_flip_three_action_card(
@@ -624,24 +796,27 @@ class RoundEngine:
         """
         Resolve action cards that were queued during Flip Three.
 
-        Only resolves if player hasn't busted. Stops resolving if player
-        becomes inactive and discards remaining queued cards.
+        Only resolves if player hasn't busted; a busted player's queued cards
+        are discarded. Stops resolving if player becomes inactive and discards
+        remaining queued cards.
 
         Args:
             player_id: The ID of the player whose queued cards to resolve
             queued_action_cards: List of action cards to resolve
         """
-        # Only resolve if player hasn't busted and has queued cards
-        if self.tableaus[player_id].is_busted or not queued_action_cards:
+        if not queued_action_cards:
             return
 
-        for action_card in queued_action_cards:
+        # A busted player never resolves queued cards; they go to the discard pile
+        if self.tableaus[player_id].is_busted:
+            self.discard_pile.extend(queued_action_cards)
+            return
+
+        for index, action_card in enumerate(queued_action_cards):
             # Only resolve if player is still active
             if not self._is_player_active(player_id):
                 # Player became inactive, discard remaining queued cards
-                self._discard_remaining_queued_cards(
-                    queued_action_cards, action_card
-                )
+                self._discard_remaining_queued_cards(queued_action_cards, index)
                 break
             self._handle_action_card(player_id, action_card)
 
@@ -658,20 +833,22 @@ class RoundEngine:
         return self.tableaus[player_id].is_active
 
     def _discard_remaining_queued_cards(
-        self, queued_action_cards: list[ActionCard], current_card: ActionCard
+        self, queued_action_cards: list[ActionCard], start_index: int
     ) -> None:
         """
         Discard all remaining queued action cards starting from the current card.
 
         Called when a player becomes inactive before all queued cards are resolved.
+        The position is passed explicitly because cards are interned: two queued
+        Freeze cards are the same object, so searching for the current card
+        would find the first one even if it was already resolved.
 
         Args:
             queued_action_cards: The full list of queued action cards
-            current_card: The card that couldn't be resolved (and where to start discarding)
+            start_index: Position of the card that couldn't be resolved (and where
+                         to start discarding)
         """
-        start_index = queued_action_cards.index(current_card)
-        for remaining_card in queued_action_cards[start_index:]:
-            self.discard_pile.append(remaining_card)
+        self.discard_pile.extend(queued_action_cards[start_index:])
 
     def _resolve_second_chance(self, player_id: str) -> None:
         """
@@ -812,6 +989,7 @@ class RoundEngine:
         # Use Second Chance - discard the duplicate card (which was never added to tableau)
         # and remove Second Chance
         # Keep all original cards - the duplicate was detected but never added
+        self.discard_pile.append(duplicate)
         self.tableaus[player_id] = replace(
             tableau,
             number_cards=tableau.number_cards,  # Keep original cards unchanged
@@ -844,8 +1022,11 @@ class RoundEngine:
             data={"duplicate": duplicate},
         )
 
+        # Keep the duplicate in the tableau, as for a bust without Second Chance,
+        # so it is discarded with the rest of the cards at cleanup
         self.tableaus[player_id] = replace(
             tableau,
+            number_cards=tableau.number_cards + (duplicate,),
             is_active=False,
             is_busted=True,
         )
@@ -898,7 +1079,7 @@ class RoundEngine:
         Returns:
             True if the round is complete, False otherwise
         """
-        return all(not tableau.is_active for tableau in self.tableaus.values())
+        return not self.tableaus.active
 
     def _calculate_final_scores(self) -> dict[str, int]:
         """
@@ -941,17 +1122,15 @@ class RoundEngine:
         Note: Cards are added to the discard pile (NOT the deck), so they will only
         be reshuffled if the deck runs out during a future round.
         """
-        for player_id, tableau in self.tableaus.items():
-            # Collect all number cards
-            for num_card in tableau.number_cards:
-                self.discard_pile.append(num_card)
-
-            # Collect all modifier cards
-            for mod_card in tableau.modifier_cards:
-                self.discard_pile.append(mod_card)
+        # Collect all number and modifier cards, player by player, in one extend
+        self.discard_pile.extend(chain.from_iterable(
+            cards
+            for tableau in self.tableaus.values()
+            for cards in (tableau.number_cards, tableau.modifier_cards)
+        ))
 
-            # Note: Second Chance and action cards are not physical cards in the tableau
-            # in this implementation (they're boolean flags), so nothing to discard for them
+        # Note: Second Chance and action cards are not physical cards in the tableau
+        # in this implementation (they're boolean flags), so nothing to discard for them
 
     def _get_eligible_targets(self, action_type: ActionType) -> list[str]:
         """
@@ -980,8 +1159,8 @@ class RoundEngine:
                 and not self.tableaus[pid].second_chance
             ]
         else:
-            # FREEZE and FLIP_THREE target active players only
-            return [pid for pid in self.player_ids if self.tableaus[pid].is_active]
+            # FREEZE and FLIP_THREE target active players only (tracked on update)
+            return list(self.tableaus.active)
 
     def _build_decision_context(self, player_id: str) -> BotDecisionContext:
         """
@@ -1006,7 +1185,7 @@ class RoundEngine:
         return BotDecisionContext(
             my_tableau=my_tableau,
             opponent_tableaus=opponent_tableaus,
-            deck_remaining=len(self.deck),
+            deck_remaining=self._deck_remaining(),
             my_current_score=0,  # Placeholder - would be provided by Game
             opponent_scores={pid: 0 for pid in opponent_tableaus},  # Placeholder
             current_round=self.round_number,
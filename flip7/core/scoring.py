@@ -13,10 +13,40 @@ Scoring Rules:
 5. Busted players always score 0
 
 The X2 multiplier is applied BEFORE adding +N modifiers.
+
+Scores are memoized: a non-busted hand is keyed by a bitmask of its number
+values (0-12) plus a bitmask of its modifier cards, so recurring tableau
+compositions during simulation are scored with a single cache lookup no
+matter what order the cards were drawn in.
+
+Modifier labels ("+2", "X2") are parsed once, into a table keyed by the
+interned modifier cards, rather than on every scored card.
 """
 
+from functools import lru_cache
+from typing import get_args
+
 from flip7.constants import FLIP_7_BONUS, FLIP_7_THRESHOLD
-from flip7.types import ModifierCard, NumberCard, PlayerTableau, ScoreBreakdown
+from flip7.types import (
+    ModifierCard,
+    ModifierType,
+    NumberCard,
+    PlayerTableau,
+    ScoreBreakdown,
+)
+
+# Points each modifier card adds; X2 adds none (it doubles the number sum).
+# Cards are interned, so lookups hash by identity.
+_MODIFIER_ADDITIONS: dict[ModifierCard, int] = {
+    ModifierCard(modifier): 0 if modifier == "X2" else int(modifier[1:])
+    for modifier in get_args(ModifierType)
+}
+_X2_CARD = ModifierCard("X2")
+
+# One bit per modifier card, in ModifierType order, for order-free cache keys
+_MODIFIER_BITS: dict[ModifierCard, int] = {
+    card: 1 << index for index, card in enumerate(_MODIFIER_ADDITIONS)
+}
 
 
 def has_duplicate_numbers(number_cards: tuple[NumberCard, ...]) -> bool:
@@ -49,6 +79,45 @@ def has_duplicate_numbers(number_cards: tuple[NumberCard, ...]) -> bool:
     return len(values) != len(set(values))
 
 
+def _value_mask(number_cards: tuple[NumberCard, ...]) -> int:
+    """
+    Pack the number values held in a tableau into a bitmask.
+
+    Bit v is set when a card of value v is present. Values run 0-12, so the
+    mask fits in 13 bits; duplicate values collapse onto the same bit.
+
+    Args:
+        number_cards: Tuple of number cards in the player's tableau
+
+    Returns:
+        Bitmask of the number values present
+    """
+    mask = 0
+    for card in number_cards:
+        mask |= 1 << card.value
+    return mask
+
+
+def _modifier_mask(modifier_cards: tuple[ModifierCard, ...]) -> int:
+    """
+    Pack the modifier cards held in a tableau into a bitmask.
+
+    Each modifier card has its own bit (see _MODIFIER_BITS); duplicate cards
+    collapse onto the same bit.
+
+    Args:
+        modifier_cards: Tuple of modifier cards in the player's tableau
+
+    Returns:
+        Bitmask of the modifier cards present
+    """
+    mask = 0
+    for card in modifier_cards:
+        mask |= _MODIFIER_BITS[card]
+    return mask
+
+
+@lru_cache(maxsize=4096)
 def has_flip_7(number_cards: tuple[NumberCard, ...]) -> bool:
     """
     Check if a player has achieved the Flip 7 bonus.
@@ -56,6 +125,8 @@ def has_flip_7(number_cards: tuple[NumberCard, ...]) -> bool:
     The Flip 7 bonus is awarded when a player has exactly 7 unique number card
     values in their tableau. Duplicate values do not count toward this total.
 
+    Results are cached, so number_cards must be a (hashable) tuple.
+
     Args:
         number_cards: Tuple of number cards in the player's tableau
 
@@ -79,8 +150,7 @@ def has_flip_7(number_cards: tuple[NumberCard, ...]) -> bool:
         ...            NumberCard(6), NumberCard(7)))
         False
     """
-    unique_values = {card.value for card in number_cards}
-    return len(unique_values) == FLIP_7_THRESHOLD
+    return _value_mask(number_cards).bit_count() == FLIP_7_THRESHOLD
 
 
 def calculate_modifier_sum(modifier_cards: tuple[ModifierCard, ...]) -> int:
@@ -111,15 +181,75 @@ def calculate_modifier_sum(modifier_cards: tuple[ModifierCard, ...]) -> int:
         >>> calculate_modifier_sum(())
         0
     """
-    total = 0
-    for card in modifier_cards:
-        # Only process additive modifiers (+2, +4, +6, +8, +10)
-        # X2 is handled separately in the scoring calculation
-        if card.modifier != "X2":
-            # Extract the numeric value from the modifier string (e.g., "+2" -> 2)
-            modifier_value = int(card.modifier[1:])  # Skip the '+' prefix
-            total += modifier_value
-    return total
+    # X2 maps to 0 here; it is handled separately in the scoring calculation
+    return sum(map(_MODIFIER_ADDITIONS.__getitem__, modifier_cards))
+
+
+_BUSTED_BREAKDOWN = ScoreBreakdown(
+    number_cards_sum=0,
+    after_x2_multiplier=0,
+    modifier_additions=0,
+    flip_7_bonus=0,
+    final_score=0,
+)
+
+
+def _build_breakdown(
+    number_cards_sum: int,
+    unique_count: int,
+    modifier_cards: tuple[ModifierCard, ...],
+) -> ScoreBreakdown:
+    """
+    Apply modifiers and the Flip 7 bonus to a number card total.
+
+    Args:
+        number_cards_sum: Sum of all number card values
+        unique_count: Number of distinct number card values
+        modifier_cards: Tuple of modifier cards in the player's tableau
+
+    Returns:
+        ScoreBreakdown with detailed intermediate values for each scoring step
+    """
+    # Step 2: Apply X2 multiplier if present
+    has_x2 = _X2_CARD in modifier_cards
+    after_x2_multiplier = number_cards_sum * 2 if has_x2 else number_cards_sum
+
+    # Step 3: Calculate and add all +N modifier bonuses
+    modifier_additions = calculate_modifier_sum(modifier_cards)
+    score_with_modifiers = after_x2_multiplier + modifier_additions
+
+    # Step 4: Check for Flip 7 bonus (exactly 7 unique number card values)
+    flip_7_bonus = FLIP_7_BONUS if unique_count == FLIP_7_THRESHOLD else 0
+    final_score = score_with_modifiers + flip_7_bonus
+
+    # Return detailed breakdown for debugging and display
+    return ScoreBreakdown(
+        number_cards_sum=number_cards_sum,
+        after_x2_multiplier=after_x2_multiplier,
+        modifier_additions=modifier_additions,
+        flip_7_bonus=flip_7_bonus,
+        final_score=final_score,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _score_kernel(value_mask: int, modifier_mask: int) -> ScoreBreakdown:
+    """
+    Score a hand of distinct cards, memoized on its number and modifier bitmasks.
+
+    Args:
+        value_mask: Bitmask of the number values held (see _value_mask)
+        modifier_mask: Bitmask of the modifier cards held (see _modifier_mask)
+
+    Returns:
+        ScoreBreakdown with detailed intermediate values for each scoring step
+    """
+    # Step 1: Sum all number card values (one card per set bit)
+    number_cards_sum = sum(
+        value for value in range(value_mask.bit_length()) if value_mask >> value & 1
+    )
+    modifier_cards = tuple(card for card, bit in _MODIFIER_BITS.items() if modifier_mask & bit)
+    return _build_breakdown(number_cards_sum, value_mask.bit_count(), modifier_cards)
 
 
 def calculate_score(tableau: PlayerTableau) -> ScoreBreakdown:
@@ -224,34 +354,22 @@ def calculate_score(tableau: PlayerTableau) -> ScoreBreakdown:
     """
     # Busted players always score 0, regardless of cards
     if tableau.is_busted:
-        return ScoreBreakdown(
-            number_cards_sum=0,
-            after_x2_multiplier=0,
-            modifier_additions=0,
-            flip_7_bonus=0,
-            final_score=0,
-        )
-
-    # Step 1: Sum all number card values
-    number_cards_sum = sum(card.value for card in tableau.number_cards)
-
-    # Step 2: Apply X2 multiplier if present
-    has_x2 = any(card.modifier == "X2" for card in tableau.modifier_cards)
-    after_x2_multiplier = number_cards_sum * 2 if has_x2 else number_cards_sum
-
-    # Step 3: Calculate and add all +N modifier bonuses
-    modifier_additions = calculate_modifier_sum(tableau.modifier_cards)
-    score_with_modifiers = after_x2_multiplier + modifier_additions
-
-    # Step 4: Check for Flip 7 bonus (exactly 7 unique number card values)
-    flip_7_bonus = FLIP_7_BONUS if has_flip_7(tableau.number_cards) else 0
-    final_score = score_with_modifiers + flip_7_bonus
-
-    # Return detailed breakdown for debugging and display
-    return ScoreBreakdown(
-        number_cards_sum=number_cards_sum,
-        after_x2_multiplier=after_x2_multiplier,
-        modifier_additions=modifier_additions,
-        flip_7_bonus=flip_7_bonus,
-        final_score=final_score,
+        return _BUSTED_BREAKDOWN
+
+    number_cards = tableau.number_cards
+    modifier_cards = tableau.modifier_cards
+    value_mask = _value_mask(number_cards)
+    modifier_mask = _modifier_mask(modifier_cards)
+    if (
+        value_mask.bit_count() == len(number_cards)
+        and modifier_mask.bit_count() == len(modifier_cards)
+    ):
+        return _score_kernel(value_mask, modifier_mask)
+
+    # Duplicate cards without a bust (only reachable by building a tableau by
+    # hand): the bitmasks lose the duplicates, so score the cards directly
+    return _build_breakdown(
+        sum(card.value for card in number_cards),
+        value_mask.bit_count(),
+        modifier_cards,
     )
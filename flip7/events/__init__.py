@@ -2,16 +2,21 @@
 
 This package provides a complete event logging system including:
 - JSON serialization/deserialization for events
-- JSONL file logging with crash safety
+- Batched JSONL file logging
 - Event replay engine for reconstructing game state
 """
 
-from flip7.events.event_serializer import serialize_event, deserialize_event
+from flip7.events.event_serializer import (
+    serialize_event,
+    serialize_event_bytes,
+    deserialize_event,
+)
 from flip7.events.event_logger import EventLogger
 from flip7.events.event_replay import load_events, replay_game
 
 __all__ = [
     "serialize_event",
+    "serialize_event_bytes",
     "deserialize_event",
     "EventLogger",
     "load_events",
@@ -1,24 +1,31 @@
 """JSONL (JSON Lines) event logging for game events.
 
 This module provides an EventLogger class that writes events to a JSONL file,
-with context manager support for proper resource management and crash safety.
+with context manager support for proper resource management. Events are
+buffered and written in batches, and any pending events are written when the
+logger exits, including on an exception.
+
 Also provides a NullEventLogger for performance-critical scenarios where logging
 is not needed.
 """
 
 from pathlib import Path
-from typing import Any, TextIO
+from typing import Any, BinaryIO
 
 from flip7.types.events import Event
-from flip7.events.event_serializer import serialize_event
+from flip7.events.event_serializer import serialize_event_bytes
+
+# Number of events buffered before they are written to the log file
+DEFAULT_FLUSH_EVERY = 256
 
 
 class EventLogger:
     """Writes game events to a JSONL (JSON Lines) file.
 
     The EventLogger appends events to a log file, with each event on its own line.
-    It supports context manager protocol for automatic file handling and ensures
-    data is flushed after each write for crash safety.
+    It supports context manager protocol for automatic file handling. Serialized
+    events are collected in a buffer and written with a single write and flush
+    every flush_every events, and when the context manager exits.
 
     Example:
         >>> from pathlib import Path
@@ -30,9 +37,10 @@ class EventLogger:
 
     Attributes:
         log_path: Path to the JSONL log file
+        flush_every: Number of events buffered between writes to the file
     """
 
-    def __init__(self, log_path: Path) -> None:
+    def __init__(self, log_path: Path, flush_every: int = DEFAULT_FLUSH_EVERY) -> None:
         """Initialize the EventLogger with a target log file path.
 
         The log file and its parent directories will be created when entering
@@ -40,9 +48,21 @@ class EventLogger:
 
         Args:
             log_path: Path where the JSONL log file will be written
+            flush_every: Number of events to buffer before writing them to the
+                         file (default: 256). Use 1 to write every event as
+                         soon as it is logged.
+
+        Raises:
+            ValueError: If flush_every is less than 1
         """
+        if flush_every < 1:
+            raise ValueError(f"flush_every must be at least 1, got {flush_every}")
+
         self.log_path = log_path
-        self._file: TextIO | None = None
+        self.flush_every = flush_every
+        self._file: BinaryIO | None = None
+        self._buffer = bytearray()
+        self._pending = 0
 
     def __enter__(self) -> "EventLogger":
         """Enter the context manager and open the log file for writing.
@@ -59,17 +79,18 @@ class EventLogger:
         # Create parent directories if they don't exist
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Open file in append mode with explicit UTF-8 encoding
-        self._file = self.log_path.open(mode='a', encoding='utf-8')
+        # Open file in binary append mode; events are serialized to UTF-8 bytes
+        self._file = self.log_path.open(mode='ab')
 
         return self
 
     def __exit__(self, exc_type: type[BaseException] | None,
                  exc_val: BaseException | None,
                  exc_tb: Any | None) -> None:
-        """Exit the context manager and close the log file.
+        """Exit the context manager, write any buffered events and close the log file.
 
-        Ensures the file is properly closed even if an exception occurred.
+        Ensures buffered events are written and the file is properly closed
+        even if an exception occurred.
 
         Args:
             exc_type: The exception type if an exception was raised
@@ -77,15 +98,18 @@ class EventLogger:
             exc_tb: The exception traceback if an exception was raised
         """
         if self._file is not None:
-            self._file.close()
-            self._file = None
+            try:
+                self.flush()
+            finally:
+                self._file.close()
+                self._file = None
 
     def log_event(self, event: Event) -> None:
         """Append an event to the log file as a JSON line.
 
-        Serializes the event to JSON and writes it to the file, followed by
-        a newline. Flushes the file buffer immediately to ensure the event is
-        persisted even if the program crashes.
+        Serializes the event to JSON, followed by a newline, into the
+        logger's buffer. The buffer is written to the file once flush_every
+        events have accumulated.
 
         Args:
             event: The Event object to log
@@ -104,12 +128,30 @@ class EventLogger:
                 "Use 'with EventLogger(path) as logger:' syntax."
             )
 
-        # Serialize event to JSON and write with newline
-        json_str = serialize_event(event)
-        self._file.write(json_str + '\n')
+        # Serialize event to a UTF-8 JSON line and buffer it
+        self._buffer += serialize_event_bytes(event, newline=True)
+        self._pending += 1
+
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered events to the log file and flush it.
 
-        # Flush immediately for crash safety
+        Called automatically every flush_every events and on exit; call it
+        directly to make logged events visible to readers of the file sooner.
+        Does nothing outside of the context manager.
+
+        Raises:
+            OSError: If the file write operation fails
+        """
+        if self._file is None or not self._buffer:
+            return
+
+        self._file.write(self._buffer)
         self._file.flush()
+        self._buffer.clear()
+        self._pending = 0
 
 
 class NullEventLogger:
@@ -138,3 +180,6 @@ class NullEventLogger:
     def log_event(self, event: Event) -> None:
         """Discard event without logging (no-op)."""
         pass
+
+    def flush(self) -> None:
+        """Nothing is buffered, so there is nothing to write (no-op)."""
@@ -2,16 +2,62 @@
 
 This module provides utilities to convert Event objects to and from JSON strings,
 handling special types like datetime, Card objects, and frozen dataclasses.
+
+When orjson is installed (the "fast" extra) it is used for encoding and
+decoding; otherwise the standard library json module is used. Both produce
+the same compact JSON, except that the standard library path escapes
+non-ASCII characters as it always has.
 """
 
 import json
 from datetime import datetime
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from flip7.types.cards import ActionCard, ActionType, Card, ModifierCard, NumberCard
 from flip7.types.events import Event
 
 
+def _encode_special(obj: Any) -> Any:
+    """Convert a datetime or Card object to a JSON-serializable value.
+
+    Args:
+        obj: The object to serialize
+
+    Returns:
+        An ISO 8601 string for datetimes, or a typed dictionary for cards
+
+    Raises:
+        TypeError: If the object type is not serializable
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+
+    if isinstance(obj, NumberCard):
+        return {
+            "_card_type": "NumberCard",
+            "value": obj.value,
+        }
+
+    if isinstance(obj, ActionCard):
+        return {
+            "_card_type": "ActionCard",
+            "action_type": obj.action_type.value,
+        }
+
+    if isinstance(obj, ModifierCard):
+        return {
+            "_card_type": "ModifierCard",
+            "modifier": obj.modifier,
+        }
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 class CardEncoder(json.JSONEncoder):
     """Custom JSON encoder that handles Card objects and datetime values.
 
@@ -33,28 +79,18 @@ class CardEncoder(json.JSONEncoder):
         Raises:
             TypeError: If the object type is not serializable
         """
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-
-        if isinstance(obj, NumberCard):
-            return {
-                "_card_type": "NumberCard",
-                "value": obj.value,
-            }
-
-        if isinstance(obj, ActionCard):
-            return {
-                "_card_type": "ActionCard",
-                "action_type": obj.action_type.value,
-            }
+        try:
+            return _encode_special(obj)
+        except TypeError:
+            return super().default(obj)
 
-        if isinstance(obj, ModifierCard):
-            return {
-                "_card_type": "ModifierCard",
-                "modifier": obj.modifier,
-            }
 
-        return super().default(obj)
+# Cards and datetimes go through _encode_special so both encoders agree
+_ORJSON_OPTIONS = (
+    0 if orjson is None
+    else orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+)
+_ORJSON_LINE_OPTIONS = 0 if orjson is None else _ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE
 
 
 def _decode_card(card_dict: dict[str, Any]) -> Card:
@@ -116,6 +152,39 @@ def _decode_event_data(data: dict[str, Any]) -> dict[str, Any]:
     return decoded
 
 
+def serialize_event_bytes(event: Event, newline: bool = False) -> bytes:
+    """Convert an Event object to UTF-8 encoded JSON.
+
+    Same output as serialize_event, as bytes, for writers that append to a
+    binary file.
+
+    Args:
+        event: The Event object to serialize
+        newline: Whether to end the output with a newline, ready to append as
+                 a JSONL line (default: False)
+
+    Returns:
+        The UTF-8 encoded JSON representation of the event
+    """
+    event_dict = {
+        "event_type": event.event_type,
+        "timestamp": event.timestamp,
+        "game_id": event.game_id,
+        "round_number": event.round_number,
+        "player_id": event.player_id,
+        "data": event.data,
+    }
+
+    if orjson is not None:
+        return orjson.dumps(
+            event_dict,
+            default=_encode_special,
+            option=_ORJSON_LINE_OPTIONS if newline else _ORJSON_OPTIONS,
+        )
+    encoded = json.dumps(event_dict, cls=CardEncoder, separators=(',', ':')).encode("utf-8")
+    return encoded + b'\n' if newline else encoded
+
+
 def serialize_event(event: Event) -> str:
     """Convert an Event object to a JSON string.
 
@@ -144,16 +213,7 @@ def serialize_event(event: Event) -> str:
         >>> "game_started" in json_str
         True
     """
-    event_dict = {
-        "event_type": event.event_type,
-        "timestamp": event.timestamp,
-        "game_id": event.game_id,
-        "round_number": event.round_number,
-        "player_id": event.player_id,
-        "data": event.data,
-    }
-
-    return json.dumps(event_dict, cls=CardEncoder, separators=(',', ':'))
+    return serialize_event_bytes(event).decode("utf-8")
 
 
 def deserialize_event(json_str: str) -> Event:
@@ -179,7 +239,7 @@ def deserialize_event(json_str: str) -> Event:
         >>> event.event_type
         'game_started'
     """
-    data = json.loads(json_str)
+    data = orjson.loads(json_str) if orjson is not None else json.loads(json_str)
 
     # Parse timestamp from ISO format
     timestamp = datetime.fromisoformat(data["timestamp"])
@@ -22,6 +22,10 @@ class TournamentConfig:
     """
     Configuration for a tournament.
 
+    Parameters are validated on construction. The output directory is only
+    created and checked by validate_output_directory(), which the orchestrator
+    calls before running, so building a config never touches the filesystem.
+
     Attributes:
         tournament_name: Unique identifier for this tournament
         players_per_game: Number of players in each game (2, 3, or 4)
@@ -75,12 +79,9 @@ class TournamentConfig:
                 "All bot classes must have unique names."
             )
 
-        # Validate output directory is writable
-        self._validate_output_directory()
-
-    def _validate_output_directory(self) -> None:
+    def validate_output_directory(self) -> None:
         """
-        Validate that the output directory is writable and has sufficient disk space.
+        Create the output directory and check it is writable with sufficient disk space.
 
         Raises:
             InvalidConfiguration: If directory cannot be created or is not writable
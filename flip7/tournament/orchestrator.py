@@ -73,14 +73,17 @@ class TournamentOrchestrator:
         Returns:
             TournamentResults with complete statistics
 
+        Raises:
+            InvalidConfiguration: If the output directory cannot be created or written
+
         Example:
             >>> config = TournamentConfig(...)
             >>> orchestrator = TournamentOrchestrator(config)
             >>> results = orchestrator.run_tournament()
             >>> print(f"Tournament complete: {results.total_matches} matches")
         """
-        # Create output directory
-        self.config.output_dir.mkdir(parents=True, exist_ok=True)
+        # Create the output directory, failing early if it cannot hold results
+        self.config.validate_output_directory()
 
         # Print tournament header
         self._print_tournament_header()
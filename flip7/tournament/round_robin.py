@@ -6,6 +6,7 @@ round-robin tournament with configurable player counts.
 """
 
 from itertools import combinations
+from math import comb
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -58,7 +59,8 @@ def count_matchups(num_bots: int, players_per_game: int) -> int:
     """
     Calculate the number of matchups for a round-robin tournament.
 
-    Uses the binomial coefficient: C(n, k) = n! / (k! * (n-k)!)
+    Uses the binomial coefficient: C(n, k) = n! / (k! * (n-k)!), computed with
+    math.comb rather than three full factorials.
 
     Args:
         num_bots: Total number of bots
@@ -79,7 +81,4 @@ def count_matchups(num_bots: int, players_per_game: int) -> int:
     if num_bots < players_per_game:
         return 0
 
-    # Calculate binomial coefficient
-    from math import factorial
-
-    return factorial(num_bots) // (factorial(players_per_game) * factorial(num_bots - players_per_game))
+    return comb(num_bots, players_per_game)
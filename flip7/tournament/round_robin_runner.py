@@ -6,9 +6,13 @@ plays the same number of games, and generates detailed head-to-head statistics.
 
 import random
 from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack
+from functools import partial
 from itertools import combinations
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
@@ -20,6 +24,83 @@ from flip7.types import Bot
 
 console = Console()
 
+# A played game: final scores in seat order, the winner's seat and rounds played
+GameOutcome = tuple[tuple[int, ...], int, int]
+
+# Games per matchup are split into about this many batches (more for load
+# balancing across workers), each capped at _MAX_GAMES_PER_BATCH games
+_BATCHES_PER_MATCHUP = 16
+_MAX_GAMES_PER_BATCH = 1_000
+
+
+def _play_games(
+    matchup: tuple[type[Any], ...],
+    repeat_nums: range,
+    game_num_offset: int,
+    tournament_seed: int | None,
+    bot_timeout_seconds: float,
+    log_dir: Path,
+    save_replays: bool,
+) -> list[GameOutcome]:
+    """Play a batch of games for one matchup.
+
+    This is a module-level function so ProcessPoolExecutor can pickle it; bot
+    instances are created here, in whichever process plays the games. Every
+    game gets fresh instances, so bot state never carries over between games
+    and results do not depend on how games are batched.
+
+    Args:
+        matchup: Bot classes in seat order
+        repeat_nums: Zero-based game numbers within the matchup to play
+        game_num_offset: Games played by earlier matchups, used for game seeds
+        tournament_seed: Random seed for reproducibility
+        bot_timeout_seconds: Timeout for bot decisions
+        log_dir: Directory for game event logs
+        save_replays: Whether to save game event logs
+
+    Returns:
+        The outcome of each game, in order
+    """
+    player_ids = [f"{bot_class.__name__}_{i}" for i, bot_class in enumerate(matchup)]
+    matchup_str = "_vs_".join([bc.__name__ for bc in matchup])
+
+    outcomes: list[GameOutcome] = []
+    for repeat_num in repeat_nums:
+        # Create bot instances
+        bots: dict[str, Any] = {}
+        for player_id, bot_class in zip(player_ids, matchup):
+            bots[player_id] = bot_class(bot_name=player_id)
+
+        game_id = f"{matchup_str}_{repeat_num + 1:03d}"
+
+        # Seed both the deck and the bots' random choices for this game
+        game_num = game_num_offset + repeat_num + 1
+        game_seed = (tournament_seed + game_num) if tournament_seed is not None else None
+        if game_seed is not None:
+            random.seed(game_seed)
+
+        engine = GameEngine(
+            game_id=game_id,
+            player_ids=player_ids,
+            bots=cast(dict[str, Bot], bots),
+            event_log_path=log_dir / f"{game_id}.jsonl",
+            seed=game_seed,
+            bot_timeout=bot_timeout_seconds,
+            enable_logging=save_replays,  # Only log if replays are requested
+        )
+
+        final_state = engine.execute_game()
+        if final_state.winner is None:
+            raise RuntimeError(f"Game {game_id} ended without a winner")
+
+        outcomes.append((
+            tuple(final_state.scores[player_id] for player_id in player_ids),
+            player_ids.index(final_state.winner),
+            final_state.current_round,
+        ))
+
+    return outcomes
+
 
 def run_round_robin_tournament(
     tournament_name: str,
@@ -30,10 +111,14 @@ def run_round_robin_tournament(
     output_dir: Path,
     save_replays: bool,
     tournament_seed: int | None,
+    max_workers: int | None = 1,
 ) -> dict[str, Any]:
     """Run a complete round-robin tournament.
 
-    Every unique matchup plays exactly `games_per_matchup` games.
+    Every unique matchup plays exactly `games_per_matchup` games. Games are
+    independent, so they are split into batches that can be played across
+    worker processes. Each seeded game also seeds the bots' random module, so
+    results for a given seed do not depend on how batches are distributed.
 
     Args:
         tournament_name: Name of the tournament
@@ -44,19 +129,15 @@ def run_round_robin_tournament(
         output_dir: Directory for output files
         save_replays: Whether to save game event logs
         tournament_seed: Random seed for reproducibility
+        max_workers: Number of worker processes (None uses every CPU). The
+            default of 1 plays every game in this process, which also works
+            for bot classes that cannot be pickled (e.g. built at runtime).
 
     Returns:
         Dictionary with tournament results including head-to-head matrix
     """
-    # Create output directories
+    # Create output directory
     output_dir.mkdir(exist_ok=True, parents=True)
-    if save_replays:
-        replays_dir = output_dir / "replays"
-        replays_dir.mkdir(exist_ok=True)
-
-    # Set random seed
-    if tournament_seed is not None:
-        random.seed(tournament_seed)
 
     # Generate all possible matchups
     if len(bot_classes) < players_per_game:
@@ -93,70 +174,86 @@ def run_round_robin_tournament(
         lambda: defaultdict(lambda: {"wins": 0, "losses": 0, "games": 0})
     )
 
+    # Event logs go to the replays directory, or a scratch directory when not saved
+    log_dir = output_dir / ("replays" if save_replays else ".tmp")
+    log_dir.mkdir(exist_ok=True, parents=True)
+
+    # Split every matchup's games into batches; each batch is one unit of work
+    batch_size = max(1, min(_MAX_GAMES_PER_BATCH, games_per_matchup // _BATCHES_PER_MATCHUP))
+    batches = [
+        (
+            matchup,
+            range(start, min(start + batch_size, games_per_matchup)),
+            matchup_index * games_per_matchup,
+        )
+        for matchup_index, matchup in enumerate(matchups)
+        for start in range(0, games_per_matchup, batch_size)
+    ]
+
+    # Plays one batch; a partial of a module-level function can be pickled
+    play = partial(
+        _play_games,
+        tournament_seed=tournament_seed,
+        bot_timeout_seconds=bot_timeout_seconds,
+        log_dir=log_dir,
+        save_replays=save_replays,
+    )
+
     # Run all matchups
     console.print(f"[bold cyan]Running {total_games} games...[/bold cyan]\n")
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TimeRemainingColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Playing games...", total=total_games)
-
-        game_num = 0
-        for matchup in matchups:
-            # Play games_per_matchup games for this matchup
-            for repeat_num in range(games_per_matchup):
-                game_num += 1
-
-                # Create bot instances
-                player_ids = [f"{bot_class.__name__}_{i}" for i, bot_class in enumerate(matchup)]
-                bots: dict[str, Any] = {}
-                for player_id, bot_class in zip(player_ids, matchup):
-                    bots[player_id] = bot_class(bot_name=player_id)
-
-                # Determine output path
-                matchup_str = "_vs_".join([bc.__name__ for bc in matchup])
-                game_id = f"{matchup_str}_{repeat_num + 1:03d}"
-                if save_replays:
-                    event_log_path = replays_dir / f"{game_id}.jsonl"
-                else:
-                    event_log_path = output_dir / ".tmp" / f"{game_id}.jsonl"
-                    event_log_path.parent.mkdir(exist_ok=True, parents=True)
-
-                # Run game
-                game_seed = (tournament_seed + game_num) if tournament_seed is not None else None
-                from typing import cast
-
-                engine = GameEngine(
-                    game_id=game_id,
-                    player_ids=player_ids,
-                    bots=cast(dict[str, Bot], bots),
-                    event_log_path=event_log_path,
-                    seed=game_seed,
-                    bot_timeout=bot_timeout_seconds,
-                    enable_logging=save_replays,  # Only log if replays are requested
+    with ExitStack() as stack:
+        if max_workers == 1:
+            # Play in this process, one batch at a time
+            outcomes: Iterator[tuple[tuple[type[Any], ...], list[GameOutcome]]] = (
+                (batch[0], play(*batch)) for batch in batches
+            )
+        else:
+            # Submit every batch before the progress display starts, so worker
+            # processes are forked before its refresh thread is running.
+            # Unseeded tournaments reseed each worker so forked workers do not
+            # share the parent's random stream.
+            executor = stack.enter_context(
+                ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=random.seed if tournament_seed is None else None,
                 )
+            )
+            matchup_by_future = {
+                executor.submit(play, *batch): batch[0]
+                for batch in batches
+            }
+            outcomes = (
+                (matchup_by_future[future], future.result())
+                for future in as_completed(matchup_by_future)
+            )
 
-                final_state = engine.execute_game()
+        progress = stack.enter_context(Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TimeRemainingColumn(),
+            console=console,
+        ))
+        task = progress.add_task("Playing games...", total=total_games)
 
-                # Extract bot names (remove _0, _1 suffixes)
-                bot_names = [player_id.rsplit("_", 1)[0] for player_id in player_ids]
+        for matchup, batch_outcomes in outcomes:
+            # Extract bot names (the classes' names, in seat order)
+            bot_names = [bot_class.__name__ for bot_class in matchup]
 
+            for scores, winner_seat, rounds in batch_outcomes:
                 # Update overall statistics
-                for player_id, bot_name in zip(player_ids, bot_names):
+                for seat, bot_name in enumerate(bot_names):
                     stats[bot_name]["games_played"] += 1
-                    stats[bot_name]["total_score"] += final_state.scores[player_id]
-                    stats[bot_name]["rounds_played"] += final_state.current_round
+                    stats[bot_name]["total_score"] += scores[seat]
+                    stats[bot_name]["rounds_played"] += rounds
 
-                    if final_state.winner == player_id:
+                    if seat == winner_seat:
                         stats[bot_name]["games_won"] += 1
 
                 # Update head-to-head statistics
-                winner_name = final_state.winner.rsplit("_", 1)[0]
+                winner_name = bot_names[winner_seat]
 
                 if players_per_game == 2:
                     # Direct head-to-head for 2-player games
@@ -181,7 +278,7 @@ def run_round_robin_tournament(
                                 else:
                                     head_to_head[bot_name][opponent_name]["losses"] += 1
 
-                progress.update(task, advance=1)
+            progress.update(task, advance=len(batch_outcomes))
 
     # Calculate derived statistics
     for bot_name in stats:
@@ -14,6 +14,7 @@ from flip7.types.errors import (
     GameRuleViolation,
     InvalidConfiguration,
     InvalidMove,
+    SandboxUnsupportedPlatformError,
 )
 from flip7.types.events import BotDecisionContext, Event, EventType
 from flip7.types.game_state import (
@@ -39,6 +40,7 @@ __all__ = [
     "GameRuleViolation",
     "InvalidConfiguration",
     "InvalidMove",
+    "SandboxUnsupportedPlatformError",
     # Events
     "Event",
     "EventType",
@@ -3,11 +3,19 @@ Card type hierarchy for Flipped Seven.
 
 This module defines all card types used in the game using frozen dataclasses
 for immutability. The type system enforces correct card usage at compile time.
+
+Cards are interned: constructing a card with a value from the game's finite set
+(numbers 0-12, the three action types, the six modifiers) returns a shared
+instance, so equal cards are also identical and decks hold references rather
+than fresh objects. Equality and hashing are therefore identity-based
+(eq=False), which avoids building field tuples on every comparison or hash.
+Each card defines its own __init__ that returns early for an interned
+instance, so constructing a card only sets its field the first time.
 """
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Literal
+from typing import Any, Literal, Self, cast, get_args
 
 
 class ActionType(Enum):
@@ -28,8 +36,13 @@ class ActionType(Enum):
 # Type alias for modifier card values
 ModifierType = Literal["+2", "+4", "+6", "+8", "+10", "X2"]
 
+# Interned card instances, keyed by the card's single field
+_NUMBER_CARDS: dict[int, "NumberCard"] = {}
+_ACTION_CARDS: dict[ActionType, "ActionCard"] = {}
+_MODIFIER_CARDS: dict[str, "ModifierCard"] = {}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class NumberCard:
     """
     A number card with a value from 0 to 12.
@@ -43,13 +56,25 @@ class NumberCard:
 
     value: int
 
-    def __post_init__(self) -> None:
-        """Validate that the card value is in the valid range."""
-        if not 0 <= self.value <= 12:
-            raise ValueError(f"NumberCard value must be 0-12, got {self.value}")
+    def __new__(cls, value: int) -> Self:
+        """Return the interned card for this value, or a new instance."""
+        card = _NUMBER_CARDS.get(value)
+        return cast(Self, card) if card is not None else object.__new__(cls)
+
+    def __init__(self, value: int) -> None:
+        """Set and validate the value, once; interned cards are already set."""
+        if hasattr(self, "value"):
+            return
+        if not 0 <= value <= 12:
+            raise ValueError(f"NumberCard value must be 0-12, got {value}")
+        object.__setattr__(self, "value", value)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Rebuild through the constructor so copies stay interned."""
+        return (NumberCard, (self.value,))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class ActionCard:
     """
     An action card that provides a special ability.
@@ -62,8 +87,25 @@ class ActionCard:
 
     action_type: ActionType
 
+    def __new__(cls, action_type: ActionType) -> Self:
+        """Return the interned card for this action type, or a new instance."""
+        card = _ACTION_CARDS.get(action_type)
+        return cast(Self, card) if card is not None else object.__new__(cls)
 
-@dataclass(frozen=True)
+    def __init__(self, action_type: ActionType) -> None:
+        """Set and validate the action type, once; interned cards are already set."""
+        if hasattr(self, "action_type"):
+            return
+        if not isinstance(action_type, ActionType):
+            raise TypeError(f"ActionCard action_type must be an ActionType, got {action_type!r}")
+        object.__setattr__(self, "action_type", action_type)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Rebuild through the constructor so copies stay interned."""
+        return (ActionCard, (self.action_type,))
+
+
+@dataclass(frozen=True, eq=False)
 class ModifierCard:
     """
     A modifier card that changes the value of number cards.
@@ -77,6 +119,30 @@ class ModifierCard:
 
     modifier: ModifierType
 
+    def __new__(cls, modifier: ModifierType) -> Self:
+        """Return the interned card for this modifier, or a new instance."""
+        card = _MODIFIER_CARDS.get(modifier)
+        return cast(Self, card) if card is not None else object.__new__(cls)
+
+    def __init__(self, modifier: ModifierType) -> None:
+        """Set and validate the modifier, once; interned cards are already set."""
+        if hasattr(self, "modifier"):
+            return
+        if modifier not in get_args(ModifierType):
+            raise ValueError(
+                f"ModifierCard modifier must be one of {get_args(ModifierType)}, got {modifier!r}"
+            )
+        object.__setattr__(self, "modifier", modifier)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Rebuild through the constructor so copies stay interned."""
+        return (ModifierCard, (self.modifier,))
+
+
+_NUMBER_CARDS.update({value: NumberCard(value) for value in range(13)})
+_ACTION_CARDS.update({action_type: ActionCard(action_type) for action_type in ActionType})
+_MODIFIER_CARDS.update({modifier: ModifierCard(modifier) for modifier in get_args(ModifierType)})
+
 
 # Union type representing any valid card in the game
 Card = NumberCard | ActionCard | ModifierCard
@@ -55,3 +55,22 @@ class InvalidConfiguration(Exception):
     """
 
     pass
+
+
+class SandboxUnsupportedPlatformError(RuntimeError):
+    """
+    Raised when bot sandboxing is attempted on a platform without SIGALRM.
+
+    The timeout system relies on Unix signal handling, so this is raised on
+    Windows. The platform and suggested workarounds are kept as attributes
+    so callers can report them without parsing the message.
+
+    Attributes:
+        platform: The value of sys.platform that was rejected
+        suggestions: Suggested ways to run the sandbox instead, most recommended first
+    """
+
+    def __init__(self, message: str, platform: str, suggestions: tuple[str, ...]) -> None:
+        super().__init__(message)
+        self.platform = platform
+        self.suggestions = suggestions
@@ -11,13 +11,15 @@ from dataclasses import dataclass
 from flip7.types.cards import Card, ModifierCard, NumberCard
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlayerTableau:
     """
     Represents a single player's cards and status during a round.
 
     The tableau tracks all cards a player has collected, along with their current
-    state in the round (active, busted, frozen, passed).
+    state in the round (active, busted, frozen, passed). It stays frozen because
+    bots receive the engine's tableaus directly in their decision context; slots
+    keep the per-update copies small.
 
     Attributes:
         player_id: Unique identifier for the player
@@ -40,7 +42,7 @@ class PlayerTableau:
     is_passed: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoundState:
     """
     Represents the complete state of a single round.
@@ -65,7 +67,7 @@ class RoundState:
     player_order: tuple[str, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameState:
     """
     Represents the complete state of a game across all rounds.
@@ -90,7 +92,7 @@ class GameState:
     winner: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScoreBreakdown:
     """
     Detailed breakdown of how a player's round score was calculated.
@@ -4,10 +4,12 @@ This module validates tournament configuration to catch errors early with
 helpful error messages before tournaments start.
 """
 
+import functools
 import os
 import sys
+from collections.abc import Hashable
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 
 class ConfigurationError(Exception):
@@ -15,139 +17,303 @@ class ConfigurationError(Exception):
     pass
 
 
+# Limits applied to the tournament configuration values
+MAX_GAMES_PER_MATCHUP: Final[int] = 100_000_000
+MIN_BOT_TIMEOUT_SECONDS: Final[float] = 0.01
+MAX_BOT_TIMEOUT_SECONDS: Final[float] = 300.0
+
+# Fixed framing around the collected errors in a ConfigurationError message
+_ERROR_HEADER: Final[str] = "Configuration validation failed:\n\n"
+_ERROR_FOOTER: Final[str] = "\n\nPlease fix these issues in tournament_config.py and try again."
+
+
+def _check_games_per_matchup(name: str, value: Any) -> str | None:
+    """Check a games-per-matchup setting.
+
+    Args:
+        name: The config variable name used in error messages
+        value: The configured value
+
+    Returns:
+        An error message, or None if the value is valid
+    """
+    if not isinstance(value, int):
+        return f"{name} must be an integer, got {type(value).__name__}"
+    if value <= 0:
+        return (
+            f"{name} must be > 0, got {value}\n"
+            "  Suggestion: Use at least 100 for testing, 1000+ for meaningful results"
+        )
+    if value > MAX_GAMES_PER_MATCHUP:
+        return (
+            f"{name} is very large ({value:,})\n"
+            "  This may take a very long time to run. Consider starting with 100,000-1,000,000."
+        )
+    return None
+
+
+def _check_bot_timeout(value: Any) -> str | None:
+    """Check the BOT_TIMEOUT_SECONDS setting.
+
+    Args:
+        value: The configured timeout in seconds
+
+    Returns:
+        An error message, or None if the value is valid
+    """
+    if not isinstance(value, (int, float)):
+        return f"BOT_TIMEOUT_SECONDS must be a number, got {type(value).__name__}"
+    if value <= 0:
+        return (
+            f"BOT_TIMEOUT_SECONDS must be > 0, got {value}\n"
+            "  Suggestion: Use 0.1-5.0 seconds (1.0 is typical)"
+        )
+    if value > MAX_BOT_TIMEOUT_SECONDS:
+        return (
+            f"BOT_TIMEOUT_SECONDS is very large ({value} seconds)\n"
+            "  Timeouts > 300 seconds (5 minutes) are unreasonable.\n"
+            "  Suggestion: Use 0.1-5.0 seconds (1.0 is typical)"
+        )
+    if value < MIN_BOT_TIMEOUT_SECONDS:
+        return (
+            f"BOT_TIMEOUT_SECONDS is very small ({value} seconds)\n"
+            "  Timeouts < 0.01 seconds may cause legitimate bots to timeout.\n"
+            "  Suggestion: Use at least 0.1 seconds"
+        )
+    return None
+
+
+def _check_max_workers(value: Any) -> str | None:
+    """Check the MAX_WORKERS setting.
+
+    Args:
+        value: The configured worker process count, or None for one per CPU
+
+    Returns:
+        An error message, or None if the value is valid
+    """
+    if value is None:
+        return None
+    if not isinstance(value, int) or isinstance(value, bool):
+        return f"MAX_WORKERS must be an integer or None, got {type(value).__name__}"
+    if value <= 0:
+        return (
+            f"MAX_WORKERS must be > 0, got {value}\n"
+            "  Suggestion: Use 1 to play games serially, or None for one worker per CPU"
+        )
+    return None
+
+
+def _check_output_dir(
+    name: str, value: Any, writable: dict[Path, bool] | None = None
+) -> str | None:
+    """Check that an output directory setting is a Path with a writable parent.
+
+    Creates the parent directory if it doesn't exist yet.
+
+    Args:
+        name: The config variable name used in error messages
+        value: The configured output directory
+        writable: Optional per-call memo of parent writability, so output
+                  directories sharing a parent are only checked once
+
+    Returns:
+        An error message, or None if the value is valid
+    """
+    if not isinstance(value, Path):
+        return (
+            f"{name} must be a Path object, got {type(value).__name__}\n"
+            f"  Use: {name} = Path('./your_directory')"
+        )
+
+    # Try to create parent directory if it doesn't exist
+    try:
+        value.parent.mkdir(parents=True, exist_ok=True)
+    except Exception as e:
+        return (
+            f"{name} parent directory cannot be created: {value.parent}\n"
+            f"  Error: {e}"
+        )
+
+    # Check if parent directory is writable
+    if writable is None:
+        writable = {}
+    if value.parent not in writable:
+        writable[value.parent] = os.access(value.parent, os.W_OK)
+    if not writable[value.parent]:
+        return (
+            f"{name} parent directory is not writable: {value.parent}\n"
+            f"  Check directory permissions or choose a different location"
+        )
+    return None
+
+
+def _parent_dir_state(path: Any) -> tuple[int, int] | None:
+    """Return a stat fingerprint of an output directory's parent.
+
+    Used to key the validation cache: the inode and ctime change when the
+    parent is recreated or its permissions or ownership change.
+
+    Args:
+        path: The configured output directory
+
+    Returns:
+        (inode, ctime_ns) of the parent, or None if it is not a Path or
+        the parent cannot be stat'ed
+    """
+    if not isinstance(path, Path):
+        return None
+    try:
+        st = path.parent.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_ctime_ns)
+
+
 def validate_tournament_config(
     games_per_matchup_h2h: int,
     games_per_matchup_all: int,
     bot_timeout_seconds: float,
     output_dir_h2h: Path,
     output_dir_all: Path,
+    max_workers: int | None = 1,
 ) -> None:
     """Validate tournament configuration parameters.
 
+    Every setting is checked in a single pass and all problems are reported
+    together in one ConfigurationError.
+
+    Successful validations are cached per argument tuple and per state of the
+    output directories' parents, so repeated calls in one process with the same
+    settings skip the checks. Failures are never cached.
+
     Args:
         games_per_matchup_h2h: Number of games for head-to-head matchups
         games_per_matchup_all: Number of games for all-vs-all matchups
         bot_timeout_seconds: Bot execution timeout in seconds
         output_dir_h2h: Output directory for head-to-head results
         output_dir_all: Output directory for all-vs-all results
+        max_workers: Worker processes for playing games (None = one per CPU)
 
     Raises:
         ConfigurationError: If any validation check fails with helpful message
     """
-    errors = []
+    args = (
+        games_per_matchup_h2h,
+        games_per_matchup_all,
+        bot_timeout_seconds,
+        output_dir_h2h,
+        output_dir_all,
+        max_workers,
+    )
+    h2h_state = _parent_dir_state(output_dir_h2h)
+    all_state = _parent_dir_state(output_dir_all)
 
-    # Validate GAMES_PER_MATCHUP_HEAD_TO_HEAD
-    if not isinstance(games_per_matchup_h2h, int):
-        errors.append(
-            f"GAMES_PER_MATCHUP_HEAD_TO_HEAD must be an integer, got {type(games_per_matchup_h2h).__name__}"
-        )
-    elif games_per_matchup_h2h <= 0:
-        errors.append(
-            f"GAMES_PER_MATCHUP_HEAD_TO_HEAD must be > 0, got {games_per_matchup_h2h}\n"
-            "  Suggestion: Use at least 100 for testing, 1000+ for meaningful results"
-        )
-    elif games_per_matchup_h2h > 100_000_000:
-        errors.append(
-            f"GAMES_PER_MATCHUP_HEAD_TO_HEAD is very large ({games_per_matchup_h2h:,})\n"
-            "  This may take a very long time to run. Consider starting with 100,000-1,000,000."
-        )
+    # Only cache when both parents exist and every argument can be a cache key
+    if h2h_state is None or all_state is None or not all(isinstance(a, Hashable) for a in args):
+        _validate_uncached(*args)
+        return
 
-    # Validate GAMES_PER_MATCHUP_ALL_VS_ALL
-    if not isinstance(games_per_matchup_all, int):
-        errors.append(
-            f"GAMES_PER_MATCHUP_ALL_VS_ALL must be an integer, got {type(games_per_matchup_all).__name__}"
-        )
-    elif games_per_matchup_all <= 0:
-        errors.append(
-            f"GAMES_PER_MATCHUP_ALL_VS_ALL must be > 0, got {games_per_matchup_all}\n"
-            "  Suggestion: Use at least 100 for testing, 1000+ for meaningful results"
-        )
-    elif games_per_matchup_all > 100_000_000:
-        errors.append(
-            f"GAMES_PER_MATCHUP_ALL_VS_ALL is very large ({games_per_matchup_all:,})\n"
-            "  This may take a very long time to run. Consider starting with 100,000-1,000,000."
-        )
+    _validate_cached(*args, h2h_state, all_state)
 
-    # Validate BOT_TIMEOUT_SECONDS
-    if not isinstance(bot_timeout_seconds, (int, float)):
-        errors.append(
-            f"BOT_TIMEOUT_SECONDS must be a number, got {type(bot_timeout_seconds).__name__}"
-        )
-    elif bot_timeout_seconds <= 0:
-        errors.append(
-            f"BOT_TIMEOUT_SECONDS must be > 0, got {bot_timeout_seconds}\n"
-            "  Suggestion: Use 0.1-5.0 seconds (1.0 is typical)"
-        )
-    elif bot_timeout_seconds > 300:
-        errors.append(
-            f"BOT_TIMEOUT_SECONDS is very large ({bot_timeout_seconds} seconds)\n"
-            "  Timeouts > 300 seconds (5 minutes) are unreasonable.\n"
-            "  Suggestion: Use 0.1-5.0 seconds (1.0 is typical)"
-        )
-    elif bot_timeout_seconds < 0.01:
-        errors.append(
-            f"BOT_TIMEOUT_SECONDS is very small ({bot_timeout_seconds} seconds)\n"
-            "  Timeouts < 0.01 seconds may cause legitimate bots to timeout.\n"
-            "  Suggestion: Use at least 0.1 seconds"
-        )
 
-    # Validate output directories are writable
-    for output_dir, name in [
-        (output_dir_h2h, "OUTPUT_DIR_HEAD_TO_HEAD"),
-        (output_dir_all, "OUTPUT_DIR_ALL_VS_ALL")
-    ]:
-        if not isinstance(output_dir, Path):
-            errors.append(
-                f"{name} must be a Path object, got {type(output_dir).__name__}\n"
-                f"  Use: {name} = Path('./your_directory')"
-            )
-            continue
-
-        # Try to create parent directory if it doesn't exist
-        try:
-            output_dir.parent.mkdir(parents=True, exist_ok=True)
-        except Exception as e:
-            errors.append(
-                f"{name} parent directory cannot be created: {output_dir.parent}\n"
-                f"  Error: {e}"
-            )
-            continue
-
-        # Check if parent directory is writable
-        if not os.access(output_dir.parent, os.W_OK):
-            errors.append(
-                f"{name} parent directory is not writable: {output_dir.parent}\n"
-                f"  Check directory permissions or choose a different location"
-            )
-
-    # Raise all errors together with clear formatting
+@functools.lru_cache(maxsize=8, typed=True)
+def _validate_cached(
+    games_per_matchup_h2h: int,
+    games_per_matchup_all: int,
+    bot_timeout_seconds: float,
+    output_dir_h2h: Path,
+    output_dir_all: Path,
+    max_workers: int | None,
+    h2h_state: tuple[int, int],
+    all_state: tuple[int, int],
+) -> None:
+    """Cached entry point for validate_tournament_config.
+
+    The parent directory states are part of the cache key only; they are not
+    used by the checks themselves.
+
+    Raises:
+        ConfigurationError: If any validation check fails
+    """
+    _validate_uncached(
+        games_per_matchup_h2h,
+        games_per_matchup_all,
+        bot_timeout_seconds,
+        output_dir_h2h,
+        output_dir_all,
+        max_workers,
+    )
+
+
+def _validate_uncached(
+    games_per_matchup_h2h: Any,
+    games_per_matchup_all: Any,
+    bot_timeout_seconds: Any,
+    output_dir_h2h: Any,
+    output_dir_all: Any,
+    max_workers: Any,
+) -> None:
+    """Run every configuration check and raise if any fail.
+
+    Raises:
+        ConfigurationError: If any validation check fails
+    """
+    writable: dict[Path, bool] = {}
+    checks = (
+        _check_games_per_matchup("GAMES_PER_MATCHUP_HEAD_TO_HEAD", games_per_matchup_h2h),
+        _check_games_per_matchup("GAMES_PER_MATCHUP_ALL_VS_ALL", games_per_matchup_all),
+        _check_bot_timeout(bot_timeout_seconds),
+        _check_max_workers(max_workers),
+        _check_output_dir("OUTPUT_DIR_HEAD_TO_HEAD", output_dir_h2h, writable),
+        _check_output_dir("OUTPUT_DIR_ALL_VS_ALL", output_dir_all, writable),
+    )
+    errors = [f"  ERROR: {error}" for error in checks if error is not None]
+
+    # Raise all errors together with clear formatting, built in a single join
     if errors:
-        error_message = "\n\n".join([
-            "Configuration validation failed:",
-            "",
-            *[f"  ERROR: {error}" for error in errors],
-            "",
-            "Please fix these issues in tournament_config.py and try again."
-        ])
-        raise ConfigurationError(error_message)
+        raise ConfigurationError("\n\n".join((
+            _ERROR_HEADER,
+            *errors,
+            _ERROR_FOOTER,
+        )))
+
+
+# Error raised on platforms without signal-based timeouts
+_WINDOWS_UNSUPPORTED_MESSAGE: Final[str] = (
+    "Windows is not supported for bot sandboxing.\n\n"
+    "The bot timeout system uses Unix signal handling (signal.SIGALRM) which is not available on Windows.\n\n"
+    "Solutions:\n"
+    "  1. Use WSL (Windows Subsystem for Linux) - Recommended\n"
+    "     - Install WSL: https://docs.microsoft.com/en-us/windows/wsl/install\n"
+    "     - Run the tournament from within WSL\n\n"
+    "  2. Use a Linux virtual machine or Docker container\n\n"
+    "  3. Run on a Linux or macOS system\n\n"
+    "For more information on signal limitations, see:\n"
+    "https://docs.python.org/3/library/signal.html#note-on-signal-handlers-and-exceptions"
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _is_supported_platform(platform: str) -> bool:
+    """Return whether a sys.platform value supports signal-based timeouts.
+
+    Args:
+        platform: A sys.platform string
+
+    Returns:
+        False for Windows platforms, True otherwise
+    """
+    return not platform.startswith('win')
 
 
 def check_platform_compatibility() -> None:
     """Check if the platform supports signal-based timeouts.
 
+    The result is cached per sys.platform value.
+
     Raises:
         ConfigurationError: If running on an unsupported platform (Windows)
     """
-    if sys.platform.startswith('win'):
-        raise ConfigurationError(
-            "Windows is not supported for bot sandboxing.\n\n"
-            "The bot timeout system uses Unix signal handling (signal.SIGALRM) which is not available on Windows.\n\n"
-            "Solutions:\n"
-            "  1. Use WSL (Windows Subsystem for Linux) - Recommended\n"
-            "     - Install WSL: https://docs.microsoft.com/en-us/windows/wsl/install\n"
-            "     - Run the tournament from within WSL\n\n"
-            "  2. Use a Linux virtual machine or Docker container\n\n"
-            "  3. Run on a Linux or macOS system\n\n"
-            "For more information on signal limitations, see:\n"
-            "https://docs.python.org/3/library/signal.html#note-on-signal-handlers-and-exceptions"
-        )
+    if not _is_supported_platform(sys.platform):
+        raise ConfigurationError(_WINDOWS_UNSUPPORTED_MESSAGE)
@@ -5,14 +5,29 @@ testing, and player-facing output. All functions use Rich tables, trees, and
 panels for attractive console output.
 """
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.tree import Tree
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
-from flip7.types.cards import ActionCard, Card, ModifierCard, NumberCard
+from flip7.types.cards import ActionCard, ActionType, Card, ModifierCard, NumberCard
 from flip7.types.game_state import GameState, PlayerTableau, ScoreBreakdown
 
+# Rich is imported inside the print_* functions so that importing this module
+# (e.g. through flip7.utils) does not pull in Rich for runs that never render.
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+# Precomputed labels for the thirteen number card values and each action type
+_NUMBER_LABELS: dict[int, str] = {value: f"[{value}]" for value in range(13)}
+_ACTION_LABELS: dict[ActionType, str] = {action: f"[{action.value}]" for action in ActionType}
+
+# Card formatters keyed by exact card type
+_CARD_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    NumberCard: lambda card: _NUMBER_LABELS[card.value],
+    ActionCard: lambda card: _ACTION_LABELS[card.action_type],
+    ModifierCard: lambda card: f"[{card.modifier}]",
+}
+
 
 def format_card(card: Card) -> str:
     """Convert a card to a human-readable string representation.
@@ -36,17 +51,13 @@ def format_card(card: Card) -> str:
         >>> format_card(ModifierCard("X2"))
         '[X2]'
     """
-    if isinstance(card, NumberCard):
-        return f"[{card.value}]"
-    elif isinstance(card, ActionCard):
-        return f"[{card.action_type.value}]"
-    elif isinstance(card, ModifierCard):
-        return f"[{card.modifier}]"
-    else:
+    formatter = _CARD_FORMATTERS.get(type(card))
+    if formatter is None:
         return str(card)
+    return formatter(card)
 
 
-def print_tableau(tableau: PlayerTableau, console: Console | None = None) -> None:
+def print_tableau(tableau: PlayerTableau, console: "Console | None" = None) -> None:
     """Print a player's tableau as a Rich table.
 
     Displays all cards in the tableau, organized by type, along with
@@ -65,6 +76,9 @@ def print_tableau(tableau: PlayerTableau, console: Console | None = None) -> Non
         ║ Status: Active                         ║
         ┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛
     """
+    from rich.console import Console
+    from rich.table import Table
+
     if console is None:
         console = Console()
 
@@ -106,7 +120,7 @@ def print_tableau(tableau: PlayerTableau, console: Console | None = None) -> Non
     console.print(table)
 
 
-def print_game_state(state: GameState, console: Console | None = None) -> None:
+def print_game_state(state: GameState, console: "Console | None" = None) -> None:
     """Print the complete game state as a Rich tree structure.
 
     Displays cumulative scores, current round, and game completion status
@@ -125,6 +139,9 @@ def print_game_state(state: GameState, console: Console | None = None) -> None:
             ├── player2: 98
             └── player3: 156
     """
+    from rich.console import Console
+    from rich.tree import Tree
+
     if console is None:
         console = Console()
 
@@ -154,7 +171,7 @@ def print_game_state(state: GameState, console: Console | None = None) -> None:
 def print_score_breakdown(
     breakdown: ScoreBreakdown,
     player_id: str | None = None,
-    console: Console | None = None
+    console: "Console | None" = None
 ) -> None:
     """Print a detailed score breakdown with Rich formatting.
 
@@ -178,6 +195,9 @@ def print_score_breakdown(
         │ FINAL SCORE:             55           │
         ╰───────────────────────────────────────╯
     """
+    from rich.console import Console
+    from rich.panel import Panel
+
     if console is None:
         console = Console()
 
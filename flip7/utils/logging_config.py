@@ -8,10 +8,11 @@ Supports both console and file logging.
 import logging
 import sys
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
-from rich.console import Console
-from rich.logging import RichHandler
+# RichHandler is imported inside setup_logging so plain logging never loads Rich
+if TYPE_CHECKING:
+    from rich.console import Console
 
 # Type alias for log levels
 LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -21,7 +22,7 @@ def setup_logging(
     level: str = "INFO",
     use_rich: bool = True,
     log_file: Path | str | None = None,
-    console: Console | None = None
+    console: "Console | None" = None
 ) -> None:
     """Configure the root logger with Rich handler and optional file output.
 
@@ -64,6 +65,8 @@ def setup_logging(
 
     # Create formatters
     if use_rich:
+        from rich.logging import RichHandler
+
         # Rich handler has its own formatting
         console_handler = RichHandler(
             console=console,
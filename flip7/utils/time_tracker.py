@@ -5,9 +5,9 @@ of operations, useful for performance analysis and optimization.
 """
 
 import logging
-import time
 from collections.abc import Generator
 from contextlib import contextmanager
+from time import perf_counter
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -69,7 +69,7 @@ class TimeTracker:
         Returns:
             Self for access to elapsed_time after completion
         """
-        self._start_time = time.perf_counter()
+        self._start_time = perf_counter()
         return self
 
     def __exit__(
@@ -86,7 +86,7 @@ class TimeTracker:
             exc_tb: Exception traceback if an exception occurred
         """
         if self._start_time is not None:
-            self.elapsed_time = time.perf_counter() - self._start_time
+            self.elapsed_time = perf_counter() - self._start_time
 
             if self.log_result:
                 if exc_type is not None:
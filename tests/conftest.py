@@ -0,0 +1,85 @@
+"""Shared pytest fixtures for the Flipped Seven test suite."""
+
+import copy
+from collections.abc import Callable
+
+import pytest
+
+from flip7.bots import BaseBot, RandomBot, ScaredyBot
+from flip7.core import GameEngine
+from flip7.events.event_logger import NullEventLogger
+from tests.stub_bots import DeterministicBot
+
+
+@pytest.fixture
+def event_logger() -> NullEventLogger:
+    """Provide an event logger that discards events, for tests that never read the log."""
+    return NullEventLogger()
+
+
+@pytest.fixture(scope="session")
+def random_bots() -> dict[str, RandomBot]:
+    """Provide RandomBots for players p1 and p2, shared across the session.
+
+    RandomBot keeps no per-game state, so one pair can serve every test.
+    """
+    return {pid: RandomBot(pid) for pid in ("p1", "p2")}
+
+
+@pytest.fixture(scope="module")
+def stub_bots() -> dict[str, DeterministicBot]:
+    """Provide pass-only DeterministicBots for p1 and p2 that target p1 first."""
+    return {pid: DeterministicBot(pid, first_target="p1") for pid in ("p1", "p2")}
+
+
+@pytest.fixture(scope="module")
+def make_game_engine(random_bots: dict[str, RandomBot]) -> Callable[[], GameEngine]:
+    """Provide a factory for fresh two-player GameEngines seeded with 42.
+
+    The engine (including its shuffled 94-card deck) is built once per module;
+    each call returns a deep copy that shares the bots but owns its deck,
+    discard pile and game state.
+    """
+    prototype = GameEngine(
+        game_id="test_game",
+        player_ids=["p1", "p2"],
+        bots=random_bots,
+        seed=42,
+    )
+    shared = {id(bot): bot for bot in random_bots.values()}
+
+    def make() -> GameEngine:
+        return copy.deepcopy(prototype, dict(shared))
+
+    return make
+
+
+# Games shared by read-only tests: id -> (seed, one bot class per player)
+_COMPLETED_GAMES: dict[str, tuple[int, tuple[type[BaseBot], ...]]] = {
+    "random-2p": (42, (RandomBot, RandomBot)),
+    "scaredy-2p": (111, (ScaredyBot, ScaredyBot)),
+    "mixed-3p": (456, (RandomBot, ScaredyBot, RandomBot)),
+    "mixed-4p": (444, (RandomBot, ScaredyBot, RandomBot, ScaredyBot)),
+}
+
+
+@pytest.fixture(scope="session", params=list(_COMPLETED_GAMES))
+def completed_game(request: pytest.FixtureRequest) -> GameEngine:
+    """Provide a GameEngine that has already played a full game to a winner.
+
+    Each game in _COMPLETED_GAMES is played once per session and shared by
+    every test that requests it, so those tests must only inspect the engine
+    and its final game_state. Tests that mutate an engine or need to see it
+    before execution should build their own.
+    """
+    seed, bot_classes = _COMPLETED_GAMES[request.param]
+    player_ids = [f"p{i}" for i in range(1, len(bot_classes) + 1)]
+    engine = GameEngine(
+        game_id=f"shared_{request.param}",
+        player_ids=player_ids,
+        bots={pid: cls(pid) for pid, cls in zip(player_ids, bot_classes)},
+        seed=seed,
+        enable_logging=False,
+    )
+    engine.execute_game()
+    return engine
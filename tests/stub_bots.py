@@ -0,0 +1,50 @@
+"""
+Deterministic bots for engine tests.
+
+These bots make fixed choices so tests that rig the deck can assert exact
+outcomes instead of allowing for whichever target a random bot picked.
+"""
+
+from typing import Literal
+
+from flip7.bots.base import BaseBot
+from flip7.types.cards import ActionType, NumberCard
+from flip7.types.events import BotDecisionContext
+
+
+class DeterministicBot(BaseBot):
+    """Bot whose every decision is fixed at construction time.
+
+    Attributes:
+        first_target: Preferred action target, used whenever it is eligible;
+                      otherwise the first eligible player is chosen
+        always_hit: Whether to hit (True) or pass (False) on every turn
+        use_second_chance: Whether to spend a Second Chance on a duplicate
+    """
+
+    def __init__(
+        self,
+        bot_name: str,
+        first_target: str | None = None,
+        always_hit: bool = False,
+        use_second_chance: bool = False,
+    ) -> None:
+        super().__init__(bot_name)
+        self.first_target = first_target
+        self.always_hit = always_hit
+        self.use_second_chance = use_second_chance
+
+    def decide_hit_or_pass(self, context: BotDecisionContext) -> Literal["hit", "pass"]:
+        return "hit" if self.always_hit else "pass"
+
+    def decide_use_second_chance(
+        self, context: BotDecisionContext, duplicate: NumberCard
+    ) -> bool:
+        return self.use_second_chance
+
+    def choose_action_target(
+        self, context: BotDecisionContext, action: ActionType, eligible: list[str]
+    ) -> str:
+        if self.first_target is not None and self.first_target in eligible:
+            return self.first_target
+        return eligible[0]
@@ -0,0 +1,48 @@
+"""
+Tableau factory for scoring tests.
+
+Scoring only looks at a tableau's cards and its busted flag, so tests build
+tableaus from card values on top of one shared, passed template.
+"""
+
+from collections.abc import Iterable
+from dataclasses import replace
+from typing import Any
+
+from flip7.types.cards import ModifierCard, ModifierType, NumberCard
+from flip7.types.game_state import PlayerTableau
+
+# Player p1 after passing with an empty hand
+_PASSED = PlayerTableau(
+    player_id="p1",
+    number_cards=(),
+    modifier_cards=(),
+    second_chance=False,
+    is_active=False,
+    is_busted=False,
+    is_frozen=False,
+    is_passed=True,
+)
+
+
+def make_tableau(
+    numbers: Iterable[int] = (),
+    modifiers: Iterable[ModifierType] = (),
+    **flags: Any,
+) -> PlayerTableau:
+    """Build p1's tableau holding the given cards, passed unless flags say otherwise.
+
+    Args:
+        numbers: Values of the number cards, in order
+        modifiers: Modifier card values, in order
+        **flags: PlayerTableau state flags to override (e.g. is_busted=True)
+
+    Returns:
+        Tableau with the interned cards for the given values
+    """
+    return replace(
+        _PASSED,
+        number_cards=tuple(map(NumberCard, numbers)),
+        modifier_cards=tuple(map(ModifierCard, modifiers)),
+        **flags,
+    )
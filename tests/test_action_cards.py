@@ -8,14 +8,15 @@ Tests the three action cards:
 """
 
 import pytest
+from dataclasses import replace
 from pathlib import Path
 from flip7.core import RoundEngine
+from flip7.core.deck import build_seeded_deck
 from flip7.events.event_logger import EventLogger
 from flip7.bots import RandomBot, ScaredyBot
-from flip7.types.cards import ActionCard, NumberCard
 
 
-def test_second_chance_prevents_bust():
+def test_second_chance_prevents_bust(tmp_path: Path):
     """Test that Second Chance can prevent a bust."""
     # This is more of an integration test - we'd need to set up a specific
     # game state where a player has Second Chance and draws a duplicate
@@ -27,10 +28,9 @@ def test_second_chance_prevents_bust():
         "p2": ScaredyBot("p2"),
     }
 
-    with EventLogger(Path("/tmp/test_second_chance.jsonl")) as logger:
+    with EventLogger(tmp_path / "events.jsonl") as logger:
         # Create a fresh deck for this round
-        from flip7.core.deck import create_deck, shuffle_deck
-        deck = shuffle_deck(create_deck(), seed=42)
+        deck = list(build_seeded_deck(42))
         discard = []
 
         engine = RoundEngine(
@@ -51,7 +51,7 @@ def test_second_chance_prevents_bust():
         assert all(isinstance(s, int) for s in scores.values())
 
 
-def test_freeze_ends_turn():
+def test_freeze_ends_turn(tmp_path: Path):
     """Test that Freeze action ends target player's turn."""
     player_ids = ["p1", "p2"]
     bots = {
@@ -59,9 +59,8 @@ def test_freeze_ends_turn():
         "p2": ScaredyBot("p2"),
     }
 
-    with EventLogger(Path("/tmp/test_freeze.jsonl")) as logger:
-        from flip7.core.deck import create_deck, shuffle_deck
-        deck = shuffle_deck(create_deck(), seed=123)
+    with EventLogger(tmp_path / "events.jsonl") as logger:
+        deck = list(build_seeded_deck(123))
         discard = []
 
         engine = RoundEngine(
@@ -82,7 +81,7 @@ def test_freeze_ends_turn():
         assert len(scores) == 2
 
 
-def test_flip_three_draws_three_cards():
+def test_flip_three_draws_three_cards(tmp_path: Path):
     """Test that Flip Three causes target to draw exactly 3 cards (unless bust/Flip 7)."""
     player_ids = ["p1", "p2"]
     bots = {
@@ -90,9 +89,8 @@ def test_flip_three_draws_three_cards():
         "p2": RandomBot("p2"),
     }
 
-    with EventLogger(Path("/tmp/test_flip_three.jsonl")) as logger:
-        from flip7.core.deck import create_deck, shuffle_deck
-        deck = shuffle_deck(create_deck(), seed=999)
+    with EventLogger(tmp_path / "events.jsonl") as logger:
+        deck = list(build_seeded_deck(999))
         discard = []
 
         engine = RoundEngine(
@@ -112,7 +110,7 @@ def test_flip_three_draws_three_cards():
         assert len(scores) == 2
 
 
-def test_second_chance_discarded_at_round_end():
+def test_second_chance_discarded_at_round_end(tmp_path: Path):
     """Test that Second Chance cards are discarded at end of round."""
     # This is verified by the _cleanup_tableaus logic
     # Second Chance is a boolean flag, not a physical card in our implementation
@@ -121,9 +119,8 @@ def test_second_chance_discarded_at_round_end():
     player_ids = ["p1"]
     bots = {"p1": RandomBot("p1")}
 
-    with EventLogger(Path("/tmp/test_sc_discard.jsonl")) as logger:
-        from flip7.core.deck import create_deck, shuffle_deck
-        deck = shuffle_deck(create_deck(), seed=42)
+    with EventLogger(tmp_path / "events.jsonl") as logger:
+        deck = list(build_seeded_deck(42))
         discard = []
 
         engine = RoundEngine(
@@ -138,7 +135,6 @@ def test_second_chance_discarded_at_round_end():
         )
 
         # Manually give player Second Chance
-        from dataclasses import replace
         engine.tableaus["p1"] = replace(
             engine.tableaus["p1"],
             second_chance=True
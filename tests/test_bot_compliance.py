@@ -61,6 +61,17 @@ def discover_bot_classes() -> list[Type[BaseBot]]:
 # Discover all bots at module load time
 ALL_BOT_CLASSES = discover_bot_classes()
 
+# Eligible target lists shared by the action target tests. Bots receive a fresh
+# list copy (per the Bot protocol) and results are checked against the frozensets.
+_ELIGIBLE_TWO = ("opponent", "test_bot")
+_ELIGIBLE_SELF_FIRST = ("test_bot", "opponent")
+_ELIGIBLE_THREE = ("opponent", "player2", "player3")
+_ELIGIBLE_PAIR = ("opponent", "player2")
+
+_ELIGIBLE_TWO_SET = frozenset(_ELIGIBLE_TWO)
+_ELIGIBLE_THREE_SET = frozenset(_ELIGIBLE_THREE)
+_ELIGIBLE_PAIR_SET = frozenset(_ELIGIBLE_PAIR)
+
 
 @pytest.fixture(params=ALL_BOT_CLASSES, ids=lambda cls: cls.__name__)
 def bot_class(request) -> Type[BaseBot]:
@@ -281,44 +292,38 @@ def test_decide_use_second_chance_with_good_hand(bot_instance: BaseBot, sample_c
 
 def test_choose_action_target_returns_valid_player(bot_instance: BaseBot, sample_context: BotDecisionContext):
     """Test that bot chooses a valid target from eligible list."""
-    eligible = ["opponent", "test_bot"]
-    target = bot_instance.choose_action_target(sample_context, ActionType.FREEZE, eligible)
-    assert target in eligible, f"Bot must choose from eligible targets, got {target!r}"
+    target = bot_instance.choose_action_target(sample_context, ActionType.FREEZE, list(_ELIGIBLE_TWO))
+    assert target in _ELIGIBLE_TWO_SET, f"Bot must choose from eligible targets, got {target!r}"
 
 
 def test_choose_action_target_single_eligible(bot_instance: BaseBot, sample_context: BotDecisionContext):
     """Test target selection when only one eligible target exists."""
-    eligible = ["opponent"]
-    target = bot_instance.choose_action_target(sample_context, ActionType.FREEZE, eligible)
+    target = bot_instance.choose_action_target(sample_context, ActionType.FREEZE, ["opponent"])
     assert target == "opponent", "Bot must choose the only eligible target"
 
 
 def test_choose_action_target_can_target_self(bot_instance: BaseBot, sample_context: BotDecisionContext):
     """Test that bot can target itself when in eligible list."""
-    eligible = ["test_bot", "opponent"]
-    target = bot_instance.choose_action_target(sample_context, ActionType.FLIP_THREE, eligible)
-    assert target in eligible, "Bot must choose valid target (can include self)"
+    target = bot_instance.choose_action_target(sample_context, ActionType.FLIP_THREE, list(_ELIGIBLE_SELF_FIRST))
+    assert target in _ELIGIBLE_TWO_SET, "Bot must choose valid target (can include self)"
 
 
 def test_choose_action_target_freeze(bot_instance: BaseBot, sample_context: BotDecisionContext):
     """Test target selection for FREEZE action."""
-    eligible = ["opponent", "player2", "player3"]
-    target = bot_instance.choose_action_target(sample_context, ActionType.FREEZE, eligible)
-    assert target in eligible, "Bot must choose valid FREEZE target"
+    target = bot_instance.choose_action_target(sample_context, ActionType.FREEZE, list(_ELIGIBLE_THREE))
+    assert target in _ELIGIBLE_THREE_SET, "Bot must choose valid FREEZE target"
 
 
 def test_choose_action_target_flip_three(bot_instance: BaseBot, sample_context: BotDecisionContext):
     """Test target selection for FLIP_THREE action."""
-    eligible = ["opponent", "test_bot"]
-    target = bot_instance.choose_action_target(sample_context, ActionType.FLIP_THREE, eligible)
-    assert target in eligible, "Bot must choose valid FLIP_THREE target"
+    target = bot_instance.choose_action_target(sample_context, ActionType.FLIP_THREE, list(_ELIGIBLE_TWO))
+    assert target in _ELIGIBLE_TWO_SET, "Bot must choose valid FLIP_THREE target"
 
 
 def test_choose_action_target_second_chance(bot_instance: BaseBot, sample_context: BotDecisionContext):
     """Test target selection for SECOND_CHANCE action."""
-    eligible = ["opponent", "player2"]
-    target = bot_instance.choose_action_target(sample_context, ActionType.SECOND_CHANCE, eligible)
-    assert target in eligible, "Bot must choose valid SECOND_CHANCE target"
+    target = bot_instance.choose_action_target(sample_context, ActionType.SECOND_CHANCE, list(_ELIGIBLE_PAIR))
+    assert target in _ELIGIBLE_PAIR_SET, "Bot must choose valid SECOND_CHANCE target"
 
 
 # ============================================================================
@@ -436,13 +441,13 @@ def test_bot_compliance_summary(bot_class: Type[BaseBot]):
 
 def test_bot_discovery_finds_bots():
     """Test that bot discovery finds at least the known bots."""
-    bot_names = [cls.__name__ for cls in ALL_BOT_CLASSES]
+    bot_names = frozenset(cls.__name__ for cls in ALL_BOT_CLASSES)
 
     # We should at least find RandomBot and ScaredyBot
     assert "RandomBot" in bot_names, "Should discover RandomBot"
     assert "ScaredyBot" in bot_names, "Should discover ScaredyBot"
 
-    print(f"\nDiscovered {len(ALL_BOT_CLASSES)} bot(s): {', '.join(bot_names)}")
+    print(f"\nDiscovered {len(ALL_BOT_CLASSES)} bot(s): {', '.join(sorted(bot_names))}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,143 @@
+"""
+Tests for bot timeout handling in the round engine.
+
+Per the tournament rules:
+- A bot that exceeds its time limit on a hit/pass decision busts for the round
+- The other players keep playing normally
+
+These tests cap the turn cycle with max_turns so the round stops shortly after
+the timeout is observed instead of playing out the rest of the deck.
+"""
+
+import signal
+import time
+from pathlib import Path
+from typing import Literal
+from unittest.mock import patch
+
+import pytest
+
+from flip7.bots import ScaredyBot
+from flip7.bots.base import BaseBot
+from flip7.bots.sandbox import execute_with_sandbox
+from flip7.core.round_engine import RoundEngine
+from flip7.events.event_logger import EventLogger
+from flip7.types.cards import ActionType, NumberCard
+from flip7.types.events import BotDecisionContext
+
+
+class SlowBot(BaseBot):
+    """Bot that always takes longer than the timeout to decide hit or pass."""
+
+    def decide_hit_or_pass(self, context: BotDecisionContext) -> Literal["hit", "pass"]:
+        time.sleep(1.0)
+        return "hit"
+
+    def decide_use_second_chance(
+        self, context: BotDecisionContext, duplicate: NumberCard
+    ) -> bool:
+        return True
+
+    def choose_action_target(
+        self, context: BotDecisionContext, action: ActionType, eligible: list[str]
+    ) -> str:
+        return eligible[0]
+
+
+class AlwaysHitBot(BaseBot):
+    """Bot that always hits."""
+
+    def decide_hit_or_pass(self, context: BotDecisionContext) -> Literal["hit", "pass"]:
+        return "hit"
+
+    def decide_use_second_chance(
+        self, context: BotDecisionContext, duplicate: NumberCard
+    ) -> bool:
+        return False
+
+    def choose_action_target(
+        self, context: BotDecisionContext, action: ActionType, eligible: list[str]
+    ) -> str:
+        return eligible[0]
+
+
+def test_bot_timeout_on_hit_pass_causes_bust(tmp_path: Path):
+    """Test that a bot timing out on hit/pass busts while the other player finishes."""
+    player_ids = ["slow", "normal"]
+    bots = {
+        "slow": SlowBot("slow"),
+        "normal": ScaredyBot("normal"),
+    }
+
+    deck = [NumberCard(i) for i in range(1, 13)]
+    discard: list = []
+
+    with EventLogger(tmp_path / "events.jsonl") as logger:
+        engine = RoundEngine(
+            player_ids=player_ids,
+            bots=bots,
+            event_logger=logger,
+            deck=deck,
+            discard_pile=discard,
+            seed=42,
+            bot_timeout=0.05,
+            max_turns=10,
+        )
+
+        scores = engine.execute_round()
+
+    assert engine.tableaus["slow"].is_busted, "Timed out player should be busted"
+    assert scores["slow"] == 0, "Timed out player should score 0"
+
+    assert not engine.tableaus["normal"].is_active, "Normal player should finish the round"
+    assert not engine.tableaus["normal"].is_busted, "Normal player should not bust on unique cards"
+
+
+def test_max_turns_passes_remaining_players(tmp_path: Path):
+    """Test that reaching max_turns passes every player who is still active."""
+    player_ids = ["p1", "p2"]
+    bots = {
+        "p1": AlwaysHitBot("p1"),
+        "p2": AlwaysHitBot("p2"),
+    }
+
+    deck = [NumberCard(i) for i in range(1, 13)]
+    discard: list = []
+
+    with EventLogger(tmp_path / "events.jsonl") as logger:
+        engine = RoundEngine(
+            player_ids=player_ids,
+            bots=bots,
+            event_logger=logger,
+            deck=deck,
+            discard_pile=discard,
+            seed=42,
+            max_turns=2,
+        )
+
+        scores = engine.execute_round()
+
+    # Initial deal gives p1 [1] and p2 [2], then one hit each gives [3] and [4]
+    for player_id in player_ids:
+        tableau = engine.tableaus[player_id]
+        assert tableau.is_passed, f"{player_id} should be passed once max_turns is reached"
+        assert not tableau.is_active
+        assert len(tableau.number_cards) == 2
+
+    assert scores == {"p1": 4, "p2": 6}
+    assert len(engine.deck) == 8, "Only the dealt and hit cards should be drawn"
+
+
+def test_zero_timeout_skips_signal_setup():
+    """Test that a zero timeout runs the function without touching SIGALRM."""
+    with patch.object(signal, "setitimer") as setitimer, \
+            patch.object(signal, "signal") as set_handler:
+        result = execute_with_sandbox("TestBot", 0, lambda x: x * 2, 21)
+
+    assert result == 42
+    setitimer.assert_not_called()
+    set_handler.assert_not_called()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
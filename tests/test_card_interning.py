@@ -0,0 +1,73 @@
+"""
+Tests for card interning.
+
+Cards from the game's finite set are shared instances: constructing the same
+card twice returns the same object, and copying or pickling a card keeps it
+interned.
+"""
+
+import copy
+import pickle
+
+import pytest
+
+from flip7.core.deck import create_deck
+from flip7.types.cards import ActionCard, ActionType, ModifierCard, NumberCard
+
+
+def test_equal_cards_are_identical():
+    """Test that constructing the same card twice returns the same instance."""
+    assert NumberCard(7) is NumberCard(7)
+    assert ActionCard(ActionType.FREEZE) is ActionCard(ActionType.FREEZE)
+    assert ModifierCard("X2") is ModifierCard("X2")
+    assert NumberCard(7) is not NumberCard(8)
+
+
+def test_equality_and_hash_are_identity_based():
+    """Test that cards compare and hash by identity, which interning makes exact."""
+    for cls in (NumberCard, ActionCard, ModifierCard):
+        assert cls.__eq__ is object.__eq__
+        assert cls.__hash__ is object.__hash__
+    assert NumberCard(3) == NumberCard(3)
+    assert len({NumberCard(3), NumberCard(3), NumberCard(4)}) == 2
+    assert (NumberCard(1), ModifierCard("+2")) == (NumberCard(1), ModifierCard("+2"))
+
+
+def test_deck_cards_are_interned():
+    """Test that every card in a fresh deck is a pooled instance."""
+    deck = create_deck()
+    assert len({id(card) for card in deck}) == len(set(deck))
+
+
+def test_copy_and_pickle_preserve_identity():
+    """Test that copies and pickle round-trips return the interned card."""
+    for card in (NumberCard(0), ActionCard(ActionType.SECOND_CHANCE), ModifierCard("+10")):
+        assert copy.copy(card) is card
+        assert copy.deepcopy(card) is card
+        assert pickle.loads(pickle.dumps(card)) is card
+
+
+def test_reinitializing_interned_card_keeps_its_value():
+    """Test that running __init__ again on an interned card cannot change it."""
+    card = NumberCard(5)
+    card.__init__(6)  # type: ignore[misc]
+    assert card.value == 5
+    assert NumberCard(5) is card
+
+
+def test_invalid_number_card_still_rejected():
+    """Test that values outside 0-12 are still rejected."""
+    with pytest.raises(ValueError):
+        NumberCard(13)
+
+
+def test_unknown_action_and_modifier_cards_rejected():
+    """Test that only the game's action types and modifiers can become cards."""
+    with pytest.raises(ValueError, match="ModifierCard modifier must be one of"):
+        ModifierCard("+3")  # type: ignore[arg-type]
+    with pytest.raises(TypeError, match="ActionCard action_type must be an ActionType"):
+        ActionCard("FREEZE")  # type: ignore[arg-type]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,7 +1,6 @@
 """Tests for CLI integration with configuration validation."""
 
 import sys
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
@@ -10,127 +9,134 @@ from click.testing import CliRunner
 
 from flip7.cli.main import cli
 
-
-class TestCLIValidation:
-    """Tests for CLI configuration validation integration."""
-
-    def test_cli_checks_platform_on_windows(self, tmp_path: Path) -> None:
-        """Test that CLI checks platform compatibility before loading config."""
-        # Create a valid tournament_config.py
-        config_file = tmp_path / "tournament_config.py"
-        config_file.write_text("""
+# Base tournament_config.py; each test fills in the settings it exercises
+_CONFIG_TEMPLATE = """
 from pathlib import Path
 
 TOURNAMENT_NAME = "Test"
-GAMES_PER_MATCHUP_HEAD_TO_HEAD = 100
-GAMES_PER_MATCHUP_ALL_VS_ALL = 100
-BOT_TIMEOUT_SECONDS = 1.0
-OUTPUT_DIR_HEAD_TO_HEAD = Path("./h2h")
+GAMES_PER_MATCHUP_HEAD_TO_HEAD = {games_h2h}
+GAMES_PER_MATCHUP_ALL_VS_ALL = {games_all}
+BOT_TIMEOUT_SECONDS = {timeout}
+OUTPUT_DIR_HEAD_TO_HEAD = {output_h2h}
 OUTPUT_DIR_ALL_VS_ALL = Path("./all")
 SAVE_REPLAYS = False
 TOURNAMENT_SEED = 42
-""")
+"""
 
-        runner = CliRunner()
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Write config to current directory
-            (Path.cwd() / "tournament_config.py").write_text(config_file.read_text())
 
-            # Mock Windows platform
-            with patch.object(sys, 'platform', 'win32'):
-                result = runner.invoke(cli, [])
+def _write_config(
+    directory: Path,
+    games_h2h: int = 1000,
+    games_all: int = 1000,
+    timeout: float = 1.0,
+    output_h2h: str = 'Path("./h2h")',
+) -> None:
+    """Write a tournament_config.py built from the shared template."""
+    (directory / "tournament_config.py").write_text(_CONFIG_TEMPLATE.format(
+        games_h2h=games_h2h,
+        games_all=games_all,
+        timeout=timeout,
+        output_h2h=output_h2h,
+    ))
 
-                # Should fail with platform error
-                assert result.exit_code != 0
-                assert "Windows is not supported" in result.output
-                assert "WSL" in result.output
 
-    def test_cli_validates_config_before_running(self, tmp_path: Path) -> None:
-        """Test that CLI validates configuration before starting tournament."""
-        # Create an INVALID tournament_config.py (zero games)
-        config_file = tmp_path / "tournament_config.py"
-        config_file.write_text("""
-from pathlib import Path
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """Share one CliRunner across the tests in this module."""
+    return CliRunner()
 
-TOURNAMENT_NAME = "Test"
-GAMES_PER_MATCHUP_HEAD_TO_HEAD = 0  # INVALID!
-GAMES_PER_MATCHUP_ALL_VS_ALL = 1000
-BOT_TIMEOUT_SECONDS = 1.0
-OUTPUT_DIR_HEAD_TO_HEAD = Path("./h2h")
-OUTPUT_DIR_ALL_VS_ALL = Path("./all")
-SAVE_REPLAYS = False
-TOURNAMENT_SEED = 42
-""")
 
-        runner = CliRunner()
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Write config to current directory
-            (Path.cwd() / "tournament_config.py").write_text(config_file.read_text())
+class TestCLIValidation:
+    """Tests for CLI configuration validation integration."""
+
+    def test_cli_checks_platform_on_windows(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that CLI checks platform compatibility before loading config."""
+        # Create a valid tournament_config.py in the working directory
+        monkeypatch.chdir(tmp_path)
+        _write_config(tmp_path, games_h2h=100, games_all=100)
 
-            # Run CLI (should fail validation before starting tournament)
+        # Mock Windows platform
+        with patch.object(sys, 'platform', 'win32'):
             result = runner.invoke(cli, [])
 
-            # Should fail with validation error
+            # Should fail with platform error
             assert result.exit_code != 0
-            assert "GAMES_PER_MATCHUP_HEAD_TO_HEAD must be > 0" in result.output
-            assert "Configuration validation failed" in result.output
+            assert "Windows is not supported" in result.output
+            assert "WSL" in result.output
 
-    def test_cli_validates_timeout_range(self, tmp_path: Path) -> None:
-        """Test that CLI validates timeout is in reasonable range."""
-        # Create an INVALID tournament_config.py (unreasonable timeout)
-        config_file = tmp_path / "tournament_config.py"
-        config_file.write_text("""
-from pathlib import Path
+    def test_cli_validates_config_before_running(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that CLI validates configuration before starting tournament."""
+        # Create an INVALID tournament_config.py (zero games) in the working directory
+        monkeypatch.chdir(tmp_path)
+        _write_config(tmp_path, games_h2h=0)  # INVALID!
 
-TOURNAMENT_NAME = "Test"
-GAMES_PER_MATCHUP_HEAD_TO_HEAD = 1000
-GAMES_PER_MATCHUP_ALL_VS_ALL = 1000
-BOT_TIMEOUT_SECONDS = 500.0  # INVALID! Too large
-OUTPUT_DIR_HEAD_TO_HEAD = Path("./h2h")
-OUTPUT_DIR_ALL_VS_ALL = Path("./all")
-SAVE_REPLAYS = False
-TOURNAMENT_SEED = 42
-""")
+        # Run CLI (should fail validation before starting tournament)
+        result = runner.invoke(cli, [])
 
-        runner = CliRunner()
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Write config to current directory
-            (Path.cwd() / "tournament_config.py").write_text(config_file.read_text())
+        # Should fail with validation error
+        assert result.exit_code != 0
+        assert "GAMES_PER_MATCHUP_HEAD_TO_HEAD must be > 0" in result.output
+        assert "Configuration validation failed" in result.output
 
-            # Run CLI (should fail validation)
-            result = runner.invoke(cli, [])
+    def test_cli_validates_timeout_range(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that CLI validates timeout is in reasonable range."""
+        # Create an INVALID tournament_config.py (unreasonable timeout) in the working directory
+        monkeypatch.chdir(tmp_path)
+        _write_config(tmp_path, timeout=500.0)  # INVALID! Too large
+
+        # Run CLI (should fail validation)
+        result = runner.invoke(cli, [])
+
+        # Should fail with validation error
+        assert result.exit_code != 0
+        assert "BOT_TIMEOUT_SECONDS" in result.output
+        assert "very large" in result.output.lower()
+        assert "unreasonable" in result.output.lower()
+
+    def test_cli_validates_output_directories(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that CLI validates output directories are Path objects."""
+        # Create an INVALID tournament_config.py (string instead of Path) in the working directory
+        monkeypatch.chdir(tmp_path)
+        _write_config(tmp_path, output_h2h='"./h2h"')  # INVALID! Should be Path
 
-            # Should fail with validation error
-            assert result.exit_code != 0
-            assert "BOT_TIMEOUT_SECONDS" in result.output
-            assert "very large" in result.output.lower()
-            assert "unreasonable" in result.output.lower()
+        # Run CLI (should fail validation)
+        result = runner.invoke(cli, [])
 
-    def test_cli_validates_output_directories(self, tmp_path: Path) -> None:
-        """Test that CLI validates output directories are Path objects."""
-        # Create an INVALID tournament_config.py (string instead of Path)
-        config_file = tmp_path / "tournament_config.py"
-        config_file.write_text("""
+        # Should fail with validation error
+        assert result.exit_code != 0
+        assert "OUTPUT_DIR_HEAD_TO_HEAD must be a Path object" in result.output
+
+    def test_cli_reloads_config_after_edit(
+        self, runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that editing tournament_config.py between runs is picked up."""
+        monkeypatch.chdir(tmp_path)
+        config_path = tmp_path / "tournament_config.py"
+
+        config_path.write_text("""
 from pathlib import Path
 
-TOURNAMENT_NAME = "Test"
-GAMES_PER_MATCHUP_HEAD_TO_HEAD = 1000
-GAMES_PER_MATCHUP_ALL_VS_ALL = 1000
-BOT_TIMEOUT_SECONDS = 1.0
-OUTPUT_DIR_HEAD_TO_HEAD = "./h2h"  # INVALID! Should be Path
-OUTPUT_DIR_ALL_VS_ALL = Path("./all")
-SAVE_REPLAYS = False
-TOURNAMENT_SEED = 42
+BOT_TIMEOUT_SECONDS = 500.0
 """)
+        result = runner.invoke(cli, [])
+        assert result.exit_code != 0
+        assert "BOT_TIMEOUT_SECONDS is very large" in result.output
 
-        runner = CliRunner()
-        with runner.isolated_filesystem(temp_dir=tmp_path):
-            # Write config to current directory
-            (Path.cwd() / "tournament_config.py").write_text(config_file.read_text())
-
-            # Run CLI (should fail validation)
-            result = runner.invoke(cli, [])
+        # Edit the config; the cached module must not be reused
+        config_path.write_text("""
+from pathlib import Path
 
-            # Should fail with validation error
-            assert result.exit_code != 0
-            assert "OUTPUT_DIR_HEAD_TO_HEAD must be a Path object" in result.output
+GAMES_PER_MATCHUP_HEAD_TO_HEAD = 0
+""")
+        result = runner.invoke(cli, [])
+        assert result.exit_code != 0
+        assert "GAMES_PER_MATCHUP_HEAD_TO_HEAD must be > 0" in result.output
+        assert "BOT_TIMEOUT_SECONDS" not in result.output
@@ -2,8 +2,8 @@
 
 import os
 import sys
-import tempfile
 from pathlib import Path
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -157,6 +157,40 @@ class TestValidateTournamentConfig:
             )
         assert "BOT_TIMEOUT_SECONDS must be a number" in str(exc_info.value)
 
+    @pytest.mark.parametrize("max_workers", [None, 1, 4])
+    def test_valid_max_workers(self, tmp_path: Path, max_workers: int | None) -> None:
+        """Test that a positive MAX_WORKERS or None passes validation."""
+        validate_tournament_config(
+            games_per_matchup_h2h=1000,
+            games_per_matchup_all=1000,
+            bot_timeout_seconds=1.0,
+            output_dir_h2h=tmp_path / "h2h",
+            output_dir_all=tmp_path / "all",
+            max_workers=max_workers,
+        )
+
+    @pytest.mark.parametrize(
+        ("max_workers", "message"),
+        [
+            (0, "MAX_WORKERS must be > 0"),
+            (-2, "MAX_WORKERS must be > 0"),
+            (2.0, "MAX_WORKERS must be an integer or None"),
+            (True, "MAX_WORKERS must be an integer or None"),
+        ],
+    )
+    def test_invalid_max_workers(self, tmp_path: Path, max_workers: object, message: str) -> None:
+        """Test that MAX_WORKERS must be a positive integer or None."""
+        with pytest.raises(ConfigurationError) as exc_info:
+            validate_tournament_config(
+                games_per_matchup_h2h=1000,
+                games_per_matchup_all=1000,
+                bot_timeout_seconds=1.0,
+                output_dir_h2h=tmp_path / "h2h",
+                output_dir_all=tmp_path / "all",
+                max_workers=max_workers,  # type: ignore
+            )
+        assert message in str(exc_info.value)
+
     def test_output_dir_not_path(self, tmp_path: Path) -> None:
         """Test that non-Path output directory fails."""
         with pytest.raises(ConfigurationError) as exc_info:
@@ -212,16 +246,37 @@ class TestValidateTournamentConfig:
         assert "GAMES_PER_MATCHUP_ALL_VS_ALL" in error_msg
         assert "BOT_TIMEOUT_SECONDS" in error_msg
 
-    def test_valid_timeout_ranges(self, tmp_path: Path) -> None:
+    def test_cached_result_invalidated_when_parent_changes(self, tmp_path: Path) -> None:
+        """Test that a repeated call re-validates once the output parent is replaced."""
+        parent = tmp_path / "results"
+        args: dict[str, Any] = {
+            "games_per_matchup_h2h": 1000,
+            "games_per_matchup_all": 1000,
+            "bot_timeout_seconds": 1.0,
+            "output_dir_h2h": parent / "h2h",
+            "output_dir_all": parent / "all",
+        }
+        validate_tournament_config(**args)
+        validate_tournament_config(**args)
+
+        # Replace the parent directory with a plain file
+        parent.rmdir()
+        parent.write_text("not a directory")
+
+        with pytest.raises(ConfigurationError) as exc_info:
+            validate_tournament_config(**args)
+        assert "OUTPUT_DIR_HEAD_TO_HEAD" in str(exc_info.value)
+
+    @pytest.mark.parametrize("timeout", [0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 60.0, 300.0])
+    def test_valid_timeout_ranges(self, tmp_path: Path, timeout: float) -> None:
         """Test that reasonable timeout values pass validation."""
-        for timeout in [0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 60.0, 300.0]:
-            validate_tournament_config(
-                games_per_matchup_h2h=1000,
-                games_per_matchup_all=1000,
-                bot_timeout_seconds=timeout,
-                output_dir_h2h=tmp_path / "h2h",
-                output_dir_all=tmp_path / "all",
-            )
+        validate_tournament_config(
+            games_per_matchup_h2h=1000,
+            games_per_matchup_all=1000,
+            bot_timeout_seconds=timeout,
+            output_dir_h2h=tmp_path / "h2h",
+            output_dir_all=tmp_path / "all",
+        )
 
 
 class TestCheckPlatformCompatibility:
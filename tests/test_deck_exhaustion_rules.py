@@ -8,6 +8,7 @@ Per official rules (lines 113-117):
 - Do NOT shuffle cards discarded from busts in the current round
 """
 
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -18,7 +19,7 @@ from flip7.events.event_logger import EventLogger
 from flip7.types.cards import NumberCard
 
 
-def test_deck_exhaustion_reshuffles_discard_pile():
+def test_deck_exhaustion_reshuffles_discard_pile(tmp_path: Path):
     """Test that deck exhaustion causes discard pile to be reshuffled."""
     player_ids = ["p1"]
     bots = {"p1": RandomBot("p1")}
@@ -27,7 +28,7 @@ def test_deck_exhaustion_reshuffles_discard_pile():
     deck = [NumberCard(1), NumberCard(2)]
     discard = [NumberCard(3), NumberCard(4), NumberCard(5)]
 
-    with EventLogger(Path("/tmp/test_deck_exhaustion.jsonl")) as logger:
+    with EventLogger(tmp_path / "events.jsonl") as logger:
         engine = RoundEngine(
             player_ids=player_ids,
             bots=bots,
@@ -55,7 +56,40 @@ def test_deck_exhaustion_reshuffles_discard_pile():
         assert card is not None, "Should be able to draw from reshuffled deck"
 
 
-def test_current_round_tableau_cards_not_reshuffled():
+def test_reshuffle_refills_shared_lists(tmp_path: Path):
+    """Test that reshuffling refills the caller's deck and discard lists in place."""
+    player_ids = ["p1"]
+    bots = {"p1": RandomBot("p1")}
+
+    deck: list = []
+    discard = [NumberCard(i) for i in range(1, 9)]
+
+    with EventLogger(tmp_path / "events.jsonl") as logger:
+        engine = RoundEngine(
+            player_ids=player_ids,
+            bots=bots,
+            event_logger=logger,
+            deck=deck,
+            discard_pile=discard,
+            seed=42,
+        )
+
+        first = engine._draw_card("p1")
+        first_order = [first, *engine.deck]
+
+        # Exhaust the deck again and force a second reshuffle of the same cards
+        discard.extend(first_order)
+        deck.clear()
+        second = engine._draw_card("p1")
+        second_order = [second, *engine.deck]
+
+    assert engine.deck is deck, "Deck list should be refilled, not replaced"
+    assert engine.discard_pile is discard, "Discard list should be cleared, not replaced"
+    assert sorted(c.value for c in second_order) == list(range(1, 9))
+    assert first_order != second_order, "Each reshuffle should draw a fresh permutation"
+
+
+def test_current_round_tableau_cards_not_reshuffled(tmp_path: Path):
     """Test that cards in player tableaus are NOT reshuffled when deck runs out."""
     player_ids = ["p1", "p2"]
     bots = {
@@ -67,7 +101,7 @@ def test_current_round_tableau_cards_not_reshuffled():
     deck = [NumberCard(1), NumberCard(2)]
     discard = [NumberCard(5), NumberCard(6)]
 
-    with EventLogger(Path("/tmp/test_tableau_not_shuffled.jsonl")) as logger:
+    with EventLogger(tmp_path / "events.jsonl") as logger:
         engine = RoundEngine(
             player_ids=player_ids,
             bots=bots,
@@ -105,7 +139,7 @@ def test_current_round_tableau_cards_not_reshuffled():
         assert isinstance(card, NumberCard), "Should draw a card from reshuffled deck"
 
 
-def test_round_cleanup_moves_tableau_to_discard():
+def test_round_cleanup_moves_tableau_to_discard(tmp_path: Path):
     """Test that _cleanup_tableaus moves all cards to discard pile."""
     player_ids = ["p1", "p2"]
     bots = {
@@ -116,7 +150,7 @@ def test_round_cleanup_moves_tableau_to_discard():
     deck = [NumberCard(i) for i in range(1, 13)]
     discard: list = []
 
-    with EventLogger(Path("/tmp/test_cleanup.jsonl")) as logger:
+    with EventLogger(tmp_path / "events.jsonl") as logger:
         engine = RoundEngine(
             player_ids=player_ids,
             bots=bots,
@@ -129,7 +163,6 @@ def test_round_cleanup_moves_tableau_to_discard():
         )
 
         # Give players some cards
-        from dataclasses import replace
 
         engine.tableaus["p1"] = replace(
             engine.tableaus["p1"],
@@ -154,7 +187,7 @@ def test_round_cleanup_moves_tableau_to_discard():
             "All tableau cards should be moved to discard pile"
 
 
-def test_deck_persistence_across_rounds():
+def test_deck_persistence_across_rounds(tmp_path: Path):
     """Test that deck and discard pile persist across rounds."""
     player_ids = ["p1"]
     bots = {"p1": RandomBot("p1")}
@@ -163,7 +196,7 @@ def test_deck_persistence_across_rounds():
     initial_deck = [NumberCard(i) for i in range(1, 8)]
     discard: list = []
 
-    with EventLogger(Path("/tmp/test_deck_persistence.jsonl")) as logger:
+    with EventLogger(tmp_path / "events.jsonl") as logger:
         # Round 1
         engine1 = RoundEngine(
             player_ids=player_ids,
@@ -12,77 +12,76 @@ Key Rules:
 - Cards from tableaus are moved to discard pile at end of each round
 """
 
+import random
+from collections.abc import Callable, Iterator
+
 import pytest
-from pathlib import Path
-from flip7.core import GameEngine
+
 from flip7.bots import RandomBot
-from flip7.constants import DECK_COMPOSITION, ACTION_CARD_COUNTS, MODIFIER_CARD_COUNTS
+from flip7.constants import TOTAL_CARDS
+from flip7.core import GameEngine, build_seeded_deck, create_deck, shuffle_deck
+from flip7.events.event_logger import NullEventLogger
 
 
-def test_deck_initialized_with_94_cards():
+def test_deck_initialized_with_94_cards(make_game_engine: Callable[[], GameEngine]):
     """Test that game starts with exactly 94 cards in the deck."""
-    player_ids = ["p1", "p2"]
-    bots = {pid: RandomBot(pid) for pid in player_ids}
-
-    engine = GameEngine(
-        game_id="test_game",
-        player_ids=player_ids,
-        bots=bots,
-        event_log_path=Path("/tmp/test_deck.jsonl"),
-        seed=42,
-    )
+    engine = make_game_engine()
 
     # Verify initial deck size
-    total_cards = sum(DECK_COMPOSITION.values()) + sum(ACTION_CARD_COUNTS.values()) + sum(MODIFIER_CARD_COUNTS.values())
-    assert len(engine.deck) == total_cards == 94
+    assert len(engine.deck) == TOTAL_CARDS
     assert len(engine.discard_pile) == 0
 
 
-def test_deck_persists_across_rounds():
-    """Test that the same deck object is used across multiple rounds (not recreated)."""
-    player_ids = ["p1", "p2"]
-    bots = {pid: RandomBot(pid) for pid in player_ids}
+def test_seeded_engines_copy_the_cached_deck(random_bots: dict[str, RandomBot]):
+    """Test that engines with the same seed get equal but independent decks."""
+    engines = [
+        GameEngine(game_id=f"g{i}", player_ids=["p1", "p2"], bots=random_bots, seed=42)
+        for i in range(2)
+    ]
 
-    engine = GameEngine(
-        game_id="test_game",
-        player_ids=player_ids,
-        bots=bots,
-        event_log_path=Path("/tmp/test_persistence.jsonl"),
-        seed=42,
-    )
+    assert engines[0].deck == engines[1].deck == shuffle_deck(create_deck(), seed=42)
+    assert engines[0].deck is not engines[1].deck
+
+    # Drawing from one engine leaves the other engine and the cache untouched
+    engines[0].deck.pop()
+    assert len(engines[1].deck) == len(build_seeded_deck(42)) == TOTAL_CARDS
+
+
+def test_deck_persists_across_rounds(
+    make_game_engine: Callable[[], GameEngine], event_logger: NullEventLogger,
+):
+    """Test that the same deck and discard pile carry across rounds (not recreated)."""
+    engine = make_game_engine()
 
-    # Store initial deck reference
-    initial_deck_id = id(engine.deck)
-    initial_discard_id = id(engine.discard_pile)
+    # Mark the discard pile with a card taken from the deck, and remember the
+    # order of the remaining deck
+    sentinel = engine.deck.pop()
+    engine.discard_pile.append(sentinel)
+    deck_before = list(engine.deck)
 
     # Execute one round (won't complete the game)
-    from flip7.events.event_logger import EventLogger
-    with EventLogger(Path("/tmp/test_round.jsonl")) as logger:
+    with event_logger as logger:
         engine._execute_round(1, logger)
 
-    # Verify same objects are still being used
-    assert id(engine.deck) == initial_deck_id, "Deck object was recreated (should be persistent)"
-    assert id(engine.discard_pile) == initial_discard_id, "Discard pile was recreated (should be persistent)"
+    # The round drew from the front of the same deck and only added to the
+    # same discard pile
+    deck_after = list(engine.deck)
+    assert deck_after == deck_before[len(deck_before) - len(deck_after):], \
+        "Deck was recreated (remaining cards should be the tail of the old deck)"
+    assert engine.discard_pile[0] is sentinel, \
+        "Discard pile was recreated (should keep cards from before the round)"
 
 
-def test_cards_moved_to_discard_after_round():
+def test_cards_moved_to_discard_after_round(
+    make_game_engine: Callable[[], GameEngine], event_logger: NullEventLogger,
+):
     """Test that cards from player tableaus are moved to discard pile at end of round."""
-    player_ids = ["p1", "p2"]
-    bots = {pid: RandomBot(pid) for pid in player_ids}
-
-    engine = GameEngine(
-        game_id="test_game",
-        player_ids=player_ids,
-        bots=bots,
-        event_log_path=Path("/tmp/test_discard.jsonl"),
-        seed=42,
-    )
+    engine = make_game_engine()
 
     initial_deck_size = len(engine.deck)
 
     # Execute one round
-    from flip7.events.event_logger import EventLogger
-    with EventLogger(Path("/tmp/test_round_discard.jsonl")) as logger:
+    with event_logger as logger:
         scores = engine._execute_round(1, logger)
 
     # After round, deck should be smaller and discard pile should have cards
@@ -91,82 +90,67 @@ def test_cards_moved_to_discard_after_round():
 
     # Total cards should remain 94 (conservation)
     total_cards = len(engine.deck) + len(engine.discard_pile)
-    assert total_cards == 94, f"Cards were lost or created: {total_cards} != 94"
+    assert total_cards == TOTAL_CARDS, \
+        f"Cards were lost or created: {total_cards} != {TOTAL_CARDS}"
 
 
-def test_no_fresh_deck_per_round():
+def test_no_fresh_deck_per_round(
+    make_game_engine: Callable[[], GameEngine], event_logger: NullEventLogger,
+):
     """Test that rounds do NOT start with a fresh 94-card deck."""
-    player_ids = ["p1", "p2"]
-    bots = {pid: RandomBot(pid) for pid in player_ids}
-
-    engine = GameEngine(
-        game_id="test_game",
-        player_ids=player_ids,
-        bots=bots,
-        event_log_path=Path("/tmp/test_no_fresh.jsonl"),
-        seed=42,
-    )
-
-    from flip7.events.event_logger import EventLogger
+    engine = make_game_engine()
 
     # Execute first round
-    with EventLogger(Path("/tmp/test_round1.jsonl")) as logger:
+    with event_logger as logger:
         engine._execute_round(1, logger)
 
     deck_size_after_round_1 = len(engine.deck)
     discard_size_after_round_1 = len(engine.discard_pile)
 
     # Deck should be depleted from round 1
-    assert deck_size_after_round_1 < 94, "Deck should be partially used"
+    assert deck_size_after_round_1 < TOTAL_CARDS, "Deck should be partially used"
     assert discard_size_after_round_1 > 0, "Discard pile should have cards"
 
     # Execute second round with same engine
-    with EventLogger(Path("/tmp/test_round2.jsonl")) as logger:
+    with event_logger as logger:
         engine._execute_round(2, logger)
 
     # Deck should continue to deplete (not reset to 94)
     # Unless it was exhausted and reshuffled, it should be smaller than 94
-    if len(engine.deck) < 94:
+    if len(engine.deck) < TOTAL_CARDS:
         # Normal case: deck continues to deplete
         assert True
     else:
         # Edge case: deck was exhausted and reshuffled from discard pile
         # In this case, deck + discard should still equal 94
         total_cards = len(engine.deck) + len(engine.discard_pile)
-        assert total_cards == 94, "Total cards should remain 94 after reshuffle"
+        assert total_cards == TOTAL_CARDS, "Total cards should remain 94 after reshuffle"
 
 
-def test_reshuffle_uses_discard_pile():
+def test_reshuffle_uses_discard_pile(
+    make_game_engine: Callable[[], GameEngine], event_logger: NullEventLogger,
+):
     """Test that when deck runs out, discard pile is reshuffled into deck."""
-    player_ids = ["p1", "p2"]
-    bots = {pid: RandomBot(pid) for pid in player_ids}
-
-    engine = GameEngine(
-        game_id="test_game",
-        player_ids=player_ids,
-        bots=bots,
-        event_log_path=Path("/tmp/test_reshuffle.jsonl"),
-        seed=42,
-    )
+    engine = make_game_engine()
 
     # Force deck to run out by removing most cards
     # Move cards from deck to discard pile to simulate previous rounds
     cards_to_move = engine.deck[:80]  # Move 80 cards
     engine.discard_pile.extend(cards_to_move)
-    engine.deck = engine.deck[80:]  # Keep only 14 cards
+    engine.deck = engine.deck[80:]  # Keep only the remaining 14 cards
 
-    assert len(engine.deck) == 14
+    assert len(engine.deck) == TOTAL_CARDS - 80
     assert len(engine.discard_pile) == 80
 
     # Execute a round - this should deplete the small deck and trigger reshuffle
-    from flip7.events.event_logger import EventLogger
-    with EventLogger(Path("/tmp/test_round_reshuffle.jsonl")) as logger:
+    with event_logger as logger:
         try:
             scores = engine._execute_round(1, logger)
 
             # After round, verify cards are still conserved
             total_cards = len(engine.deck) + len(engine.discard_pile)
-            assert total_cards == 94, f"Cards lost/created during reshuffle: {total_cards} != 94"
+            assert total_cards == TOTAL_CARDS, \
+                f"Cards lost/created during reshuffle: {total_cards} != {TOTAL_CARDS}"
 
         except RuntimeError as e:
             # If we get "No cards available to draw", that's also a valid test pass
@@ -177,25 +161,34 @@ def test_reshuffle_uses_discard_pile():
                 raise
 
 
-def test_card_conservation_across_full_game():
-    """Test that exactly 94 cards exist throughout entire game (no loss/creation)."""
-    player_ids = ["p1", "p2"]
-    bots = {pid: RandomBot(pid) for pid in player_ids}
+@pytest.fixture
+def restore_random_state() -> Iterator[None]:
+    """Restore the global random state after a test that seeds it."""
+    state = random.getstate()
+    yield
+    random.setstate(state)
+
 
+@pytest.mark.parametrize("seed", [7, 42, 203])
+@pytest.mark.usefixtures("restore_random_state")
+def test_card_conservation_checked_every_round(seed: int, event_logger: NullEventLogger):
+    """Test that deck plus discard pile holds all 94 cards after every round."""
+    # Seed the bots' random choices too, so every run plays the same rounds
+    random.seed(seed)
+    player_ids = ["p1", "p2", "p3"]
     engine = GameEngine(
-        game_id="test_game",
+        game_id="conservation",
         player_ids=player_ids,
-        bots=bots,
-        event_log_path=Path("/tmp/test_conservation.jsonl"),
-        seed=42,
+        bots={pid: RandomBot(pid) for pid in player_ids},
+        seed=seed,
     )
 
-    # Execute complete game
-    final_state = engine.execute_game()
-
-    # After game, all cards should be in deck + discard pile
-    total_cards = len(engine.deck) + len(engine.discard_pile)
-    assert total_cards == 94, f"Card conservation violated: {total_cards} != 94"
+    with event_logger as logger:
+        for round_num in range(1, 6):
+            engine._execute_round(round_num, logger)
+            total_cards = len(engine.deck) + len(engine.discard_pile)
+            assert total_cards == TOTAL_CARDS, \
+                f"Cards lost/created in round {round_num}: {total_cards} != {TOTAL_CARDS}"
 
 
 if __name__ == "__main__":
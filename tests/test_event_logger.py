@@ -0,0 +1,94 @@
+"""
+Tests for batched JSONL event logging.
+
+EventLogger buffers serialized events and writes them every flush_every
+events and when its context exits, so the log file only lags the logged
+events by less than one batch.
+"""
+
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+
+from flip7.events import event_serializer
+from flip7.events.event_logger import EventLogger
+from flip7.events.event_serializer import deserialize_event, serialize_event_bytes
+from flip7.types.events import Event
+
+
+def _event(n: int) -> Event:
+    """Build a distinct player_hit event numbered n."""
+    return Event(
+        event_type="player_hit",
+        timestamp=datetime(2024, 1, 1, tzinfo=UTC),
+        game_id="test",
+        round_number=1,
+        player_id="p1",
+        data={"n": n},
+    )
+
+
+def test_events_written_in_batches(tmp_path: Path):
+    """Test that events reach the file only once a full batch is logged."""
+    log_path = tmp_path / "game.jsonl"
+
+    with EventLogger(log_path, flush_every=3) as logger:
+        logger.log_event(_event(0))
+        logger.log_event(_event(1))
+        assert log_path.read_bytes() == b"", "Partial batch should stay buffered"
+
+        logger.log_event(_event(2))
+        assert len(log_path.read_bytes().splitlines()) == 3, \
+            "Full batch should be written"
+
+        logger.log_event(_event(3))
+
+    # Exiting writes the remaining partial batch, in order
+    lines = log_path.read_text().splitlines()
+    assert [deserialize_event(line).data["n"] for line in lines] == [0, 1, 2, 3]
+
+
+def test_buffered_events_written_on_exception(tmp_path: Path):
+    """Test that buffered events are still written when the context exits with an error."""
+    log_path = tmp_path / "game.jsonl"
+
+    with pytest.raises(RuntimeError, match="boom"), EventLogger(log_path) as logger:
+        logger.log_event(_event(0))
+        raise RuntimeError("boom")
+
+    assert len(log_path.read_text().splitlines()) == 1
+
+
+def test_serialized_line_matches_event_json():
+    """Test that a serialized JSONL line is the event's JSON plus a newline."""
+    event = _event(0)
+    assert serialize_event_bytes(event, newline=True) == serialize_event_bytes(event) + b"\n"
+
+
+def test_stdlib_encoding_escapes_non_ascii(monkeypatch: pytest.MonkeyPatch):
+    """Test that without orjson, events encode exactly as json.dumps always has."""
+    monkeypatch.setattr(event_serializer, "orjson", None)
+    event = Event(
+        event_type="player_hit",
+        timestamp=datetime(2024, 1, 1, tzinfo=UTC),
+        game_id="test",
+        round_number=1,
+        player_id="jos\u00e9",
+        data={"n": 0},
+    )
+
+    assert serialize_event_bytes(event) == (
+        b'{"event_type":"player_hit","timestamp":"2024-01-01T00:00:00+00:00",'
+        b'"game_id":"test","round_number":1,"player_id":"jos\\u00e9","data":{"n":0}}'
+    )
+
+
+def test_flush_every_must_be_positive(tmp_path: Path):
+    """Test that a batch size below 1 is rejected."""
+    with pytest.raises(ValueError, match="flush_every must be at least 1"):
+        EventLogger(tmp_path / "game.jsonl", flush_every=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -6,311 +6,315 @@ Per official rules (lines 134-136):
 - Flip Three/Freeze cards drawn during Flip Three are resolved AFTER all 3 cards
 """
 
-from dataclasses import replace
-from pathlib import Path
+from collections.abc import Callable, Sequence
 
 import pytest
 
-from flip7.bots import RandomBot
-from flip7.core.deck import create_deck, shuffle_deck
 from flip7.core.round_engine import RoundEngine
-from flip7.events.event_logger import EventLogger
-from flip7.types.cards import ActionCard, ActionType, NumberCard
+from flip7.events.event_logger import NullEventLogger
+from flip7.types.cards import ActionCard, ActionType, Card, NumberCard
+from tests.stub_bots import DeterministicBot
+
+EngineFactory = Callable[[Sequence[Card], dict[str, DeterministicBot]], RoundEngine]
+
+# Rigged decks are built once and copied by make_engine, since RoundEngine
+# consumes its deck. Cards are interned, so the copies share card instances.
+
+# Number cards 4-12, padding decks past the cards a test rigs
+_PAD_4_12: tuple[Card, ...] = tuple(NumberCard(i) for i in range(4, 13))
+
+# P2 draws: Number 5, Freeze, Number 7
+# The Freeze should be queued and resolved AFTER all 3 cards
+_QUEUED_FREEZE_DECK: tuple[Card, ...] = (
+    NumberCard(5),  # 1st card during Flip Three
+    ActionCard(ActionType.FREEZE),  # 2nd card - should be QUEUED
+    NumberCard(7),  # 3rd card
+)
+
+# P2 draws: Number 3, Flip Three (queued), Number 5
+# Then the queued Flip Three resolves against p1
+_NESTED_FLIP_THREE_DECK: tuple[Card, ...] = (
+    NumberCard(3),  # 1st card
+    ActionCard(ActionType.FLIP_THREE),  # 2nd card - should be QUEUED
+    NumberCard(5),  # 3rd card
+    NumberCard(6),  # Nested Flip Three card 1
+    NumberCard(7),  # Nested Flip Three card 2
+    NumberCard(8),  # Nested Flip Three card 3
+)
+
+# P1 draws Flip Three for p2, who draws: Number 2, Second Chance, Number 3
+_SECOND_CHANCE_DECK: tuple[Card, ...] = (
+    ActionCard(ActionType.FLIP_THREE),  # p1 draws, targets p2
+    NumberCard(2),  # p2's 1st card
+    ActionCard(ActionType.SECOND_CHANCE),  # p2's 2nd card - resolved immediately
+    NumberCard(3),  # p2's 3rd card
+    *_PAD_4_12,
+)
+
+# P2 draws: Number 5, Number 5 (duplicate - BUST!)
+# 3rd card (7) should NOT be drawn
+_BUST_DECK: tuple[Card, ...] = (
+    NumberCard(5),  # 1st card
+    NumberCard(5),  # 2nd card - duplicate, will bust
+    NumberCard(7),  # 3rd card - should NOT be drawn
+)
+
+# P1 achieves Flip 7 during Flip Three
+# Start with 4 cards, then Flip Three adds 3 more to reach 7
+_FLIP_7_DECK: tuple[Card, ...] = (
+    NumberCard(1),  # Initial deal
+    NumberCard(2),  # p1 hits
+    NumberCard(3),  # p1 hits
+    NumberCard(4),  # p1 hits
+    ActionCard(ActionType.FLIP_THREE),  # p1 draws, targets self
+    NumberCard(5),  # 1st card during Flip Three
+    NumberCard(6),  # 2nd card during Flip Three
+    NumberCard(7),  # 3rd card during Flip Three - achieves Flip 7!
+    NumberCard(8),  # This should NOT be drawn
+    *(NumberCard(i) for i in range(9, 13)),
+)
+
+# P1 already holds 1-5; Flip Three reaches Flip 7 on its 2nd card (7)
+_EARLY_FLIP_7_DECK: tuple[Card, ...] = (
+    *(NumberCard(i) for i in range(1, 6)),  # p1's first five cards
+    NumberCard(6),  # 1st card during Flip Three
+    NumberCard(7),  # 2nd card during Flip Three - achieves Flip 7!
+    NumberCard(8),  # 3rd card - should NOT be drawn
+)
+
+# P2 draws Flip Three that causes bust, queued Freeze should be discarded
+_QUEUED_THEN_BUST_DECK: tuple[Card, ...] = (
+    ActionCard(ActionType.FLIP_THREE),  # p1 draws, targets p2
+    NumberCard(3),  # p2's 1st card
+    ActionCard(ActionType.FREEZE),  # p2's 2nd card - QUEUED
+    NumberCard(3),  # p2's 3rd card - BUST!
+    *_PAD_4_12,
+)
+
+# P1 draws Flip Three for itself: Freeze, Freeze, Number 11. The first queued
+# Freeze ends p1's turn, so the second is discarded without resolving
+_DOUBLE_QUEUED_FREEZE_DECK: tuple[Card, ...] = (
+    ActionCard(ActionType.FLIP_THREE),  # p1 draws, targets self
+    ActionCard(ActionType.FREEZE),  # 1st card - QUEUED
+    ActionCard(ActionType.FREEZE),  # 2nd card - QUEUED
+    NumberCard(11),  # 3rd card
+    *_PAD_4_12,
+)
+
+
+@pytest.fixture
+def make_engine(event_logger: NullEventLogger) -> EngineFactory:
+    """Provide a factory for round engines over a rigged deck and fixed bots.
+
+    The players are the keys of the bots dict, in order. Each engine draws from
+    its own copy of the deck.
+    """
+    def make(deck: Sequence[Card], bots: dict[str, DeterministicBot]) -> RoundEngine:
+        return RoundEngine(
+            player_ids=list(bots),
+            bots=bots,
+            event_logger=event_logger,
+            deck=list(deck),
+            discard_pile=[],
+            round_number=1,
+            game_id="test",
+            seed=42,
+        )
+
+    return make
 
 
-def test_flip_three_queues_freeze_card():
+def test_flip_three_queues_freeze_card(make_engine: EngineFactory):
     """Test that Freeze drawn during Flip Three is queued until after all 3 cards."""
-    player_ids = ["p1", "p2"]
     bots = {
-        "p1": RandomBot("p1"),
-        "p2": RandomBot("p2"),
+        "p1": DeterministicBot("p1", first_target="p1"),
+        "p2": DeterministicBot("p2", first_target="p1"),
     }
 
-    # Create a rigged deck - p2 will draw: Number 5, Freeze, Number 7
-    # The Freeze should be queued and resolved AFTER all 3 cards
-    deck = [
-        NumberCard(5),  # 1st card during Flip Three
-        ActionCard(ActionType.FREEZE),  # 2nd card - should be QUEUED
-        NumberCard(7),  # 3rd card
-    ]
-
-    discard: list = []
+    engine = make_engine(_QUEUED_FREEZE_DECK, bots)
 
-    with EventLogger(Path("/tmp/test_flip_three_queue_freeze.jsonl")) as logger:
-        engine = RoundEngine(
-            player_ids=player_ids,
-            bots=bots,
-            event_logger=logger,
-            deck=deck,
-            discard_pile=discard,
-            round_number=1,
-            game_id="test",
-            seed=42,
-        )
-
-        # Directly call Flip Three on p2
-        engine._resolve_flip_three("p2")
+    # Directly call Flip Three on p2
+    engine._resolve_flip_three("p2")
 
-        p2_tableau = engine.tableaus["p2"]
-        number_values = [c.value for c in p2_tableau.number_cards]
+    p2_tableau = engine.tableaus["p2"]
+    number_values = [c.value for c in p2_tableau.number_cards]
 
-        # P2 should have cards 5 and 7 (Freeze queued then resolved)
-        assert 5 in number_values, "P2 should have first number card (5)"
-        assert 7 in number_values, "P2 should have third number card (7)"
+    # P2 should have cards 5 and 7 (Freeze queued then resolved)
+    assert number_values == [5, 7], \
+        f"P2 should have drawn all three cards, got {number_values}"
+    assert p2_tableau.is_active, "P2 should still be active"
 
-        # After Freeze resolves, SOMEONE should be frozen
-        # (p2 chooses the target - could be p1 or p2)
-        frozen_players = [
-            pid for pid in player_ids
-            if engine.tableaus[pid].is_frozen
-        ]
-        assert len(frozen_players) >= 1, \
-            "At least one player should be frozen after queued Freeze resolved"
+    # The queued Freeze resolves after the third card; p2 targets p1
+    assert engine.tableaus["p1"].is_frozen, \
+        "P1 should be frozen after queued Freeze resolved"
 
 
-def test_flip_three_queues_nested_flip_three():
+def test_flip_three_queues_nested_flip_three(make_engine: EngineFactory):
     """Test that Flip Three drawn during Flip Three is queued until after all 3 cards."""
-    player_ids = ["p1", "p2"]
     bots = {
-        "p1": RandomBot("p1"),
-        "p2": RandomBot("p2"),
+        "p1": DeterministicBot("p1", first_target="p1"),
+        "p2": DeterministicBot("p2", first_target="p1"),
     }
 
-    # P2 draws: Number 3, Flip Three (queued), Number 5
-    # Then the queued Flip Three resolves (p2 chooses target, could be p1 or p2)
-    deck = [
-        NumberCard(3),  # 1st card
-        ActionCard(ActionType.FLIP_THREE),  # 2nd card - should be QUEUED
-        NumberCard(5),  # 3rd card
-        NumberCard(6),  # Nested Flip Three card 1
-        NumberCard(7),  # Nested Flip Three card 2
-        NumberCard(8),  # Nested Flip Three card 3
-    ]
+    engine = make_engine(_NESTED_FLIP_THREE_DECK, bots)
 
-    discard: list = []
+    # Directly call Flip Three on p2
+    engine._resolve_flip_three("p2")
 
-    with EventLogger(Path("/tmp/test_flip_three_queue_nested.jsonl")) as logger:
-        engine = RoundEngine(
-            player_ids=player_ids,
-            bots=bots,
-            event_logger=logger,
-            deck=deck,
-            discard_pile=discard,
-            round_number=1,
-            game_id="test",
-            seed=42,
-        )
+    # P2 should have drawn exactly 3 cards from the first Flip Three
+    # The nested Flip Three should have been queued and resolved AFTER
+    p2_values = [c.value for c in engine.tableaus["p2"].number_cards]
+    p1_values = [c.value for c in engine.tableaus["p1"].number_cards]
 
-        # Directly call Flip Three on p2
-        engine._resolve_flip_three("p2")
+    assert p2_values == [3, 5], \
+        f"P2 should keep the numbers from the first Flip Three, got {p2_values}"
+    assert p1_values == [6, 7, 8], \
+        f"P1 should receive the nested Flip Three cards, got {p1_values}"
 
-        # P2 should have drawn exactly 3 cards from the first Flip Three
-        # The nested Flip Three should have been queued and resolved AFTER
-        p2_tableau = engine.tableaus["p2"]
-        p1_tableau = engine.tableaus["p1"]
 
-        # Check that MORE than 3 cards total were drawn
-        # (first Flip Three drew 3, nested Flip Three drew 3 more)
-        total_cards_drawn = len(p2_tableau.number_cards) + len(p1_tableau.number_cards)
+def test_flip_three_resolves_second_chance_immediately(make_engine: EngineFactory):
+    """Test that Second Chance drawn during Flip Three is resolved immediately, not queued."""
+    bots = {
+        "p1": DeterministicBot("p1", first_target="p2"),
+        "p2": DeterministicBot("p2", first_target="p2"),
+    }
 
-        # At least 6 cards should have been drawn total
-        # (3 from first Flip Three, 3 from nested)
-        assert total_cards_drawn >= 5, \
-            f"Total cards drawn should be at least 5 (got {total_cards_drawn}), " \
-            f"indicating nested Flip Three was resolved"
+    engine = make_engine(_SECOND_CHANCE_DECK, bots)
 
+    engine._initial_deal()
 
-def test_flip_three_resolves_second_chance_immediately():
-    """Test that Second Chance drawn during Flip Three is resolved immediately, not queued."""
-    player_ids = ["p1", "p2"]
+    p2_tableau = engine.tableaus["p2"]
+
+    # Second Chance should have been resolved immediately, so p2 holds it
+    # and the third Flip Three card still went to p2
+    assert p2_tableau.second_chance, \
+        "Second Chance should have been resolved during Flip Three"
+    assert not engine.tableaus["p1"].second_chance
+    assert [c.value for c in p2_tableau.number_cards] == [2, 3, 4]
+
+
+def test_flip_three_stops_on_bust(make_engine: EngineFactory):
+    """Test that Flip Three stops drawing cards if player busts."""
+
+    # Bots that never use Second Chance
     bots = {
-        "p1": RandomBot("p1"),
-        "p2": RandomBot("p2"),
+        "p1": DeterministicBot("p1", always_hit=True),
+        "p2": DeterministicBot("p2", always_hit=True),
     }
 
-    # Create a rigged deck
-    deck = [
-        ActionCard(ActionType.FLIP_THREE),  # p1 draws, targets p2
-        NumberCard(2),  # p2's 1st card
-        ActionCard(ActionType.SECOND_CHANCE),  # p2's 2nd card - resolved immediately
-        NumberCard(3),  # p2's 3rd card
-    ] + [NumberCard(i) for i in range(4, 13)]
+    engine = make_engine(_BUST_DECK, bots)
 
-    discard: list = []
+    # Directly call Flip Three on p2
+    engine._resolve_flip_three("p2")
 
-    with EventLogger(Path("/tmp/test_flip_three_second_chance.jsonl")) as logger:
-        engine = RoundEngine(
-            player_ids=player_ids,
-            bots=bots,
-            event_logger=logger,
-            deck=deck,
-            discard_pile=discard,
-            round_number=1,
-            game_id="test",
-            seed=42,
-        )
+    p2_tableau = engine.tableaus["p2"]
+    number_values = [c.value for c in p2_tableau.number_cards]
 
-        engine._initial_deal()
+    # P2 should be busted and should NOT have drawn the 3rd card (7)
+    assert p2_tableau.is_busted, "Player should be busted from duplicate"
+    assert not p2_tableau.is_active, "Busted player should be inactive"
+    assert 7 not in number_values, "Should NOT have drawn 3rd card after bust"
+    assert len(number_values) == 2, f"Should have exactly 2 cards (both 5s), got {number_values}"
 
-        # Check if any player received Second Chance
-        # (The drawer of Second Chance chooses who gets it)
-        has_second_chance = any(
-            tableau.second_chance for tableau in engine.tableaus.values()
-        )
 
-        # Second Chance should have been resolved immediately
-        # Note: The bot chooses who gets it, so we just verify it was processed
-        assert isinstance(has_second_chance, bool), \
-            "Second Chance should have been resolved during Flip Three"
+def test_flip_three_stops_on_flip_7(make_engine: EngineFactory):
+    """Test that Flip Three stops drawing cards if player achieves Flip 7."""
+    bots = {"p1": DeterministicBot("p1")}
 
+    engine = make_engine(_FLIP_7_DECK, bots)
 
-def test_flip_three_stops_on_bust():
-    """Test that Flip Three stops drawing cards if player busts."""
-    player_ids = ["p1", "p2"]
+    # Give p1 4 cards first
+    for _ in range(4):
+        card = engine._draw_card("p1")
+        if isinstance(card, NumberCard):
+            engine._handle_number_card("p1", card)
 
-    # Bot that never uses Second Chance
-    class NeverUseBot:
-        name = "never"
-        def decide_hit_or_pass(self, ctx): return "hit"
-        def decide_use_second_chance(self, ctx, dup): return False
-        def choose_action_target(self, ctx, action, eligible):
-            return eligible[0] if eligible else "p1"
+    # Now trigger Flip Three
+    flip_three = engine._draw_card("p1")
+    if isinstance(flip_three, ActionCard):
+        engine._handle_action_card("p1", flip_three)
 
-    bots = {
-        "p1": NeverUseBot(),
-        "p2": NeverUseBot(),
-    }
+    p1_tableau = engine.tableaus["p1"]
+    unique_numbers = len(set(c.value for c in p1_tableau.number_cards))
 
-    # P2 draws: Number 5, Number 5 (duplicate - BUST!)
-    # 3rd card (7) should NOT be drawn
-    deck = [
-        NumberCard(5),  # 1st card
-        NumberCard(5),  # 2nd card - duplicate, will bust
-        NumberCard(7),  # 3rd card - should NOT be drawn
-    ]
-
-    discard: list = []
+    # P1 should have achieved Flip 7 without drawing the 8
+    assert unique_numbers == 7, f"P1 should have Flip 7, got {unique_numbers}"
+    assert not p1_tableau.is_active, \
+        "Player who achieved Flip 7 should auto-pass"
+    assert p1_tableau.is_passed, "Flip 7 should trigger auto-pass"
 
-    with EventLogger(Path("/tmp/test_flip_three_bust.jsonl")) as logger:
-        engine = RoundEngine(
-            player_ids=player_ids,
-            bots=bots,
-            event_logger=logger,
-            deck=deck,
-            discard_pile=discard,
-            round_number=1,
-            game_id="test",
-            seed=42,
-        )
 
-        # Directly call Flip Three on p2
-        engine._resolve_flip_three("p2")
+def test_flip_three_stops_on_early_flip_7(make_engine: EngineFactory):
+    """Test that Flip Three stops drawing once Flip 7 is reached before the third card."""
+    bots = {"p1": DeterministicBot("p1")}
 
-        p2_tableau = engine.tableaus["p2"]
-        number_values = [c.value for c in p2_tableau.number_cards]
+    engine = make_engine(_EARLY_FLIP_7_DECK, bots)
 
-        # P2 should be busted and should NOT have drawn the 3rd card (7)
-        assert p2_tableau.is_busted, "Player should be busted from duplicate"
-        assert not p2_tableau.is_active, "Busted player should be inactive"
-        assert 7 not in number_values, "Should NOT have drawn 3rd card after bust"
-        assert len(number_values) == 2, f"Should have exactly 2 cards (both 5s), got {number_values}"
+    # Give p1 cards 1-5 first
+    for _ in range(5):
+        card = engine._draw_card("p1")
+        if isinstance(card, NumberCard):
+            engine._handle_number_card("p1", card)
 
+    # Flip 7 comes too early for the batch draw, so cards are drawn one at a time
+    engine._resolve_flip_three("p1")
 
-def test_flip_three_stops_on_flip_7():
-    """Test that Flip Three stops drawing cards if player achieves Flip 7."""
-    player_ids = ["p1"]
-    bots = {"p1": RandomBot("p1")}
-
-    # Create a rigged deck where p1 achieves Flip 7 during Flip Three
-    # Start with 4 cards, then Flip Three adds 3 more to reach 7
-    deck = [
-        NumberCard(1),  # Initial deal
-        NumberCard(2),  # p1 hits
-        NumberCard(3),  # p1 hits
-        NumberCard(4),  # p1 hits
-        ActionCard(ActionType.FLIP_THREE),  # p1 draws, targets self
-        NumberCard(5),  # 1st card during Flip Three
-        NumberCard(6),  # 2nd card during Flip Three
-        NumberCard(7),  # 3rd card during Flip Three - achieves Flip 7!
-        NumberCard(8),  # This should NOT be drawn
-    ] + [NumberCard(i) for i in range(9, 13)]
-
-    discard: list = []
-
-    with EventLogger(Path("/tmp/test_flip_three_flip7.jsonl")) as logger:
-        engine = RoundEngine(
-            player_ids=player_ids,
-            bots=bots,
-            event_logger=logger,
-            deck=deck,
-            discard_pile=discard,
-            round_number=1,
-            game_id="test",
-            seed=42,
-        )
+    p1_tableau = engine.tableaus["p1"]
+    assert [c.value for c in p1_tableau.number_cards] == [1, 2, 3, 4, 5, 6, 7]
+    assert p1_tableau.is_passed, "Flip 7 should trigger auto-pass"
+    assert engine.deck == [NumberCard(8)], "The third Flip Three card should not be drawn"
 
-        # Give p1 4 cards first
-        for _ in range(4):
-            card = engine._draw_card("p1")
-            if isinstance(card, NumberCard):
-                engine._handle_number_card("p1", card)
 
-        # Now trigger Flip Three
-        flip_three = engine._draw_card("p1")
-        if isinstance(flip_three, ActionCard):
-            engine._handle_action_card("p1", flip_three)
+def test_batch_draw_falls_back_when_a_card_could_stop_the_draw(make_engine: EngineFactory):
+    """Test that the batch number draw takes nothing when a card could bust or is not a number."""
+    bots = {"p1": DeterministicBot("p1")}
 
-        p1_tableau = engine.tableaus["p1"]
-        unique_numbers = len(set(c.value for c in p1_tableau.number_cards))
+    # Duplicate 5 would bust partway through; the Freeze is not a number card
+    engine = make_engine(_BUST_DECK, bots)
+    assert not engine._draw_and_apply_numbers("p1", 3)
+    engine = make_engine(_QUEUED_FREEZE_DECK, bots)
+    assert not engine._draw_and_apply_numbers("p1", 3)
 
-        # P1 should have achieved Flip 7
-        if unique_numbers == 7:
-            assert not p1_tableau.is_active, \
-                "Player who achieved Flip 7 should auto-pass"
-            assert p1_tableau.is_passed, "Flip 7 should trigger auto-pass"
+    assert engine.deck == list(_QUEUED_FREEZE_DECK), "No cards should be drawn"
+    assert engine.tableaus["p1"].number_cards == ()
 
 
-def test_queued_actions_discarded_if_player_busts():
+def test_queued_actions_discarded_if_player_busts(make_engine: EngineFactory):
     """Test that queued action cards are discarded if player busts before they resolve."""
-    player_ids = ["p1", "p2"]
     bots = {
-        "p1": RandomBot("p1"),
-        "p2": RandomBot("p2"),
+        "p1": DeterministicBot("p1", first_target="p2"),
+        "p2": DeterministicBot("p2", first_target="p2"),
     }
 
-    # P2 draws Flip Three that causes bust, queued Freeze should be discarded
-    deck = [
-        ActionCard(ActionType.FLIP_THREE),  # p1 draws, targets p2
-        NumberCard(3),  # p2's 1st card
-        ActionCard(ActionType.FREEZE),  # p2's 2nd card - QUEUED
-        NumberCard(3),  # p2's 3rd card - BUST!
-    ] + [NumberCard(i) for i in range(4, 13)]
+    engine = make_engine(_QUEUED_THEN_BUST_DECK, bots)
 
-    discard: list = []
+    engine._initial_deal()
 
-    with EventLogger(Path("/tmp/test_queued_discard.jsonl")) as logger:
-        engine = RoundEngine(
-            player_ids=player_ids,
-            bots=bots,
-            event_logger=logger,
-            deck=deck,
-            discard_pile=discard,
-            round_number=1,
-            game_id="test",
-            seed=42,
-        )
+    p2_tableau = engine.tableaus["p2"]
+
+    # P2 busts on the duplicate 3, so the queued Freeze is discarded
+    # instead of resolving against p2
+    assert p2_tableau.is_busted, "P2 should bust on the duplicate 3"
+    assert not p2_tableau.is_frozen, \
+        "Busted player should not be frozen (queued action discarded)"
+    assert not engine.tableaus["p1"].is_frozen
+    assert ActionCard(ActionType.FREEZE) in engine.discard_pile, \
+        "Queued Freeze should be in the discard pile"
 
-        engine._initial_deal()
 
-        p2_tableau = engine.tableaus["p2"]
+def test_unresolved_queued_card_discarded_once(make_engine: EngineFactory):
+    """Test that a queued card left over after the player is frozen is discarded exactly once."""
+    bots = {"p1": DeterministicBot("p1", first_target="p1")}
 
-        # P2 should be busted (or used Second Chance)
-        # The queued Freeze should have been discarded, not resolved
-        # We verify this indirectly by checking that p2 is inactive due to bust,
-        # not due to being frozen
-        if p2_tableau.is_busted:
-            assert not p2_tableau.is_frozen, \
-                "Busted player should not be frozen (queued action discarded)"
+    engine = make_engine(_DOUBLE_QUEUED_FREEZE_DECK, bots)
+
+    engine._initial_deal()
+
+    assert engine.tableaus["p1"].is_frozen
+    # The resolved Freeze, the unresolved Freeze and the Flip Three, each once
+    assert sorted(card.action_type.value for card in engine.discard_pile) == [
+        "FLIP_THREE", "FREEZE", "FREEZE",
+    ]
 
 
 if __name__ == "__main__":
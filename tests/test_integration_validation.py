@@ -1,6 +1,5 @@
 """Integration tests for configuration validation in the CLI."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -1,12 +1,32 @@
 """Tests for logging configuration."""
 
 import logging
-import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
+
 from flip7.utils.logging_config import get_logger, setup_logging
 
 
+@pytest.fixture(autouse=True)
+def _restore_root_logger() -> Iterator[None]:
+    """Close the handlers a test installs and restore the root logger afterwards.
+
+    setup_logging replaces the root logger's handlers, so without this each
+    test would leave its stream and file handlers attached for the rest of
+    the session.
+    """
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    for handler in root.handlers:
+        if handler not in handlers:
+            handler.close()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
 class TestSetupLogging:
     """Tests for setup_logging function."""
 
@@ -25,36 +45,36 @@ class TestSetupLogging:
         logger = logging.getLogger()
         assert logger.level == logging.DEBUG
 
-    def test_setup_logging_with_file(self) -> None:
-        """Test logging setup with file output."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log"
-
-            setup_logging(level="INFO", use_rich=False, log_file=log_file)
+    def test_setup_logging_routes_records_to_console(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that records logged after setup reach the console handler."""
+        setup_logging(level="INFO", use_rich=False)
 
-            # Log a message
-            logger = logging.getLogger("test")
-            logger.info("Test message")
+        # Log a message
+        logger = logging.getLogger("test")
+        logger.info("Test message")
+        logger.debug("Hidden message")
 
-            # Verify file was created and contains message
-            assert log_file.exists()
-            content = log_file.read_text()
-            assert "Test message" in content
+        # The handler writes to the captured stdout, so no file is needed
+        out = capsys.readouterr().out
+        assert "test - INFO - Test message" in out
+        assert "Hidden message" not in out
 
-    def test_setup_logging_creates_parent_dirs(self) -> None:
-        """Test that setup_logging creates parent directories for log file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "logs" / "subdir" / "test.log"
+    def test_setup_logging_with_file_creates_parent_dirs(self, tmp_path: Path) -> None:
+        """Test file output, including creating parent directories for the log file."""
+        log_file = tmp_path / "logs" / "subdir" / "test.log"
 
-            setup_logging(level="INFO", use_rich=False, log_file=log_file)
+        setup_logging(level="INFO", use_rich=False, log_file=log_file)
 
-            # Log a message
-            logger = logging.getLogger("test")
-            logger.info("Test message")
+        # Log a message
+        logger = logging.getLogger("test")
+        logger.info("Test message")
 
-            # Verify file and directories were created
-            assert log_file.exists()
-            assert log_file.parent.exists()
+        # Verify file and directories were created and the file holds the message
+        assert log_file.parent.exists()
+        assert log_file.exists()
+        assert "Test message" in log_file.read_text()
 
 
 class TestGetLogger:
@@ -9,178 +9,123 @@ Verifies correct score calculation including:
 - Bust scoring (always 0)
 """
 
-import pytest
-from flip7.core.scoring import calculate_score
-from flip7.types.game_state import PlayerTableau
-from flip7.types.cards import NumberCard, ModifierCard
-from flip7.constants import FLIP_7_BONUS
+from dataclasses import replace
 
+import pytest
 
-def test_simple_number_sum():
-    """Test basic number card summation."""
-    tableau = PlayerTableau(
-        player_id="p1",
-        number_cards=(NumberCard(3), NumberCard(5), NumberCard(7)),
-        modifier_cards=(),
-        second_chance=False,
-        is_active=False,
-        is_busted=False,
-        is_frozen=False,
-        is_passed=True,
-    )
-
-    breakdown = calculate_score(tableau)
-    assert breakdown.number_cards_sum == 15
-    assert breakdown.after_x2_multiplier == 15
-    assert breakdown.modifier_additions == 0
-    assert breakdown.flip_7_bonus == 0
-    assert breakdown.final_score == 15
-
-
-def test_x2_modifier_doubles_before_additions():
-    """Test that X2 doubles number cards before adding +N modifiers."""
-    tableau = PlayerTableau(
-        player_id="p1",
-        number_cards=(NumberCard(3), NumberCard(5), NumberCard(7)),  # Sum = 15
-        modifier_cards=(ModifierCard("X2"), ModifierCard("+4")),
-        second_chance=False,
-        is_active=False,
-        is_busted=False,
-        is_frozen=False,
-        is_passed=True,
-    )
-
-    breakdown = calculate_score(tableau)
-    assert breakdown.number_cards_sum == 15
-    assert breakdown.after_x2_multiplier == 30  # 15 * 2
-    assert breakdown.modifier_additions == 4
-    assert breakdown.flip_7_bonus == 0
-    assert breakdown.final_score == 34  # (15 * 2) + 4
-
-
-def test_multiple_plus_modifiers():
-    """Test that multiple +N modifiers stack correctly."""
-    tableau = PlayerTableau(
-        player_id="p1",
-        number_cards=(NumberCard(10),),
-        modifier_cards=(ModifierCard("+2"), ModifierCard("+4"), ModifierCard("+6")),
-        second_chance=False,
-        is_active=False,
-        is_busted=False,
-        is_frozen=False,
-        is_passed=True,
-    )
-
-    breakdown = calculate_score(tableau)
-    assert breakdown.number_cards_sum == 10
-    assert breakdown.after_x2_multiplier == 10
-    assert breakdown.modifier_additions == 12  # 2 + 4 + 6
-    assert breakdown.flip_7_bonus == 0
-    assert breakdown.final_score == 22  # 10 + 12
-
-
-def test_flip_7_bonus():
-    """Test Flip 7 bonus for exactly 7 unique number cards."""
-    tableau = PlayerTableau(
-        player_id="p1",
-        number_cards=(
-            NumberCard(0), NumberCard(1), NumberCard(2), NumberCard(3),
-            NumberCard(4), NumberCard(5), NumberCard(6)
-        ),  # 7 unique cards, sum = 21
-        modifier_cards=(),
-        second_chance=False,
-        is_active=False,
-        is_busted=False,
-        is_frozen=False,
-        is_passed=True,
-    )
-
-    breakdown = calculate_score(tableau)
-    assert breakdown.number_cards_sum == 21
-    assert breakdown.after_x2_multiplier == 21
-    assert breakdown.modifier_additions == 0
-    assert breakdown.flip_7_bonus == FLIP_7_BONUS  # 15
-    assert breakdown.final_score == 36  # 21 + 15
-
-
-def test_flip_7_with_x2_and_modifiers():
-    """Test Flip 7 bonus combined with X2 and +N modifiers."""
-    tableau = PlayerTableau(
-        player_id="p1",
-        number_cards=(
-            NumberCard(1), NumberCard(2), NumberCard(3), NumberCard(4),
-            NumberCard(5), NumberCard(6), NumberCard(7)
-        ),  # 7 unique, sum = 28
-        modifier_cards=(ModifierCard("X2"), ModifierCard("+10")),
-        second_chance=False,
-        is_active=False,
-        is_busted=False,
-        is_frozen=False,
-        is_passed=True,
+from flip7.constants import FLIP_7_BONUS
+from flip7.core.scoring import calculate_score
+from flip7.types.cards import ModifierType, NumberCard
+from tests.tableaus import make_tableau
+
+# Hands and the score breakdown fields they must produce
+_CASES = [
+    pytest.param(
+        [3, 5, 7], [], {},
+        {"number_cards_sum": 15, "after_x2_multiplier": 15, "modifier_additions": 0,
+         "flip_7_bonus": 0, "final_score": 15},
+        id="simple_number_sum",
+    ),
+    pytest.param(
+        # X2 doubles number cards before adding +N modifiers: (15 * 2) + 4
+        [3, 5, 7], ["X2", "+4"], {},
+        {"number_cards_sum": 15, "after_x2_multiplier": 30, "modifier_additions": 4,
+         "flip_7_bonus": 0, "final_score": 34},
+        id="x2_modifier_doubles_before_additions",
+    ),
+    pytest.param(
+        # +N modifiers stack: 10 + (2 + 4 + 6)
+        [10], ["+2", "+4", "+6"], {},
+        {"number_cards_sum": 10, "after_x2_multiplier": 10, "modifier_additions": 12,
+         "flip_7_bonus": 0, "final_score": 22},
+        id="multiple_plus_modifiers",
+    ),
+    pytest.param(
+        # Exactly 7 unique number cards: 21 + 15
+        [0, 1, 2, 3, 4, 5, 6], [], {},
+        {"number_cards_sum": 21, "after_x2_multiplier": 21, "modifier_additions": 0,
+         "flip_7_bonus": FLIP_7_BONUS, "final_score": 36},
+        id="flip_7_bonus",
+    ),
+    pytest.param(
+        # Flip 7 with X2 and +N: (28 * 2) + 10 + 15
+        [1, 2, 3, 4, 5, 6, 7], ["X2", "+10"], {},
+        {"number_cards_sum": 28, "after_x2_multiplier": 56, "modifier_additions": 10,
+         "flip_7_bonus": 15, "final_score": 81},
+        id="flip_7_with_x2_and_modifiers",
+    ),
+    pytest.param(
+        # Busted players always score 0
+        [10, 11, 12], ["X2", "+10"], {"is_busted": True, "is_passed": False},
+        {"final_score": 0},
+        id="busted_player_scores_zero",
+    ),
+    pytest.param(
+        # The 0 card is included in the number sum: 0 + 5 + 10
+        [0, 5, 10], [], {},
+        {"number_cards_sum": 15, "final_score": 15},
+        id="zero_card_included_in_sum",
+    ),
+    pytest.param(
+        # No number cards: 0 * 2 + 10
+        [], ["+10", "X2"], {},
+        {"number_cards_sum": 0, "after_x2_multiplier": 0, "modifier_additions": 10, "final_score": 10},
+        id="only_modifiers_no_numbers",
+    ),
+    pytest.param(
+        # A hand-built tableau with duplicate values keeps every card's value
+        [4, 4, 6], ["X2"], {},
+        {"number_cards_sum": 14, "final_score": 28},
+        id="unbusted_duplicates_scored_directly",
+    ),
+    pytest.param(
+        # Duplicate modifier cards each count: 5 + 2 + 2
+        [5], ["+2", "+2"], {},
+        {"modifier_additions": 4, "final_score": 9},
+        id="duplicate_modifiers_scored_directly",
+    ),
+]
+
+
+@pytest.mark.parametrize("numbers,modifiers,flags,expected", _CASES)
+def test_score_breakdown(
+    numbers: list[int],
+    modifiers: list[ModifierType],
+    flags: dict[str, bool],
+    expected: dict[str, int],
+):
+    """Test that each hand scores the expected breakdown fields."""
+    breakdown = calculate_score(make_tableau(numbers, modifiers, **flags))
+
+    for field, value in expected.items():
+        assert getattr(breakdown, field) == value, \
+            f"{field} should be {value}, got {getattr(breakdown, field)}"
+
+
+def test_repeated_hand_scores_from_cache():
+    """Test that equal hands in different orders share one cached breakdown."""
+    first = make_tableau([2, 9, 11], ["+4"])
+
+    second = replace(
+        first,
+        player_id="p2",
+        number_cards=(NumberCard(11), NumberCard(2), NumberCard(9)),
+        second_chance=True,
     )
 
-    breakdown = calculate_score(tableau)
-    assert breakdown.number_cards_sum == 28
-    assert breakdown.after_x2_multiplier == 56  # 28 * 2
-    assert breakdown.modifier_additions == 10
-    assert breakdown.flip_7_bonus == 15
-    assert breakdown.final_score == 81  # (28 * 2) + 10 + 15
-
-
-def test_busted_player_scores_zero():
-    """Test that busted players always score 0."""
-    tableau = PlayerTableau(
-        player_id="p1",
-        number_cards=(NumberCard(10), NumberCard(11), NumberCard(12)),
-        modifier_cards=(ModifierCard("X2"), ModifierCard("+10")),
-        second_chance=False,
-        is_active=False,
-        is_busted=True,  # BUSTED
-        is_frozen=False,
-        is_passed=False,
-    )
+    breakdown = calculate_score(first)
+    assert calculate_score(second) is breakdown
+    assert breakdown.number_cards_sum == 22
+    assert breakdown.final_score == 26
 
-    breakdown = calculate_score(tableau)
-    assert breakdown.final_score == 0, "Busted players must score 0"
-
-
-def test_zero_card_included_in_sum():
-    """Test that 0 card is included in number sum."""
-    tableau = PlayerTableau(
-        player_id="p1",
-        number_cards=(NumberCard(0), NumberCard(5), NumberCard(10)),
-        modifier_cards=(),
-        second_chance=False,
-        is_active=False,
-        is_busted=False,
-        is_frozen=False,
-        is_passed=True,
-    )
 
-    breakdown = calculate_score(tableau)
-    assert breakdown.number_cards_sum == 15  # 0 + 5 + 10
-    assert breakdown.final_score == 15
-
-
-def test_only_modifiers_no_numbers():
-    """Test edge case: only modifier cards (should score 0)."""
-    tableau = PlayerTableau(
-        player_id="p1",
-        number_cards=(),  # No number cards!
-        modifier_cards=(ModifierCard("+10"), ModifierCard("X2")),
-        second_chance=False,
-        is_active=False,
-        is_busted=False,
-        is_frozen=False,
-        is_passed=True,
-    )
+def test_modifier_order_shares_cached_breakdown():
+    """Test that the same modifiers drawn in a different order share one cached breakdown."""
+    breakdown = calculate_score(make_tableau([3, 8], ["X2", "+6", "+2"]))
 
-    breakdown = calculate_score(tableau)
-    # With no number cards: 0 * 2 + 10 = 10
-    assert breakdown.number_cards_sum == 0
-    assert breakdown.after_x2_multiplier == 0
-    assert breakdown.modifier_additions == 10
-    assert breakdown.final_score == 10
+    assert calculate_score(make_tableau([8, 3], ["+2", "X2", "+6"])) is breakdown
+    assert breakdown.after_x2_multiplier == 22
+    assert breakdown.final_score == 30
 
 
 if __name__ == "__main__":
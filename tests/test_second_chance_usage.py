@@ -10,326 +10,217 @@ Per official rules (lines 146-156):
 - Can only be used when would bust from duplicate
 """
 
-from dataclasses import replace
-from pathlib import Path
-
 import pytest
 
 from flip7.bots import RandomBot
 from flip7.core.round_engine import RoundEngine
-from flip7.events.event_logger import EventLogger
+from flip7.core.scoring import calculate_score
+from flip7.events.event_logger import NullEventLogger
 from flip7.types.cards import NumberCard
-
-
-def test_second_chance_prevents_bust():
+from flip7.types.game_state import PlayerTableau
+from tests.stub_bots import DeterministicBot
+
+# Number cards 1-12, copied into each engine's deck
+_NUMBERS_1_12 = tuple(NumberCard(i) for i in range(1, 13))
+
+# Stateless bots that always or never spend a Second Chance, shared by tests
+_ALWAYS_USE = DeterministicBot("p1", use_second_chance=True)
+_NEVER_USE = DeterministicBot("p1", use_second_chance=False)
+
+
+def _active_tableau(number_cards: tuple[NumberCard, ...], second_chance: bool) -> PlayerTableau:
+    """Build p1's tableau mid-turn, holding the given cards and no modifiers."""
+    return PlayerTableau(
+        player_id="p1",
+        number_cards=number_cards,
+        modifier_cards=(),
+        second_chance=second_chance,
+        is_active=True,
+        is_busted=False,
+        is_frozen=False,
+        is_passed=False,
+    )
+
+
+@pytest.fixture
+def engine(event_logger: NullEventLogger) -> RoundEngine:
+    """Provide a fresh one-player round engine for p1 over the 1-12 deck.
+
+    Each engine gets its own deck copy, discard pile and bots dict, so tests
+    can swap p1's bot and mutate its tableau freely.
+    """
+    return RoundEngine(
+        player_ids=["p1"],
+        bots={"p1": RandomBot("p1")},
+        event_logger=event_logger,
+        deck=list(_NUMBERS_1_12),
+        discard_pile=[],
+        round_number=1,
+        game_id="test",
+        seed=42,
+    )
+
+
+def test_second_chance_prevents_bust(engine: RoundEngine):
     """Test that using Second Chance prevents a bust."""
-    player_ids = ["p1"]
-    bots = {"p1": RandomBot("p1")}
-
-    deck = [NumberCard(i) for i in range(1, 13)]
-    discard: list = []
-
-    with EventLogger(Path("/tmp/test_sc_prevents_bust.jsonl")) as logger:
-        engine = RoundEngine(
-            player_ids=player_ids,
-            bots=bots,
-            event_logger=logger,
-            deck=deck,
-            discard_pile=discard,
-            round_number=1,
-            game_id="test",
-            seed=42,
-        )
-
-        # Give p1 Second Chance and a card
-        engine.tableaus["p1"] = replace(
-            engine.tableaus["p1"],
-            number_cards=(NumberCard(5),),
-            second_chance=True,
-        )
-
-        # Handle a duplicate card (should trigger Second Chance decision)
-        duplicate = NumberCard(5)
-        engine._handle_number_card("p1", duplicate)
-
-        p1_tableau = engine.tableaus["p1"]
-
-        # P1 should either:
-        # 1. Be busted (bot chose not to use Second Chance), OR
-        # 2. Have used Second Chance (inactive, not busted, no Second Chance)
-
-        if p1_tableau.is_busted:
-            # Bot chose not to use Second Chance
-            assert not p1_tableau.is_active
-        else:
-            # Bot used Second Chance
-            assert not p1_tableau.second_chance, \
-                "Second Chance should be consumed when used"
-            assert not p1_tableau.is_active, \
-                "Turn should end immediately when Second Chance is used"
-            assert p1_tableau.is_passed, \
-                "Using Second Chance counts as passing"
-
-
-def test_second_chance_removes_duplicate():
-    """Test that Second Chance removes the duplicate card."""
-    player_ids = ["p1"]
-    bots = {"p1": RandomBot("p1")}
+    # Give p1 Second Chance and a card
+    engine.tableaus["p1"] = _active_tableau((NumberCard(5),), second_chance=True)
+
+    # Handle a duplicate card (should trigger Second Chance decision)
+    duplicate = NumberCard(5)
+    engine._handle_number_card("p1", duplicate)
 
-    deck = [NumberCard(i) for i in range(1, 13)]
-    discard: list = []
+    p1_tableau = engine.tableaus["p1"]
 
-    with EventLogger(Path("/tmp/test_sc_removes_dup.jsonl")) as logger:
-        engine = RoundEngine(
-            player_ids=player_ids,
-            bots=bots,
-            event_logger=logger,
-            deck=deck,
-            discard_pile=discard,
-            round_number=1,
-            game_id="test",
-            seed=42,
-        )
+    # P1 should either:
+    # 1. Be busted (bot chose not to use Second Chance), OR
+    # 2. Have used Second Chance (inactive, not busted, no Second Chance)
 
-        # Give p1 Second Chance and cards
-        engine.tableaus["p1"] = replace(
-            engine.tableaus["p1"],
-            number_cards=(NumberCard(3), NumberCard(5)),
-            second_chance=True,
-        )
+    if p1_tableau.is_busted:
+        # Bot chose not to use Second Chance
+        assert not p1_tableau.is_active
+    else:
+        # Bot used Second Chance
+        assert not p1_tableau.second_chance, \
+            "Second Chance should be consumed when used"
+        assert not p1_tableau.is_active, \
+            "Turn should end immediately when Second Chance is used"
+        assert p1_tableau.is_passed, \
+            "Using Second Chance counts as passing"
 
-        # Handle a duplicate (5)
-        duplicate = NumberCard(5)
 
-        # Create a custom bot that always uses Second Chance
-        class AlwaysUseBot:
-            name = "always_use"
+def test_second_chance_removes_duplicate(engine: RoundEngine):
+    """Test that Second Chance removes the duplicate card."""
+    # Give p1 Second Chance and cards
+    engine.tableaus["p1"] = _active_tableau((NumberCard(3), NumberCard(5)), second_chance=True)
 
-            def decide_use_second_chance(self, context, dup):
-                return True
+    # Handle a duplicate (5)
+    duplicate = NumberCard(5)
 
-        engine.bots["p1"] = AlwaysUseBot()
+    engine.bots["p1"] = _ALWAYS_USE
 
-        engine._handle_bust("p1", duplicate)
+    engine._handle_bust("p1", duplicate)
 
-        p1_tableau = engine.tableaus["p1"]
+    p1_tableau = engine.tableaus["p1"]
 
-        # Should have used Second Chance
-        assert not p1_tableau.is_busted, "Should not be busted after using Second Chance"
-        assert not p1_tableau.second_chance, "Second Chance should be consumed"
+    # Should have used Second Chance
+    assert not p1_tableau.is_busted, "Should not be busted after using Second Chance"
+    assert not p1_tableau.second_chance, "Second Chance should be consumed"
 
-        # Should still have original 2 cards (duplicate was removed)
-        assert len(p1_tableau.number_cards) == 2, \
-            "Should have original 2 cards (duplicate removed)"
+    # Should still have original 2 cards (duplicate was removed)
+    assert len(p1_tableau.number_cards) == 2, \
+        "Should have original 2 cards (duplicate removed)"
+    assert engine.discard_pile == [duplicate], \
+        "Removed duplicate should go to the discard pile"
 
 
-def test_second_chance_ends_turn_immediately():
+def test_second_chance_ends_turn_immediately(engine: RoundEngine):
     """Test that turn ends immediately when Second Chance is used."""
-    player_ids = ["p1"]
-    bots = {"p1": RandomBot("p1")}
-
-    deck = [NumberCard(i) for i in range(1, 13)]
-    discard: list = []
-
-    with EventLogger(Path("/tmp/test_sc_ends_turn.jsonl")) as logger:
-        engine = RoundEngine(
-            player_ids=player_ids,
-            bots=bots,
-            event_logger=logger,
-            deck=deck,
-            discard_pile=discard,
-            round_number=1,
-            game_id="test",
-            seed=42,
-        )
-
-        # Give p1 Second Chance
-        engine.tableaus["p1"] = replace(
-            engine.tableaus["p1"],
-            number_cards=(NumberCard(3),),
-            second_chance=True,
-        )
-
-        # Create a bot that always uses Second Chance
-        class AlwaysUseBot:
-            name = "always_use"
-
-            def decide_use_second_chance(self, context, dup):
-                return True
-
-        engine.bots["p1"] = AlwaysUseBot()
-
-        # Trigger bust
-        engine._handle_bust("p1", NumberCard(3))
-
-        p1_tableau = engine.tableaus["p1"]
-
-        # Turn should end (is_active = False)
-        assert not p1_tableau.is_active, \
-            "Turn should end immediately when Second Chance is used"
+    # Give p1 Second Chance
+    engine.tableaus["p1"] = _active_tableau((NumberCard(3),), second_chance=True)
 
-        # Should be marked as passed (not busted)
-        assert p1_tableau.is_passed, \
-            "Using Second Chance counts as passing"
-        assert not p1_tableau.is_busted, \
-            "Should not be busted when Second Chance is used"
+    engine.bots["p1"] = _ALWAYS_USE
+
+    # Trigger bust
+    engine._handle_bust("p1", NumberCard(3))
+
+    p1_tableau = engine.tableaus["p1"]
+
+    # Turn should end (is_active = False)
+    assert not p1_tableau.is_active, \
+        "Turn should end immediately when Second Chance is used"
 
+    # Should be marked as passed (not busted)
+    assert p1_tableau.is_passed, \
+        "Using Second Chance counts as passing"
+    assert not p1_tableau.is_busted, \
+        "Should not be busted when Second Chance is used"
 
-def test_second_chance_scores_remaining_cards():
+
+def test_second_chance_scores_remaining_cards(engine: RoundEngine):
     """Test that player scores remaining cards when using Second Chance."""
-    player_ids = ["p1"]
-    bots = {"p1": RandomBot("p1")}
-
-    deck = [NumberCard(i) for i in range(1, 13)]
-    discard: list = []
-
-    with EventLogger(Path("/tmp/test_sc_scores.jsonl")) as logger:
-        engine = RoundEngine(
-            player_ids=player_ids,
-            bots=bots,
-            event_logger=logger,
-            deck=deck,
-            discard_pile=discard,
-            round_number=1,
-            game_id="test",
-            seed=42,
-        )
-
-        # Give p1 cards and Second Chance
-        engine.tableaus["p1"] = replace(
-            engine.tableaus["p1"],
-            number_cards=(NumberCard(5), NumberCard(7)),
-            second_chance=True,
-        )
-
-        # Create a bot that always uses Second Chance
-        class AlwaysUseBot:
-            name = "always_use"
-
-            def decide_use_second_chance(self, context, dup):
-                return True
-
-        engine.bots["p1"] = AlwaysUseBot()
-
-        # Trigger bust with duplicate 5
-        engine._handle_bust("p1", NumberCard(5))
-
-        p1_tableau = engine.tableaus["p1"]
-
-        # Calculate score
-        from flip7.core.scoring import calculate_score
-        breakdown = calculate_score(p1_tableau)
-
-        # Should score remaining card (7 only, duplicate 5 removed)
-        # Original cards: 5, 7 (sum = 12)
-        # Duplicate: 5 (removed)
-        # But wait, the duplicate is the LAST card added, so we remove it
-        # We had (5, 7), then tried to add another 5
-        # After Second Chance, we should have (5, 7) with the new 5 removed
-        # Actually looking at the code, it removes the last card: number_cards[:-1]
-        # So if we had (5, 7), we'd end with (5,) = score 5
-
-        # Let me check the actual implementation more carefully
-        # The duplicate is added to tableau first, then we check bust
-        # So tableau would be (5, 7, 5) when bust detected
-        # Then Second Chance removes the last card: (5, 7)
-        # Score should be 5 + 7 = 12
-
-        # Actually, re-reading the code:
-        # _handle_number_card adds card to tableau: (5, 7, 5)
-        # _check_bust sees duplicate
-        # _handle_bust is called
-        # In _handle_bust, we use the OLD tableau (before duplicate was added)
-        # So we remove number_cards[:-1] from the OLD tableau
-        # Let me trace through more carefully...
-
-        # For this test, let's just verify it doesn't bust
-        assert not p1_tableau.is_busted
-
-
-def test_declining_second_chance_causes_bust():
-    """Test that declining Second Chance results in bust."""
-    player_ids = ["p1"]
-    bots = {"p1": RandomBot("p1")}
-
-    deck = [NumberCard(i) for i in range(1, 13)]
-    discard: list = []
-
-    with EventLogger(Path("/tmp/test_sc_decline.jsonl")) as logger:
-        engine = RoundEngine(
-            player_ids=player_ids,
-            bots=bots,
-            event_logger=logger,
-            deck=deck,
-            discard_pile=discard,
-            round_number=1,
-            game_id="test",
-            seed=42,
-        )
-
-        # Give p1 Second Chance and a card
-        engine.tableaus["p1"] = replace(
-            engine.tableaus["p1"],
-            number_cards=(NumberCard(5),),
-            second_chance=True,
-        )
-
-        # Create a bot that never uses Second Chance
-        class NeverUseBot:
-            name = "never_use"
-
-            def decide_use_second_chance(self, context, dup):
-                return False
-
-        engine.bots["p1"] = NeverUseBot()
-
-        # Trigger bust
-        engine._handle_bust("p1", NumberCard(5))
-
-        p1_tableau = engine.tableaus["p1"]
-
-        # Should be busted
-        assert p1_tableau.is_busted, \
-            "Should be busted when declining Second Chance"
-        assert not p1_tableau.is_active, "Busted player should be inactive"
-
-
-def test_no_second_chance_immediate_bust():
+    # Give p1 cards and Second Chance
+    engine.tableaus["p1"] = _active_tableau((NumberCard(5), NumberCard(7)), second_chance=True)
+
+    engine.bots["p1"] = _ALWAYS_USE
+
+    # Trigger bust with duplicate 5
+    engine._handle_bust("p1", NumberCard(5))
+
+    p1_tableau = engine.tableaus["p1"]
+
+    # Calculate score
+    breakdown = calculate_score(p1_tableau)
+
+    # Should score remaining card (7 only, duplicate 5 removed)
+    # Original cards: 5, 7 (sum = 12)
+    # Duplicate: 5 (removed)
+    # But wait, the duplicate is the LAST card added, so we remove it
+    # We had (5, 7), then tried to add another 5
+    # After Second Chance, we should have (5, 7) with the new 5 removed
+    # Actually looking at the code, it removes the last card: number_cards[:-1]
+    # So if we had (5, 7), we'd end with (5,) = score 5
+
+    # Let me check the actual implementation more carefully
+    # The duplicate is added to tableau first, then we check bust
+    # So tableau would be (5, 7, 5) when bust detected
+    # Then Second Chance removes the last card: (5, 7)
+    # Score should be 5 + 7 = 12
+
+    # Actually, re-reading the code:
+    # _handle_number_card adds card to tableau: (5, 7, 5)
+    # _check_bust sees duplicate
+    # _handle_bust is called
+    # In _handle_bust, we use the OLD tableau (before duplicate was added)
+    # So we remove number_cards[:-1] from the OLD tableau
+    # Let me trace through more carefully...
+
+    # For this test, let's just verify it doesn't bust
+    assert not p1_tableau.is_busted
+
+
+@pytest.mark.parametrize(
+    ("bot", "expected_busted"),
+    [(_ALWAYS_USE, False), (_NEVER_USE, True)],
+    ids=["use", "decline"],
+)
+def test_second_chance_decision_outcome(
+    engine: RoundEngine, bot: DeterministicBot, expected_busted: bool
+):
+    """Test that using Second Chance saves the player and declining it causes a bust."""
+    # Give p1 Second Chance and a card
+    engine.tableaus["p1"] = _active_tableau((NumberCard(5),), second_chance=True)
+    engine.bots["p1"] = bot
+
+    # Trigger bust
+    engine._handle_bust("p1", NumberCard(5))
+
+    p1_tableau = engine.tableaus["p1"]
+
+    assert p1_tableau.is_busted == expected_busted
+    assert not p1_tableau.is_active, "Turn should end either way"
+    if expected_busted:
+        assert p1_tableau.number_cards == (NumberCard(5), NumberCard(5)), \
+            "Duplicate should stay in the tableau to be discarded at cleanup"
+    else:
+        assert p1_tableau.number_cards == (NumberCard(5),), \
+            "Duplicate should be removed when Second Chance is used"
+
+
+def test_no_second_chance_immediate_bust(engine: RoundEngine):
     """Test that without Second Chance, duplicate causes immediate bust."""
-    player_ids = ["p1"]
-    bots = {"p1": RandomBot("p1")}
-
-    deck = [NumberCard(i) for i in range(1, 13)]
-    discard: list = []
-
-    with EventLogger(Path("/tmp/test_no_sc_bust.jsonl")) as logger:
-        engine = RoundEngine(
-            player_ids=player_ids,
-            bots=bots,
-            event_logger=logger,
-            deck=deck,
-            discard_pile=discard,
-            round_number=1,
-            game_id="test",
-            seed=42,
-        )
-
-        # Give p1 cards but NO Second Chance
-        engine.tableaus["p1"] = replace(
-            engine.tableaus["p1"],
-            number_cards=(NumberCard(5),),
-            second_chance=False,
-        )
-
-        # Handle duplicate (should bust immediately)
-        engine._handle_number_card("p1", NumberCard(5))
-
-        p1_tableau = engine.tableaus["p1"]
-
-        # Should be busted
-        assert p1_tableau.is_busted, \
-            "Should bust immediately without Second Chance"
-        assert not p1_tableau.is_active
+    # Give p1 cards but NO Second Chance
+    engine.tableaus["p1"] = _active_tableau((NumberCard(5),), second_chance=False)
+
+    # Handle duplicate (should bust immediately)
+    engine._handle_number_card("p1", NumberCard(5))
+
+    p1_tableau = engine.tableaus["p1"]
+
+    # Should be busted
+    assert p1_tableau.is_busted, \
+        "Should bust immediately without Second Chance"
+    assert not p1_tableau.is_active
 
 
 if __name__ == "__main__":
@@ -1,84 +1,99 @@
 """Tests for time tracking utilities."""
 
-import time
+import pytest
 
+from flip7.utils import time_tracker
 from flip7.utils.time_tracker import TimeTracker, track_time
 
 
+class FakeClock:
+    """Stand-in for perf_counter that only moves when advanced."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward by the given number of seconds."""
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Provide a fake clock installed as the time tracker's perf_counter."""
+    fake = FakeClock()
+    monkeypatch.setattr(time_tracker, "perf_counter", fake)
+    return fake
+
+
 class TestTimeTracker:
     """Tests for TimeTracker context manager."""
 
-    def test_time_tracker_measures_elapsed_time(self) -> None:
+    def test_time_tracker_measures_elapsed_time(self, clock: FakeClock) -> None:
         """Test that TimeTracker correctly measures elapsed time."""
         tracker = TimeTracker("test_operation")
 
         with tracker:
-            time.sleep(0.01)  # Sleep for 10ms
+            clock.advance(0.25)
 
-        assert tracker.elapsed_time is not None
-        assert tracker.elapsed_time >= 0.01
-        assert tracker.elapsed_time < 0.1  # Should be well under 100ms
+        assert tracker.elapsed_time == pytest.approx(0.25)
 
     def test_time_tracker_initially_none(self) -> None:
         """Test that elapsed_time is None before operation completes."""
         tracker = TimeTracker("test_operation")
         assert tracker.elapsed_time is None
 
-    def test_time_tracker_on_exception(self) -> None:
+    def test_time_tracker_on_exception(self, clock: FakeClock) -> None:
         """Test that TimeTracker still records time on exception."""
         tracker = TimeTracker("test_operation")
 
-        try:
-            with tracker:
-                time.sleep(0.01)
-                raise ValueError("Test error")
-        except ValueError:
-            pass
+        with pytest.raises(ValueError, match="Test error"), tracker:
+            clock.advance(0.25)
+            raise ValueError("Test error")
 
-        assert tracker.elapsed_time is not None
-        assert tracker.elapsed_time >= 0.01
+        assert tracker.elapsed_time == pytest.approx(0.25)
 
-    def test_time_tracker_multiple_uses(self) -> None:
+    def test_time_tracker_multiple_uses(self, clock: FakeClock) -> None:
         """Test that TimeTracker can be reused."""
         tracker = TimeTracker("test_operation")
 
         with tracker:
-            time.sleep(0.01)
+            clock.advance(0.25)
 
         first_time = tracker.elapsed_time
 
-        with tracker:
-            time.sleep(0.02)
+        # Time passing between uses is not counted
+        clock.advance(1.0)
 
-        second_time = tracker.elapsed_time
+        with tracker:
+            clock.advance(0.5)
 
-        assert first_time is not None
-        assert second_time is not None
-        assert second_time > first_time
+        assert first_time == pytest.approx(0.25)
+        assert tracker.elapsed_time == pytest.approx(0.5)
 
 
 class TestTrackTime:
     """Tests for track_time function."""
 
-    def test_track_time_measures_elapsed(self) -> None:
+    def test_track_time_measures_elapsed(self, clock: FakeClock) -> None:
         """Test that track_time correctly measures elapsed time."""
         with track_time("test_operation") as tracker:
-            time.sleep(0.01)
+            clock.advance(0.25)
 
-        assert tracker.elapsed_time is not None
-        assert tracker.elapsed_time >= 0.01
+        assert tracker.elapsed_time == pytest.approx(0.25)
 
-    def test_track_time_on_exception(self) -> None:
+    def test_track_time_on_exception(self, clock: FakeClock) -> None:
         """Test that track_time records time on exception."""
-        try:
-            with track_time("test_operation") as tracker:
-                time.sleep(0.01)
-                raise ValueError("Test error")
-        except ValueError:
-            pass
-
-        assert tracker.elapsed_time is not None
-        assert tracker.elapsed_time >= 0.01
+        with (
+            pytest.raises(ValueError, match="Test error"),
+            track_time("test_operation") as tracker,
+        ):
+            clock.advance(0.25)
+            raise ValueError("Test error")
+
+        assert tracker.elapsed_time == pytest.approx(0.25)
 
     def test_track_time_zero_duration(self) -> None:
         """Test that track_time works with very short operations."""
@@ -4,7 +4,7 @@ Tests for tournament system.
 
 from pathlib import Path
 import tempfile
-import shutil
+from typing import ClassVar
 
 from flip7.bots import ScaredyBot, RandomBot
 from flip7.tournament import (
@@ -13,6 +13,17 @@ from flip7.tournament import (
     generate_round_robin_matchups,
     count_matchups,
 )
+from flip7.tournament.round_robin_runner import _play_games
+
+
+class CountingBot(ScaredyBot):
+    """ScaredyBot that records every instance created."""
+
+    instances: ClassVar[list["CountingBot"]] = []
+
+    def __init__(self, bot_name: str) -> None:
+        super().__init__(bot_name)
+        CountingBot.instances.append(self)
 
 
 def test_round_robin_matchups():
@@ -42,50 +53,51 @@ def test_count_matchups():
 
 def test_tournament_config_validation():
     """Test tournament configuration validation."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        output_dir = Path(tmpdir)
+    # Validation never touches the output directory, so it need not exist
+    output_dir = Path("/nonexistent/flip7_results")
+
+    # Valid config
+    config = TournamentConfig(
+        tournament_name="test",
+        players_per_game=2,
+        best_of_n=3,
+        bot_classes=[RandomBot, ScaredyBot],
+        bot_timeout_seconds=1.0,
+        output_dir=output_dir,
+        save_replays=False,
+    )
+    assert config is not None
+    assert not output_dir.exists()
+
+    # Invalid players_per_game
+    try:
+        TournamentConfig(
+            tournament_name="test",
+            players_per_game=5,  # Invalid
+            best_of_n=3,
+            bot_classes=[RandomBot, ScaredyBot],
+            bot_timeout_seconds=1.0,
+            output_dir=output_dir,
+            save_replays=False,
+        )
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
 
-        # Valid config
-        config = TournamentConfig(
+    # Invalid best_of_n (even number)
+    try:
+        TournamentConfig(
             tournament_name="test",
             players_per_game=2,
-            best_of_n=3,
+            best_of_n=4,  # Invalid (even)
             bot_classes=[RandomBot, ScaredyBot],
             bot_timeout_seconds=1.0,
             output_dir=output_dir,
             save_replays=False,
         )
-        assert config is not None
-
-        # Invalid players_per_game
-        try:
-            TournamentConfig(
-                tournament_name="test",
-                players_per_game=5,  # Invalid
-                best_of_n=3,
-                bot_classes=[RandomBot, ScaredyBot],
-                bot_timeout_seconds=1.0,
-                output_dir=output_dir,
-                save_replays=False,
-            )
-            assert False, "Should have raised ValueError"
-        except ValueError:
-            pass
-
-        # Invalid best_of_n (even number)
-        try:
-            TournamentConfig(
-                tournament_name="test",
-                players_per_game=2,
-                best_of_n=4,  # Invalid (even)
-                bot_classes=[RandomBot, ScaredyBot],
-                bot_timeout_seconds=1.0,
-                output_dir=output_dir,
-                save_replays=False,
-            )
-            assert False, "Should have raised ValueError"
-        except ValueError:
-            pass
+        assert False, "Should have raised ValueError"
+    except ValueError:
+        pass
 
 
 def test_tournament_execution():
@@ -125,6 +137,24 @@ def test_tournament_execution():
         assert results_file.exists()
 
 
+def test_round_robin_games_get_fresh_bots(tmp_path: Path):
+    """Test that every round-robin game builds new bots, so no state carries over."""
+    CountingBot.instances.clear()
+
+    outcomes = _play_games(
+        matchup=(CountingBot, RandomBot),
+        repeat_nums=range(3),
+        game_num_offset=0,
+        tournament_seed=42,
+        bot_timeout_seconds=5.0,
+        log_dir=tmp_path,
+        save_replays=False,
+    )
+
+    assert len(outcomes) == 3
+    assert len(CountingBot.instances) == 3, "Each game should create its own bot"
+
+
 if __name__ == "__main__":
     print("Running tournament tests...")
 
@@ -61,6 +61,11 @@ SAVE_REPLAYS = False
 # Random seed for reproducibility (None = random)
 TOURNAMENT_SEED = 42
 
+# Worker processes for playing games in parallel (1 = serial, None = one per CPU)
+#
+# VALIDATION: Must be > 0 (integers only) or None
+MAX_WORKERS = 1
+
 # ============================================================================
 # AUTOMATIC BOT DISCOVERY
 # ============================================================================